@@ -0,0 +1,355 @@
+"""Параметризованный набор нагрузок для сравнения хеш-таблиц."""
+
+import argparse
+import itertools
+import json
+import platform
+import random
+import string
+import subprocess
+import time
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from hash_table_chaining import HashTableChaining
+from hash_table_cuckoo import HashTableCuckoo
+from hash_table_open_addressing import HashTableOpenAddressing
+from hash_table_swiss import HashTableSwiss
+
+
+@dataclass
+class WorkloadSpec:
+    """
+    Описание нагрузки.
+
+    Attributes:
+        name: Имя нагрузки
+        num_keys: Число ключей, загружаемых в таблицу до замера
+        num_ops: Число операций за повторение
+        read_ratio: Доля поисков среди операций
+        delete_ratio: Доля удалений (остальное - вставки существующих
+            или удалённых ранее ключей)
+        distribution: Распределение выбора ключей: 'uniform' или 'zipf'
+        zipf_s: Показатель распределения Ципфа
+        key_length: Длина ключа в символах
+        miss_ratio: Доля поисков отсутствующих ключей
+        seed: Зерно генератора нагрузки
+    """
+    name: str
+    num_keys: int = 10000
+    num_ops: int = 20000
+    read_ratio: float = 0.9
+    delete_ratio: float = 0.0
+    distribution: str = 'uniform'
+    zipf_s: float = 1.1
+    key_length: int = 10
+    miss_ratio: float = 0.0
+    seed: int = 0
+
+
+DEFAULT_WORKLOADS = [
+    WorkloadSpec('read_uniform'),
+    WorkloadSpec('read_zipf', distribution='zipf'),
+    WorkloadSpec('read_misses', miss_ratio=0.5),
+    WorkloadSpec('mixed_50_50', read_ratio=0.5),
+    WorkloadSpec('write_delete', read_ratio=0.2, delete_ratio=0.4),
+    WorkloadSpec('long_keys', key_length=100),
+]
+
+DEFAULT_IMPLEMENTATIONS: Dict[str, Callable[[], Any]] = {
+    'Chaining': lambda: HashTableChaining(hash_func='djb2'),
+    'Linear Probing': lambda: HashTableOpenAddressing(
+        hash_func='djb2', probing_method='linear'),
+    'Double Hashing': lambda: HashTableOpenAddressing(
+        hash_func='djb2', probing_method='double'),
+    'Quadratic Probing': lambda: HashTableOpenAddressing(
+        hash_func='djb2', probing_method='quadratic'),
+    'Robin Hood': lambda: HashTableOpenAddressing(
+        hash_func='djb2', probing_method='robin_hood'),
+    'Swiss Table': lambda: HashTableSwiss(),
+    'Cuckoo': lambda: HashTableCuckoo(),
+}
+
+SEARCH = 'search'
+INSERT = 'insert'
+DELETE = 'delete'
+
+
+def generate_keys(spec: WorkloadSpec) -> Tuple[List[str], List[str]]:
+    """
+    Уникальные ключи нагрузки.
+
+    Returns:
+        (ключи, загружаемые в таблицу; ключи, которых в таблице нет)
+    """
+    rng = random.Random(spec.seed)
+    alphabet = string.ascii_letters + string.digits
+    num_misses = int(spec.num_ops * spec.read_ratio * spec.miss_ratio) + 1
+    keys = set()
+    while len(keys) < spec.num_keys + num_misses:
+        keys.add(''.join(rng.choices(alphabet, k=spec.key_length)))
+    keys = sorted(keys)
+    rng.shuffle(keys)
+    return keys[:spec.num_keys], keys[spec.num_keys:]
+
+
+def generate_operations(spec: WorkloadSpec, keys: Sequence[str],
+                        misses: Sequence[str]) -> List[Tuple[str, str]]:
+    """
+    Последовательность операций нагрузки.
+
+    При распределении Ципфа ключ ранга r выбирается с вероятностью,
+    пропорциональной 1 / r^zipf_s; ранги назначены случайным ключам.
+
+    Returns:
+        Список пар (операция, ключ)
+    """
+    if spec.distribution not in ('uniform', 'zipf'):
+        raise ValueError("Неизвестное распределение ключей")
+
+    rng = random.Random(spec.seed + 1)
+    if spec.distribution == 'zipf':
+        cum_weights = list(itertools.accumulate(
+            1 / rank ** spec.zipf_s for rank in range(1, len(keys) + 1)
+        ))
+        picked = rng.choices(keys, cum_weights=cum_weights, k=spec.num_ops)
+    else:
+        picked = rng.choices(keys, k=spec.num_ops)
+
+    operations = []
+    for key in picked:
+        roll = rng.random()
+        if roll < spec.read_ratio:
+            if rng.random() < spec.miss_ratio:
+                key = rng.choice(misses)
+            operations.append((SEARCH, key))
+        elif roll < spec.read_ratio + spec.delete_ratio:
+            operations.append((DELETE, key))
+        else:
+            operations.append((INSERT, key))
+    return operations
+
+
+def _timer_overhead_ns(samples: int = 10000) -> int:
+    """Медианная стоимость пары вызовов perf_counter_ns."""
+    clock = time.perf_counter_ns
+    costs = []
+    for _ in range(samples):
+        start = clock()
+        costs.append(clock() - start)
+    costs.sort()
+    return costs[len(costs) // 2]
+
+
+def percentile(sorted_values: Sequence[int], fraction: float) -> float:
+    """Перцентиль отсортированной выборки (ближайший ранг)."""
+    if not sorted_values:
+        return 0.0
+    rank = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return float(sorted_values[rank])
+
+
+def _summarize(latencies: List[int]) -> Dict[str, float]:
+    """Сводка задержек операций в наносекундах."""
+    latencies.sort()
+    mean = sum(latencies) / len(latencies) if latencies else 0.0
+    return {
+        'count': len(latencies),
+        'mean_ns': mean,
+        'p50_ns': percentile(latencies, 0.50),
+        'p99_ns': percentile(latencies, 0.99),
+        'max_ns': float(latencies[-1]) if latencies else 0.0,
+    }
+
+
+def run_workload(make_table: Callable[[], Any], spec: WorkloadSpec,
+                 warmup: int = 1, repeat: int = 5) -> Dict[str, Any]:
+    """
+    Замер одной реализации на одной нагрузке.
+
+    Каждое повторение строит новую таблицу, загружает в неё ключи
+    и выполняет операции, засекая каждую через perf_counter_ns.
+    Результаты warmup первых повторений отбрасываются, из задержек
+    вычитается стоимость самого замера.
+
+    Args:
+        make_table: Фабрика пустой таблицы
+        spec: Нагрузка
+        warmup: Число разогревочных повторений
+        repeat: Число учитываемых повторений
+
+    Returns:
+        Словарь: ops_per_sec, сводка задержек всех операций и отдельно
+        по видам операций, время загрузки
+    """
+    keys, misses = generate_keys(spec)
+    operations = generate_operations(spec, keys, misses)
+    overhead = _timer_overhead_ns()
+    clock = time.perf_counter_ns
+
+    latencies: Dict[str, List[int]] = {SEARCH: [], INSERT: [], DELETE: []}
+    load_times = []
+
+    for repetition in range(warmup + repeat):
+        table = make_table()
+        start = clock()
+        table.insert_many((key, 0) for key in keys)
+        load_time = clock() - start
+
+        run_latencies: Dict[str, List[int]] = {SEARCH: [], INSERT: [],
+                                               DELETE: []}
+        search, insert, delete = table.search, table.insert, table.delete
+        for operation, key in operations:
+            if operation == SEARCH:
+                start = clock()
+                search(key)
+                elapsed = clock() - start
+            elif operation == INSERT:
+                start = clock()
+                insert(key, 1)
+                elapsed = clock() - start
+            else:
+                start = clock()
+                delete(key)
+                elapsed = clock() - start
+            run_latencies[operation].append(max(elapsed - overhead, 0))
+
+        if repetition >= warmup:
+            load_times.append(load_time)
+            for operation, values in run_latencies.items():
+                latencies[operation].extend(values)
+
+    all_latencies = [value for values in latencies.values()
+                     for value in values]
+    summary = _summarize(all_latencies)
+    return {
+        'ops_per_sec': 1e9 / summary['mean_ns'] if summary['mean_ns'] else 0.0,
+        'latency': summary,
+        'by_operation': {operation: _summarize(values)
+                         for operation, values in latencies.items()
+                         if values},
+        'load_time_ns': sorted(load_times)[len(load_times) // 2],
+        'timer_overhead_ns': overhead,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    """Текущий коммит репозитория, если он доступен."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+            text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(implementations: Optional[Dict[str, Callable[[], Any]]] = None,
+              workloads: Optional[Iterable[WorkloadSpec]] = None,
+              warmup: int = 1, repeat: int = 5,
+              verbose: bool = True) -> Dict[str, Any]:
+    """
+    Замер всех реализаций на всех нагрузках.
+
+    Args:
+        implementations: {имя: фабрика таблицы}
+        workloads: Нагрузки
+        warmup: Число разогревочных повторений
+        repeat: Число учитываемых повторений
+        verbose: Печатать результаты по мере замера
+
+    Returns:
+        Словарь, пригодный для json.dump: метаданные запуска
+        (коммит, версия Python, время) и список результатов
+    """
+    if implementations is None:
+        implementations = DEFAULT_IMPLEMENTATIONS
+    if workloads is None:
+        workloads = DEFAULT_WORKLOADS
+
+    results = []
+    for spec in workloads:
+        for impl_name, make_table in implementations.items():
+            result = run_workload(make_table, spec, warmup, repeat)
+            result['implementation'] = impl_name
+            result['workload'] = asdict(spec)
+            results.append(result)
+            if verbose:
+                latency = result['latency']
+                print(f"Workload: {spec.name}, Impl: {impl_name}")
+                print(f"  {result['ops_per_sec']:.0f} ops/s, "
+                      f"p50: {latency['p50_ns']:.0f} ns, "
+                      f"p99: {latency['p99_ns']:.0f} ns")
+
+    return {
+        'meta': {
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'warmup': warmup,
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def compare_runs(baseline: Dict[str, Any],
+                 current: Dict[str, Any]) -> Dict[Tuple[str, str], float]:
+    """
+    Сравнение двух запусков run_suite.
+
+    Returns:
+        {(нагрузка, реализация): отношение ops/sec текущего запуска
+        к базовому} для пар, присутствующих в обоих запусках
+    """
+    def index(run):
+        return {(result['workload']['name'], result['implementation']):
+                result['ops_per_sec'] for result in run['results']}
+
+    old = index(baseline)
+    new = index(current)
+    return {pair: new[pair] / old[pair]
+            for pair in old.keys() & new.keys() if old[pair]}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Набор нагрузок для хеш-таблиц'
+    )
+    parser.add_argument('--output', help='Файл для результатов в JSON')
+    parser.add_argument('--compare', help='JSON предыдущего запуска')
+    parser.add_argument('--workloads', nargs='+',
+                        choices=[spec.name for spec in DEFAULT_WORKLOADS],
+                        help='Нагрузки (по умолчанию все)')
+    parser.add_argument('--impls', nargs='+',
+                        choices=list(DEFAULT_IMPLEMENTATIONS),
+                        help='Реализации (по умолчанию все)')
+    parser.add_argument('--num-keys', type=int, help='Число ключей')
+    parser.add_argument('--num-ops', type=int, help='Число операций')
+    parser.add_argument('--warmup', type=int, default=1,
+                        help='Разогревочные повторения')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Учитываемые повторения')
+    args = parser.parse_args()
+
+    overrides = {}
+    if args.num_keys:
+        overrides['num_keys'] = args.num_keys
+    if args.num_ops:
+        overrides['num_ops'] = args.num_ops
+    workloads = [replace(spec, **overrides) for spec in DEFAULT_WORKLOADS
+                 if not args.workloads or spec.name in args.workloads]
+    implementations = {name: factory
+                       for name, factory in DEFAULT_IMPLEMENTATIONS.items()
+                       if not args.impls or name in args.impls}
+
+    run = run_suite(implementations, workloads, args.warmup, args.repeat)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(run, file, indent=2, ensure_ascii=False)
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            baseline = json.load(file)
+        for (workload, impl), ratio in sorted(
+                compare_runs(baseline, run).items()):
+            print(f"{workload} / {impl}: {ratio:.2f}x")
@@ -0,0 +1,333 @@
+"""Ограниченный кеш с вытеснением LRU/LFU поверх хеш-таблицы."""
+
+import sys
+from typing import Any, Callable, Dict, Optional
+
+from hash_table_chaining import HashTableChaining
+
+
+_MISSING = object()
+
+
+class CacheNode:
+    """Узел кеша - одновременно запись таблицы и звено списка."""
+
+    __slots__ = ('key', 'value', 'size', 'frequency', 'prev', 'next')
+
+    def __init__(self, key: Any = None, value: Any = None, size: int = 0):
+        self.key = key
+        self.value = value
+        self.size = size
+        self.frequency = 1
+        self.prev: 'CacheNode' = self
+        self.next: 'CacheNode' = self
+
+
+class _NodeList:
+    """
+    Кольцевой двусвязный список узлов с фиктивной головой.
+
+    В политике LFU списки частот сами связаны в кольцо по возрастанию
+    частоты (prev_list/next_list), поэтому наименьшая частота и
+    следующая за ней находятся за O(1).
+    """
+
+    def __init__(self, frequency: int = 0):
+        self.head = CacheNode()
+        self.length = 0
+        self.frequency = frequency
+        self.prev_list: '_NodeList' = self
+        self.next_list: '_NodeList' = self
+
+    def push_front(self, node: CacheNode) -> None:
+        """Вставка узла в начало (самый свежий)."""
+        head = self.head
+        node.prev = head
+        node.next = head.next
+        head.next.prev = node
+        head.next = node
+        self.length += 1
+
+    def remove(self, node: CacheNode) -> None:
+        """Исключение узла из списка."""
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        self.length -= 1
+
+    def back(self) -> CacheNode:
+        """Самый старый узел."""
+        return self.head.prev
+
+
+class HashTableCache:
+    """
+    Ограниченный кеш: хеш-таблица ключ -> узел плюс интрузивный
+    двусвязный список узлов.
+
+    Политики вытеснения:
+        'lru' - вытесняется давно не использованный элемент: один
+            список в порядке обращений;
+        'lfu' - вытесняется элемент с наименьшим числом обращений,
+            среди равных - давно не использованный: по списку на каждую
+            частоту, списки упорядочены по частоте.
+
+    get, put и вытеснение выполняются за O(1) в среднем. Ёмкость
+    задаётся числом элементов и/или приблизительным объёмом в байтах
+    (sys.getsizeof ключа и значения).
+    """
+
+    def __init__(self, capacity: Optional[int] = 128,
+                 max_bytes: Optional[int] = None, policy: str = 'lru',
+                 table_factory: Optional[Callable[[], Any]] = None):
+        """
+        Инициализация кеша.
+
+        Args:
+            capacity: Наибольшее число элементов (None - без ограничения)
+            max_bytes: Наибольший суммарный размер элементов в байтах
+                (None - без ограничения)
+            policy: Политика вытеснения ('lru' или 'lfu')
+            table_factory: Фабрика хеш-таблицы для индекса (по умолчанию
+                HashTableChaining); подходит любая таблица lab05
+        """
+        if policy not in ('lru', 'lfu'):
+            raise ValueError("Неизвестная политика вытеснения")
+        if capacity is None and max_bytes is None:
+            raise ValueError("Нужно ограничение по числу элементов "
+                             "или по объёму")
+
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self._table = (table_factory() if table_factory
+                       else HashTableChaining(hash_func='fnv1a'))
+        self._recency = _NodeList()
+        self._frequencies: Dict[int, _NodeList] = {}
+        # Фиктивная голова кольца списков частот
+        self._buckets = _NodeList()
+
+        self.count = 0
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _entry_size(key: Any, value: Any) -> int:
+        """Приблизительный размер элемента в байтах."""
+        return sys.getsizeof(key) + sys.getsizeof(value)
+
+    def _bucket_after(self, bucket: _NodeList, frequency: int) -> _NodeList:
+        """
+        Список частоты frequency, идущий в кольце сразу за bucket
+        (создаётся при надобности).
+        """
+        following = bucket.next_list
+        if following.frequency == frequency:
+            return following
+
+        created = self._frequencies[frequency] = _NodeList(frequency)
+        created.prev_list = bucket
+        created.next_list = following
+        following.prev_list = created
+        bucket.next_list = created
+        return created
+
+    def _drop_if_empty(self, bucket: _NodeList) -> None:
+        """Исключение опустевшего списка частоты из кольца."""
+        if bucket.length:
+            return
+        bucket.prev_list.next_list = bucket.next_list
+        bucket.next_list.prev_list = bucket.prev_list
+        del self._frequencies[bucket.frequency]
+
+    def _link(self, node: CacheNode) -> None:
+        """Добавление нового узла (частота 1) в структуры политики."""
+        if self.policy == 'lru':
+            self._recency.push_front(node)
+            return
+        self._bucket_after(self._buckets, node.frequency).push_front(node)
+
+    def _unlink(self, node: CacheNode) -> None:
+        """Исключение узла из структур политики."""
+        if self.policy == 'lru':
+            self._recency.remove(node)
+            return
+
+        bucket = self._frequencies[node.frequency]
+        bucket.remove(node)
+        self._drop_if_empty(bucket)
+
+    def _touch(self, node: CacheNode) -> None:
+        """Учёт обращения к узлу."""
+        if self.policy == 'lru':
+            self._recency.remove(node)
+            self._recency.push_front(node)
+            return
+
+        bucket = self._frequencies[node.frequency]
+        target = self._bucket_after(bucket, node.frequency + 1)
+        bucket.remove(node)
+        node.frequency += 1
+        target.push_front(node)
+        self._drop_if_empty(bucket)
+
+    def _victim(self, keep: Optional[CacheNode] = None) -> Optional[CacheNode]:
+        """
+        Узел, вытесняемый следующим (None, если вытеснять некого).
+
+        Args:
+            keep: Узел, который вытеснять нельзя
+        """
+        bucket = (self._recency if self.policy == 'lru'
+                  else self._buckets.next_list)
+        node = bucket.back()
+        if node is keep:
+            node = node.prev
+            if node is bucket.head and self.policy == 'lfu':
+                bucket = bucket.next_list
+                node = bucket.back()
+        return None if node is bucket.head else node
+
+    def _remove(self, node: CacheNode) -> None:
+        """Удаление узла из таблицы и списков."""
+        self._unlink(node)
+        self._table.delete(node.key)
+        self.count -= 1
+        self.total_bytes -= node.size
+
+    def _make_room(self, extra_count: int, extra_bytes: int,
+                   keep: Optional[CacheNode] = None) -> None:
+        """
+        Вытеснение, пока не поместятся ещё extra_count элементов
+        общим размером extra_bytes.
+
+        Args:
+            extra_count: Число добавляемых элементов
+            extra_bytes: Их размер
+            keep: Узел, который вытеснять нельзя
+        """
+        while ((self.capacity is not None
+                and self.count + extra_count > self.capacity)
+               or (self.max_bytes is not None
+                   and self.total_bytes + extra_bytes > self.max_bytes)):
+            victim = self._victim(keep)
+            if victim is None:
+                return
+            self._remove(victim)
+            self.evictions += 1
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Значение по ключу с учётом обращения.
+
+        Args:
+            key: Ключ
+            default: Значение при промахе
+
+        Returns:
+            Закешированное значение или default
+
+        Time Complexity: O(1) в среднем
+        """
+        node = self._table.search(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(node)
+        return node.value
+
+    def put(self, key: Any, value: Any) -> None:
+        """
+        Запись значения с вытеснением при превышении ёмкости.
+
+        Перезапись считается обращением к элементу. Элемент, который
+        один больше max_bytes, не кешируется.
+
+        Args:
+            key: Ключ
+            value: Значение
+
+        Time Complexity: O(1) в среднем
+        """
+        size = self._entry_size(key, value)
+        too_large = ((self.max_bytes is not None and size > self.max_bytes)
+                     or self.capacity == 0)
+        node = self._table.search(key)
+
+        if node is not None:
+            if too_large:
+                self._remove(node)
+                return
+            self.total_bytes += size - node.size
+            node.value = value
+            node.size = size
+            self._touch(node)
+            self._make_room(0, 0, keep=node)
+            return
+
+        if too_large:
+            return
+        self._make_room(1, size)
+
+        node = CacheNode(key, value, size)
+        self._table.insert(key, node)
+        self._link(node)
+        self.count += 1
+        self.total_bytes += size
+
+    def get_or_compute(self, key: Any, compute: Callable[[Any], Any]) -> Any:
+        """
+        Мемоизация: значение из кеша или compute(key) с записью в кеш.
+
+        Args:
+            key: Ключ
+            compute: Функция вычисления значения по ключу
+
+        Returns:
+            Значение
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute(key)
+            self.put(key, value)
+        return value
+
+    def delete(self, key: Any) -> bool:
+        """
+        Удаление элемента из кеша.
+
+        Returns:
+            True если элемент был в кеше
+        """
+        node = self._table.search(key)
+        if node is None:
+            return False
+        self._remove(node)
+        return True
+
+    def __contains__(self, key: Any) -> bool:
+        """Проверка наличия без учёта обращения."""
+        return self._table.search(key) is not None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Счётчики кеша.
+
+        Returns:
+            Словарь: попадания, промахи, доля попаданий, вытеснения,
+            число элементов и их суммарный объём
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'count': self.count,
+            'bytes': self.total_bytes,
+        }
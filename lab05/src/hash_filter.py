@@ -0,0 +1,336 @@
+"""Фильтр приблизительной принадлежности перед хеш-таблицами."""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+class CountingBloomFilter:
+    """
+    Считающий фильтр Блума над 64-битными хешами.
+
+    Вместо битов - 8-битные счётчики, поэтому элементы можно удалять.
+    Позиции элемента получаются двойным хешированием из одного полного
+    хеша: h1 + i * h2, где h1 и h2 - младшая и старшая половины, так что
+    ключ хешируется один раз. Переполненный счётчик (255) больше
+    не уменьшается: элемент не пропадёт из фильтра, хотя ложных
+    срабатываний может стать больше.
+    """
+
+    MAX_COUNTER = 255
+
+    def __init__(self, capacity: int = 1024, false_positive_rate: float = 0.01):
+        """
+        Размер фильтра подбирается под ожидаемое число элементов.
+
+        Args:
+            capacity: Ожидаемое число элементов
+            false_positive_rate: Допустимая доля ложных срабатываний
+                при capacity элементах
+        """
+        if capacity <= 0:
+            raise ValueError("Ёмкость фильтра должна быть положительной")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("Доля ложных срабатываний - в интервале (0, 1)")
+
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        # m = -n ln p / (ln 2)^2 счётчиков и k = m / n * ln 2 позиций
+        self.num_counters = max(
+            1, math.ceil(-capacity * math.log(false_positive_rate)
+                         / math.log(2) ** 2)
+        )
+        self.num_hashes = max(
+            1, round(self.num_counters / capacity * math.log(2))
+        )
+        # bytearray быстрее массива numpy при обращении по одному
+        # счётчику; для пакетной проверки над ним строится вид numpy
+        self.counters = bytearray(self.num_counters)
+        self._counters_view = np.frombuffer(self.counters, dtype=np.uint8)
+        self.count = 0
+
+    def _positions(self, key_hash: int) -> List[int]:
+        """Позиции счётчиков элемента."""
+        h1 = key_hash & 0xFFFFFFFF
+        h2 = (key_hash >> 32) | 1
+        m = self.num_counters
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    def add(self, key_hash: int) -> None:
+        """
+        Добавление элемента по его хешу.
+
+        Time Complexity: O(k)
+        """
+        counters = self.counters
+        for position in self._positions(key_hash):
+            if counters[position] < self.MAX_COUNTER:
+                counters[position] += 1
+        self.count += 1
+
+    def remove(self, key_hash: int) -> None:
+        """
+        Удаление ранее добавленного элемента по его хешу.
+
+        Time Complexity: O(k)
+        """
+        counters = self.counters
+        for position in self._positions(key_hash):
+            if 0 < counters[position] < self.MAX_COUNTER:
+                counters[position] -= 1
+        self.count -= 1
+
+    def might_contain(self, key_hash: int) -> bool:
+        """
+        Проверка элемента по его хешу.
+
+        Returns:
+            False - элемента точно нет; True - элемент, возможно, есть
+
+        Time Complexity: O(k), для отсутствующего элемента обычно O(1)
+        """
+        # Перебор с ранним выходом: промах обычно виден по первым позициям
+        counters = self.counters
+        m = self.num_counters
+        position = key_hash & 0xFFFFFFFF
+        step = (key_hash >> 32) | 1
+        for _ in range(self.num_hashes):
+            if not counters[position % m]:
+                return False
+            position += step
+        return True
+
+    def might_contain_many(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Пакетная проверка массива хешей (numpy uint64).
+
+        Returns:
+            Булев массив: True там, где элемент, возможно, есть
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        steps = np.arange(self.num_hashes, dtype=np.uint64)
+        # h1 и h2 меньше 2^32, а k мало, поэтому в uint64 нет
+        # переполнения и позиции совпадают с _positions
+        positions = ((h1[:, None] + steps[None, :] * h2[:, None])
+                     % np.uint64(self.num_counters))
+        return self._counters_view[positions.astype(np.intp)].all(axis=1)
+
+    def estimated_false_positive_rate(self) -> float:
+        """Ожидаемая доля ложных срабатываний при текущем числе элементов."""
+        k = self.num_hashes
+        return (1 - math.exp(-k * self.count / self.num_counters)) ** k
+
+    def clear(self) -> None:
+        """Удаление всех элементов."""
+        self._counters_view[:] = 0
+        self.count = 0
+
+
+class FilteredHashTable:
+    """
+    Хеш-таблица с фильтром Блума перед ней.
+
+    Поиск сначала проверяет фильтр: если ключа в нём точно нет, None
+    возвращается без обращения к таблице - без пробирования ячеек
+    или просмотра цепочки. Фильтр использует ту же полную хеш-функцию
+    с тем же зерном, что и таблица, поэтому отдельный хеш для него
+    не вычисляется.
+
+    Подходит любая таблица lab05 с атрибутами hash_func
+    и batch_hash_func и счётчиком count (у кукушкиного хеширования
+    своих функций несколько - берётся первая). Таблицам с пакетными
+    методами по готовым хешам (_insert_many_hashed, _search_many_hashed)
+    пакеты передаются вместе с хешами, вычисленными для фильтра.
+    """
+
+    def __init__(self, table: Any, capacity: int = 1024,
+                 false_positive_rate: float = 0.01):
+        """
+        Инициализация фильтра перед пустой таблицей.
+
+        Args:
+            table: Хеш-таблица
+            capacity: Ожидаемое число элементов; при большем числе
+                ложных срабатываний становится больше, чем задано
+            false_positive_rate: Допустимая доля ложных срабатываний
+        """
+        if table.count:
+            raise ValueError("Фильтр ставится перед пустой таблицей")
+
+        self.table = table
+        if hasattr(table, 'hash_func'):
+            self.hash_func = table.hash_func
+            self.batch_hash_func = table.batch_hash_func
+        else:
+            self.hash_func = table.hash_funcs[0]
+            self.batch_hash_func = table.batch_hash_funcs[0]
+        self.filter = CountingBloomFilter(capacity, false_positive_rate)
+        self._insert_many_hashed = getattr(table, '_insert_many_hashed',
+                                           None)
+        self._search_many_hashed = getattr(table, '_search_many_hashed',
+                                           None)
+
+        self.lookups = 0
+        self.filtered = 0
+        self.false_positives = 0
+
+    def insert(self, key: Any, value: Any) -> None:
+        """
+        Вставка элемента в таблицу и фильтр.
+
+        Time Complexity: O(1) в среднем
+        """
+        count = self.table.count
+        self.table.insert(key, value)
+        if self.table.count > count:
+            self.filter.add(self.hash_func(key))
+
+    def insert_many(self, pairs: Iterable[Tuple[Any, Any]]) -> None:
+        """
+        Пакетная вставка: пары передаются в insert_many таблицы
+        (вместе с хешами, если таблица их принимает), в фильтр
+        добавляются хеши новых ключей. Каждый ключ хешируется один раз.
+
+        Новым считается ключ, которого таблица не нашла до вставки;
+        проверяются только ключи, прошедшие фильтр. Ключ с сохранённым
+        значением None будет добавлен в фильтр повторно - это лишь
+        повышает долю ложных срабатываний.
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return
+
+        keys = [key for key, _ in pairs]
+        hashes = self.batch_hash_func(keys)
+        hash_list = hashes.tolist()
+        passed = np.flatnonzero(
+            self.filter.might_contain_many(hashes)
+        ).tolist()
+        added = set()
+        if passed:
+            candidates = [keys[i] for i in passed]
+            values = self._table_search_many(
+                candidates, [hash_list[i] for i in passed]
+            )
+            added = {key for key, value in zip(candidates, values)
+                     if value is not None}
+
+        if self._insert_many_hashed is not None:
+            self._insert_many_hashed(pairs, hash_list)
+        else:
+            self.table.insert_many(pairs)
+        for key, key_hash in zip(keys, hash_list):
+            if key not in added:
+                added.add(key)
+                self.filter.add(key_hash)
+
+    def _table_search_many(self, keys: List[Any],
+                           hashes: List[int]) -> List[Optional[Any]]:
+        """Пакетный поиск в таблице по готовым хешам, если она умеет."""
+        if self._search_many_hashed is not None:
+            return self._search_many_hashed(keys, hashes)
+        return self.table.search_many(keys)
+
+    def search(self, key: Any) -> Optional[Any]:
+        """
+        Поиск элемента: точный промах фильтра не доходит до таблицы.
+
+        Returns:
+            Найденное значение или None
+
+        Time Complexity: O(k) для отсеянного ключа, иначе O(1) в среднем
+        """
+        self.lookups += 1
+        if not self.filter.might_contain(self.hash_func(key)):
+            self.filtered += 1
+            return None
+        value = self.table.search(key)
+        if value is None:
+            self.false_positives += 1
+        return value
+
+    def search_many(self, keys: Iterable[Any]) -> List[Optional[Any]]:
+        """
+        Пакетный поиск: в таблицу передаются только ключи,
+        прошедшие фильтр.
+
+        Returns:
+            Список найденных значений (None для отсутствующих ключей)
+        """
+        keys = list(keys)
+        results: List[Optional[Any]] = [None] * len(keys)
+        if not keys:
+            return results
+
+        hashes = self.batch_hash_func(keys)
+        passed = np.flatnonzero(
+            self.filter.might_contain_many(hashes)
+        ).tolist()
+        self.lookups += len(keys)
+        self.filtered += len(keys) - len(passed)
+        if passed:
+            hash_list = hashes.tolist()
+            values = self._table_search_many(
+                [keys[i] for i in passed], [hash_list[i] for i in passed]
+            )
+            for index, value in zip(passed, values):
+                results[index] = value
+                if value is None:
+                    self.false_positives += 1
+        return results
+
+    def delete(self, key: Any) -> bool:
+        """
+        Удаление элемента из таблицы и фильтра.
+
+        Returns:
+            True если элемент удален, False если не найден
+        """
+        key_hash = self.hash_func(key)
+        if not self.filter.might_contain(key_hash):
+            return False
+        if not self.table.delete(key):
+            return False
+        self.filter.remove(key_hash)
+        return True
+
+    def __contains__(self, key: Any) -> bool:
+        return self.search(key) is not None
+
+    def __len__(self) -> int:
+        return self.table.count
+
+    @property
+    def count(self) -> int:
+        """Число элементов в таблице."""
+        return self.table.count
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Счётчики фильтра.
+
+        Ложным срабатыванием считается поиск, прошедший фильтр,
+        но не нашедший значения в таблице.
+
+        Returns:
+            Словарь: число поисков, отсеянных фильтром и ложных
+            срабатываний, их доли, ожидаемая доля ложных срабатываний,
+            размер фильтра в байтах и число позиций на ключ
+        """
+        lookups = self.lookups
+        negatives = self.filtered + self.false_positives
+        return {
+            'lookups': lookups,
+            'filtered': self.filtered,
+            'false_positives': self.false_positives,
+            'filtered_ratio': self.filtered / lookups if lookups else 0.0,
+            'false_positive_ratio': (self.false_positives / negatives
+                                     if negatives else 0.0),
+            'expected_false_positive_rate':
+                self.filter.estimated_false_positive_rate(),
+            'filter_bytes': self.filter.num_counters,
+            'num_hashes': self.filter.num_hashes,
+        }
@@ -1,4 +1,11 @@
-"""Реализация различных хеш-функций для строковых ключей."""
+"""Реализация различных хеш-функций для ключей str, bytes и int."""
+
+import secrets
+import struct
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
 
 
 def simple_hash(key: str, table_size: int) -> int:
@@ -50,4 +57,499 @@ def djb2_hash(key: str, table_size: int) -> int:
     hash_value = 5381
     for char in key:
         hash_value = ((hash_value << 5) + hash_value) + ord(char)
-    return hash_value % table_size
\ No newline at end of file
+    return hash_value % table_size
+
+
+# Полноразрядные (не зависящие от размера таблицы) варианты хеш-функций.
+# Значение вычисляется один раз, хранится в записи таблицы и при
+# изменении размера лишь заново берётся по модулю нового размера.
+# Все полноразрядные функции принимают ключ str, bytes или int
+# и зерно seed, которое таблица выбирает случайно при создании.
+HASH_BITS = 64
+HASH_MASK = (1 << HASH_BITS) - 1
+
+
+def key_to_bytes(key: Any) -> bytes:
+    """
+    Байтовое представление ключа.
+
+    Args:
+        key: Ключ str (UTF-8), bytes или int (знаковый, little-endian)
+
+    Returns:
+        Байты ключа
+    """
+    if isinstance(key, str):
+        return key.encode('utf-8', 'surrogatepass')
+    if isinstance(key, (bytes, bytearray, memoryview)):
+        return bytes(key)
+    if isinstance(key, int):
+        return key.to_bytes((key.bit_length() + 8) // 8, 'little',
+                            signed=True)
+    raise TypeError(f"Неподдерживаемый тип ключа: {type(key).__name__}")
+
+
+def _as_text(key: Any) -> str:
+    """Ключ как строка: байты не-строковых ключей становятся символами."""
+    if isinstance(key, str):
+        return key
+    return key_to_bytes(key).decode('latin-1')
+
+
+def simple_hash_full(key: Any, seed: int = 0) -> int:
+    """
+    Полноразрядный вариант simple_hash.
+
+    Args:
+        key: Ключ
+        seed: Зерно (начальное значение суммы)
+
+    Returns:
+        64-битное хеш-значение
+    """
+    total = seed & HASH_MASK
+    for char in _as_text(key):
+        total += ord(char)
+    return total & HASH_MASK
+
+
+def polynomial_hash_full(key: Any, base: int = 31, seed: int = 0) -> int:
+    """
+    Полноразрядный вариант polynomial_hash (по модулю 2^64).
+
+    Args:
+        key: Ключ
+        base: Основание полинома
+        seed: Зерно (начальное значение)
+
+    Returns:
+        64-битное хеш-значение
+    """
+    hash_value = seed & HASH_MASK
+    for char in _as_text(key):
+        hash_value = (hash_value * base + ord(char)) & HASH_MASK
+    return hash_value
+
+
+def djb2_hash_full(key: Any, seed: int = 0) -> int:
+    """
+    Полноразрядный вариант djb2_hash (по модулю 2^64).
+
+    Args:
+        key: Ключ
+        seed: Зерно (смешивается с начальным значением 5381)
+
+    Returns:
+        64-битное хеш-значение
+    """
+    hash_value = 5381 ^ (seed & HASH_MASK)
+    for char in _as_text(key):
+        hash_value = (((hash_value << 5) + hash_value) + ord(char)) & HASH_MASK
+    return hash_value
+
+
+# FNV-1a (64 бита)
+FNV_OFFSET = 0xcbf29ce484222325
+FNV_PRIME = 0x100000001b3
+
+
+def fnv1a_hash(key: Any, seed: int = 0) -> int:
+    """
+    Хеш-функция FNV-1a: XOR байта, затем умножение на простое число.
+
+    Args:
+        key: Ключ
+        seed: Зерно (смешивается с начальным значением)
+
+    Returns:
+        64-битное хеш-значение
+    """
+    hash_value = FNV_OFFSET ^ (seed & HASH_MASK)
+    for byte in key_to_bytes(key):
+        hash_value = ((hash_value ^ byte) * FNV_PRIME) & HASH_MASK
+    return hash_value
+
+
+# xxHash64
+XXH_PRIME1 = 0x9E3779B185EBCA87
+XXH_PRIME2 = 0xC2B2AE3D27D4EB4F
+XXH_PRIME3 = 0x165667B19E3779F9
+XXH_PRIME4 = 0x85EBCA77C2B2AE63
+XXH_PRIME5 = 0x27D4EB2F165667C5
+
+_STRIPE = struct.Struct('<4Q')
+_U64 = struct.Struct('<Q')
+_U32 = struct.Struct('<I')
+
+
+def _rotl(value: int, bits: int) -> int:
+    """Циклический сдвиг 64-битного значения влево."""
+    return ((value << bits) | (value >> (64 - bits))) & HASH_MASK
+
+
+def _xxh_round(acc: int, lane: int) -> int:
+    """Раунд xxHash64 для одного 64-битного слова."""
+    acc = (acc + lane * XXH_PRIME2) & HASH_MASK
+    return (_rotl(acc, 31) * XXH_PRIME1) & HASH_MASK
+
+
+def _xxh_merge(acc: int, value: int) -> int:
+    """Подмешивание аккумулятора полосы в итоговый хеш xxHash64."""
+    acc ^= _xxh_round(0, value)
+    return (acc * XXH_PRIME1 + XXH_PRIME4) & HASH_MASK
+
+
+def xxhash64(key: Any, seed: int = 0) -> int:
+    """
+    Хеш-функция xxHash64: данные обрабатываются 64-битными словами
+    в четырёх независимых полосах по 32 байта.
+
+    Args:
+        key: Ключ
+        seed: Зерно
+
+    Returns:
+        64-битное хеш-значение
+    """
+    data = key_to_bytes(key)
+    length = len(data)
+    seed &= HASH_MASK
+    offset = 0
+
+    if length >= 32:
+        v1 = (seed + XXH_PRIME1 + XXH_PRIME2) & HASH_MASK
+        v2 = (seed + XXH_PRIME2) & HASH_MASK
+        v3 = seed
+        v4 = (seed - XXH_PRIME1) & HASH_MASK
+        while offset <= length - 32:
+            a, b, c, d = _STRIPE.unpack_from(data, offset)
+            v1 = _xxh_round(v1, a)
+            v2 = _xxh_round(v2, b)
+            v3 = _xxh_round(v3, c)
+            v4 = _xxh_round(v4, d)
+            offset += 32
+        hash_value = (_rotl(v1, 1) + _rotl(v2, 7)
+                      + _rotl(v3, 12) + _rotl(v4, 18)) & HASH_MASK
+        for lane in (v1, v2, v3, v4):
+            hash_value = _xxh_merge(hash_value, lane)
+    else:
+        hash_value = (seed + XXH_PRIME5) & HASH_MASK
+
+    hash_value = (hash_value + length) & HASH_MASK
+
+    while offset + 8 <= length:
+        hash_value ^= _xxh_round(0, _U64.unpack_from(data, offset)[0])
+        hash_value = (_rotl(hash_value, 27) * XXH_PRIME1
+                      + XXH_PRIME4) & HASH_MASK
+        offset += 8
+    if offset + 4 <= length:
+        hash_value ^= (_U32.unpack_from(data, offset)[0]
+                       * XXH_PRIME1) & HASH_MASK
+        hash_value = (_rotl(hash_value, 23) * XXH_PRIME2
+                      + XXH_PRIME3) & HASH_MASK
+        offset += 4
+    while offset < length:
+        hash_value ^= (data[offset] * XXH_PRIME5) & HASH_MASK
+        hash_value = (_rotl(hash_value, 11) * XXH_PRIME1) & HASH_MASK
+        offset += 1
+
+    hash_value ^= hash_value >> 33
+    hash_value = (hash_value * XXH_PRIME2) & HASH_MASK
+    hash_value ^= hash_value >> 29
+    hash_value = (hash_value * XXH_PRIME3) & HASH_MASK
+    hash_value ^= hash_value >> 32
+    return hash_value
+
+
+def _sip_rounds(v0: int, v1: int, v2: int, v3: int,
+                rounds: int) -> Tuple[int, int, int, int]:
+    """Раунды SipRound над состоянием SipHash."""
+    for _ in range(rounds):
+        v0 = (v0 + v1) & HASH_MASK
+        v1 = _rotl(v1, 13) ^ v0
+        v0 = _rotl(v0, 32)
+        v2 = (v2 + v3) & HASH_MASK
+        v3 = _rotl(v3, 16) ^ v2
+        v0 = (v0 + v3) & HASH_MASK
+        v3 = _rotl(v3, 21) ^ v0
+        v2 = (v2 + v1) & HASH_MASK
+        v1 = _rotl(v1, 17) ^ v2
+        v2 = _rotl(v2, 32)
+    return v0, v1, v2, v3
+
+
+def siphash24(key: Any, seed: int = 0) -> int:
+    """
+    Хеш-функция SipHash-2-4 - ключевая функция, устойчивая к подбору
+    коллизий без знания ключа.
+
+    Args:
+        key: Ключ
+        seed: 128-битный секретный ключ SipHash
+            (младшие 64 бита - k0, старшие - k1)
+
+    Returns:
+        64-битное хеш-значение
+    """
+    data = key_to_bytes(key)
+    k0 = seed & HASH_MASK
+    k1 = (seed >> 64) & HASH_MASK
+    v0 = k0 ^ 0x736f6d6570736575
+    v1 = k1 ^ 0x646f72616e646f6d
+    v2 = k0 ^ 0x6c7967656e657261
+    v3 = k1 ^ 0x7465646279746573
+
+    length = len(data)
+    tail = length - length % 8
+    for offset in range(0, tail, 8):
+        word = _U64.unpack_from(data, offset)[0]
+        v3 ^= word
+        v0, v1, v2, v3 = _sip_rounds(v0, v1, v2, v3, 2)
+        v0 ^= word
+
+    word = ((length & 0xff) << 56) | int.from_bytes(data[tail:], 'little')
+    v3 ^= word
+    v0, v1, v2, v3 = _sip_rounds(v0, v1, v2, v3, 2)
+    v0 ^= word
+    v2 ^= 0xff
+    v0, v1, v2, v3 = _sip_rounds(v0, v1, v2, v3, 4)
+    return v0 ^ v1 ^ v2 ^ v3
+
+
+FULL_HASH_FUNCTIONS: Dict[str, Callable[..., int]] = {
+    'simple': simple_hash_full,
+    'polynomial': polynomial_hash_full,
+    'djb2': djb2_hash_full,
+    'fnv1a': fnv1a_hash,
+    'xxhash64': xxhash64,
+    'siphash24': siphash24
+}
+
+# Функции, у которых зерно меняет сами коллизии. У simple, polynomial
+# и djb2 зерно лишь сдвигает начальное значение: ключи, совпавшие
+# при одном зерне, совпадают и при любом другом.
+SEED_SENSITIVE_FUNCTIONS = frozenset({'fnv1a', 'xxhash64', 'siphash24'})
+
+
+# Пакетные варианты полноразрядных хеш-функций.
+# Пакет ключей превращается в NumPy-массив строк фиксированной ширины,
+# буфер которого (UTF-32) рассматривается как матрица кодов символов:
+# элемент [i, j] равен ord(keys[i][j]). Хеш вычисляется по столбцам
+# сразу для всех ключей пакета в арифметике uint64 (по модулю 2^64).
+BATCH_CHUNK_SIZE = 65536
+
+
+def _code_point_matrix(keys: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Матрица кодов символов ключей, дополненная нулями справа.
+
+    Args:
+        keys: Пакет строковых ключей
+
+    Returns:
+        (матрица uint32 размера len(keys) x max_len, длины ключей)
+    """
+    lengths = np.fromiter(map(len, keys), dtype=np.int64, count=len(keys))
+    max_len = max(int(lengths.max()) if len(keys) else 0, 1)
+    strings = np.array(keys, dtype=f'<U{max_len}')
+    matrix = strings.view(np.uint32).reshape(len(keys), max_len)
+    return matrix, lengths
+
+
+def _byte_matrix(keys: List[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Матрица байтов ключей (key_to_bytes), дополненная нулями справа.
+
+    Args:
+        keys: Пакет ключей
+
+    Returns:
+        (матрица uint8 размера len(keys) x max_len, длины ключей)
+    """
+    encoded = [key_to_bytes(key) for key in keys]
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64,
+                          count=len(encoded))
+    max_len = max(int(lengths.max()) if len(keys) else 0, 1)
+    strings = np.array(encoded, dtype=f'S{max_len}')
+    matrix = strings.view(np.uint8).reshape(len(keys), max_len)
+    return matrix, lengths
+
+
+def _batched(keys: Iterable[Any], hash_chunk) -> np.ndarray:
+    """Применение пакетной функции к ключам порциями ограниченного размера."""
+    keys = list(keys)
+    result = np.empty(len(keys), dtype=np.uint64)
+    for start in range(0, len(keys), BATCH_CHUNK_SIZE):
+        chunk = keys[start:start + BATCH_CHUNK_SIZE]
+        result[start:start + len(chunk)] = hash_chunk(chunk)
+    return result
+
+
+def _fold_columns(keys: Iterable[Any], initial: int,
+                  multiplier: int) -> np.ndarray:
+    """
+    Пакетное вычисление h = h * multiplier + ord(char) по всем символам.
+
+    Args:
+        keys: Ключи
+        initial: Начальное значение хеша
+        multiplier: Множитель на каждом шаге
+
+    Returns:
+        Массив uint64 хеш-значений в порядке ключей
+    """
+    multiplier = np.uint64(multiplier)
+
+    def hash_chunk(chunk: List[Any]) -> np.ndarray:
+        matrix, lengths = _code_point_matrix(list(map(_as_text, chunk)))
+        hash_values = np.full(len(chunk), initial, dtype=np.uint64)
+        for col in range(int(lengths.max(initial=0))):
+            stepped = hash_values * multiplier + matrix[:, col]
+            hash_values = np.where(col < lengths, stepped, hash_values)
+        return hash_values
+
+    return _batched(keys, hash_chunk)
+
+
+def simple_hash_batch(keys: Iterable[Any], seed: int = 0) -> np.ndarray:
+    """
+    Пакетный вариант simple_hash_full.
+
+    Args:
+        keys: Ключи
+        seed: Зерно
+
+    Returns:
+        Массив uint64 хеш-значений в порядке ключей
+    """
+    def hash_chunk(chunk: List[Any]) -> np.ndarray:
+        matrix, _ = _code_point_matrix(list(map(_as_text, chunk)))
+        return matrix.sum(axis=1, dtype=np.uint64) + np.uint64(seed & HASH_MASK)
+
+    return _batched(keys, hash_chunk)
+
+
+def polynomial_hash_batch(keys: Iterable[Any], base: int = 31,
+                          seed: int = 0) -> np.ndarray:
+    """
+    Пакетный вариант polynomial_hash_full.
+
+    Args:
+        keys: Ключи
+        base: Основание полинома
+        seed: Зерно
+
+    Returns:
+        Массив uint64 хеш-значений в порядке ключей
+    """
+    return _fold_columns(keys, seed & HASH_MASK, base)
+
+
+def djb2_hash_batch(keys: Iterable[Any], seed: int = 0) -> np.ndarray:
+    """
+    Пакетный вариант djb2_hash_full.
+
+    Args:
+        keys: Ключи
+        seed: Зерно
+
+    Returns:
+        Массив uint64 хеш-значений в порядке ключей
+    """
+    return _fold_columns(keys, 5381 ^ (seed & HASH_MASK), 33)
+
+
+def fnv1a_hash_batch(keys: Iterable[Any], seed: int = 0) -> np.ndarray:
+    """
+    Пакетный вариант fnv1a_hash по столбцам матрицы байтов.
+
+    Args:
+        keys: Ключи
+        seed: Зерно
+
+    Returns:
+        Массив uint64 хеш-значений в порядке ключей
+    """
+    prime = np.uint64(FNV_PRIME)
+
+    def hash_chunk(chunk: List[Any]) -> np.ndarray:
+        matrix, lengths = _byte_matrix(chunk)
+        hash_values = np.full(len(chunk), FNV_OFFSET ^ (seed & HASH_MASK),
+                              dtype=np.uint64)
+        for col in range(int(lengths.max(initial=0))):
+            stepped = (hash_values ^ matrix[:, col]) * prime
+            hash_values = np.where(col < lengths, stepped, hash_values)
+        return hash_values
+
+    return _batched(keys, hash_chunk)
+
+
+def scalar_batch(hash_func: Callable[..., int]) -> Callable[..., np.ndarray]:
+    """
+    Пакетная обёртка над поштучной функцией (для функций, которые
+    не векторизуются по столбцам, например xxHash64 и SipHash).
+
+    Args:
+        hash_func: Полноразрядная хеш-функция
+
+    Returns:
+        Функция (keys, seed=0) -> массив uint64
+    """
+    def batch(keys: Iterable[Any], seed: int = 0) -> np.ndarray:
+        keys = list(keys)
+        return np.fromiter((hash_func(key, seed=seed) for key in keys),
+                           dtype=np.uint64, count=len(keys))
+
+    return batch
+
+
+BATCH_HASH_FUNCTIONS: Dict[str, Callable[..., np.ndarray]] = {
+    'simple': simple_hash_batch,
+    'polynomial': polynomial_hash_batch,
+    'djb2': djb2_hash_batch,
+    'fnv1a': fnv1a_hash_batch,
+    'xxhash64': scalar_batch(xxhash64),
+    'siphash24': scalar_batch(siphash24)
+}
+
+
+def register_hash_function(name: str, hash_func: Callable[..., int],
+                           batch_func: Optional[Callable[..., np.ndarray]]
+                           = None) -> None:
+    """
+    Регистрация дополнительной полноразрядной хеш-функции.
+
+    После регистрации имя можно передавать в hash_func таблиц.
+
+    Args:
+        name: Имя функции
+        hash_func: Функция (key, seed=0) -> 64-битное значение
+        batch_func: Пакетный вариант (keys, seed=0) -> массив uint64;
+            по умолчанию - обёртка над hash_func
+    """
+    FULL_HASH_FUNCTIONS[name] = hash_func
+    BATCH_HASH_FUNCTIONS[name] = batch_func or scalar_batch(hash_func)
+
+
+def seeded_hash_functions(name: str, seed: Optional[int] = None
+                          ) -> Tuple[int, Callable[..., int],
+                                     Callable[..., np.ndarray]]:
+    """
+    Хеш-функции с привязанным зерном для одной таблицы.
+
+    Args:
+        name: Имя функции из FULL_HASH_FUNCTIONS
+        seed: Зерно; по умолчанию - случайное 128-битное, чтобы
+            таблицу нельзя было заранее забить коллизиями
+
+    Returns:
+        (зерно, полноразрядная функция key -> int,
+        пакетная функция keys -> массив uint64)
+    """
+    if name not in FULL_HASH_FUNCTIONS:
+        raise ValueError(f"Неизвестная хеш-функция: {name}")
+    if seed is None:
+        seed = secrets.randbits(128)
+    seed &= (1 << 128) - 1
+    return (seed, partial(FULL_HASH_FUNCTIONS[name], seed=seed),
+            partial(BATCH_HASH_FUNCTIONS[name], seed=seed))
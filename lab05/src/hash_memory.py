@@ -0,0 +1,43 @@
+"""Учёт памяти, занимаемой структурами хеш-таблиц."""
+
+import sys
+from typing import Any, Dict, Iterable, Tuple
+
+# Стоимость одной ссылки в списке или кортеже
+POINTER_SIZE = 8
+
+
+def dict_bytes(pairs: Iterable[Tuple[Any, Any]]) -> int:
+    """Размер встроенного dict с теми же элементами (без ключей и значений)."""
+    return sys.getsizeof(dict(pairs))
+
+
+def build_report(count: int, total_bytes: int, empty_bytes: int,
+                 tombstone_bytes: int, baseline_bytes: int) -> Dict[str, float]:
+    """
+    Отчёт о памяти таблицы.
+
+    Все размеры - собственные структуры таблицы, без самих ключей
+    и значений: они одни и те же объекты и в таблице, и в dict.
+
+    Args:
+        count: Число элементов
+        total_bytes: Всего байт под структуры таблицы
+        empty_bytes: Байт под пустые корзины или ячейки
+        tombstone_bytes: Байт под надгробия
+        baseline_bytes: Размер dict с теми же элементами
+
+    Returns:
+        Словарь: всего байт, байт на элемент, потери на пустые
+        корзины/ячейки и надгробия, размер dict и отношение к нему
+    """
+    return {
+        'count': count,
+        'total_bytes': total_bytes,
+        'bytes_per_entry': total_bytes / count if count else 0.0,
+        'empty_bytes': empty_bytes,
+        'tombstone_bytes': tombstone_bytes,
+        'dict_bytes': baseline_bytes,
+        'overhead_vs_dict': (total_bytes / baseline_bytes
+                             if baseline_bytes else 0.0),
+    }
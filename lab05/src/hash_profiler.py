@@ -0,0 +1,248 @@
+"""Профилирование качества и распределения хеш-функций на наборе ключей."""
+
+import argparse
+import random
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from hash_functions import BATCH_HASH_FUNCTIONS, HASH_BITS
+
+# Число инверсий, хешируемых за один пакет в avalanche_score
+AVALANCHE_CHUNK = 65536
+
+
+def stream_keys(path: str, chunk_size: int = 100000) -> Iterator[List[str]]:
+    """
+    Потоковое чтение ключей из файла (по одному ключу в строке) порциями.
+
+    Args:
+        path: Путь к файлу ключей
+        chunk_size: Число ключей в порции
+
+    Yields:
+        Списки ключей не длиннее chunk_size
+    """
+    chunk = []
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            chunk.append(line.rstrip('\r\n'))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+class BucketProfile:
+    """Заполнение корзин таблицы заданного размера для одной хеш-функции."""
+
+    def __init__(self, table_size: int):
+        """
+        Args:
+            table_size: Число корзин
+        """
+        self.table_size = table_size
+        self.counts = np.zeros(table_size, dtype=np.int64)
+
+    def update(self, hashes: np.ndarray) -> None:
+        """Учёт порции полноразрядных хешей."""
+        indexes = hashes % np.uint64(self.table_size)
+        self.counts += np.bincount(indexes.astype(np.int64),
+                                   minlength=self.table_size)
+
+    def report(self) -> Dict[str, object]:
+        """
+        Метрики распределения.
+
+        Returns:
+            Словарь: гистограмма заполнения корзин {число ключей в корзине:
+            число корзин}, статистика хи-квадрат и её z-оценка
+            относительно равномерного распределения, ожидаемая
+            и наблюдаемая средняя длина успешного поиска в цепочке
+        """
+        counts = self.counts
+        num_keys = int(counts.sum())
+        size = self.table_size
+        expected_per_bucket = num_keys / size
+
+        occupancy = np.bincount(counts)
+        histogram = {load: int(buckets)
+                     for load, buckets in enumerate(occupancy) if buckets}
+
+        if num_keys:
+            chi_squared = float(
+                ((counts - expected_per_bucket) ** 2).sum()
+                / expected_per_bucket
+            )
+            observed_probes = float((counts * (counts + 1) // 2).sum()
+                                    / num_keys)
+        else:
+            chi_squared = 0.0
+            observed_probes = 0.0
+        degrees = size - 1
+        chi_squared_z = ((chi_squared - degrees) / np.sqrt(2 * degrees)
+                         if degrees else 0.0)
+
+        return {
+            'table_size': size,
+            'num_keys': num_keys,
+            'load_factor': expected_per_bucket,
+            'occupancy_histogram': histogram,
+            'empty_buckets': histogram.get(0, 0),
+            'max_chain_length': int(counts.max()) if size else 0,
+            'chi_squared': chi_squared,
+            'chi_squared_z': float(chi_squared_z),
+            'expected_probe_length': (1 + (num_keys - 1) / (2 * size)
+                                      if num_keys else 0.0),
+            'observed_probe_length': observed_probes,
+        }
+
+
+def avalanche_score(hash_name: str, keys: Sequence[str],
+                    char_bits: int = 7) -> Dict[str, float]:
+    """
+    Лавинный эффект: доля выходных битов, меняющихся при инверсии
+    одного входного бита (идеал - 0.5).
+
+    Инвертируются младшие char_bits битов кода каждого символа,
+    полноразрядный хеш сравнивается с хешем исходного ключа.
+
+    Args:
+        hash_name: Имя хеш-функции
+        keys: Выборка ключей
+        char_bits: Число инвертируемых младших битов символа
+
+    Returns:
+        Словарь: средняя доля изменившихся битов и наибольшее отклонение
+        вероятности изменения отдельного выходного бита от 0.5
+    """
+    batch_hash = BATCH_HASH_FUNCTIONS[hash_name]
+    bit_counts = np.zeros(HASH_BITS, dtype=np.int64)
+    total = 0
+
+    def count_bits(originals: List[str], flipped: List[str]) -> None:
+        nonlocal total
+        diff = (batch_hash(originals) ^ batch_hash(flipped)).astype('<u8')
+        # Байты в порядке little-endian: бит i числа - столбец i
+        bits = np.unpackbits(diff.view(np.uint8).reshape(-1, 8),
+                             axis=1, bitorder='little')
+        bit_counts[:] += bits.sum(axis=0, dtype=np.int64)[:HASH_BITS]
+        total += len(diff)
+
+    # Инверсии обрабатываются порциями, чтобы память не росла
+    # с размером выборки
+    originals: List[str] = []
+    flipped: List[str] = []
+    for key in keys:
+        for position, char in enumerate(key):
+            for bit in range(char_bits):
+                flipped.append(key[:position]
+                               + chr(ord(char) ^ (1 << bit))
+                               + key[position + 1:])
+                originals.append(key)
+        if len(flipped) >= AVALANCHE_CHUNK:
+            count_bits(originals, flipped)
+            originals, flipped = [], []
+    if flipped:
+        count_bits(originals, flipped)
+
+    if not total:
+        return {'avalanche': 0.0, 'max_bit_bias': 0.0}
+
+    per_bit = bit_counts / total
+    return {
+        'avalanche': float(per_bit.mean()),
+        'max_bit_bias': float(np.abs(per_bit - 0.5).max()),
+    }
+
+
+def profile_keys(chunks: Iterable[List[str]],
+                 table_sizes: Sequence[int] = (1009, 65537),
+                 hash_names: Optional[Sequence[str]] = None,
+                 avalanche_sample: int = 1000,
+                 seed: int = 0) -> Dict[str, Dict[str, object]]:
+    """
+    Профилирование хеш-функций на потоке ключей в ограниченной памяти.
+
+    Хранятся только счётчики корзин для каждой пары (функция, размер)
+    и фиксированная выборка ключей для лавинного теста.
+
+    Args:
+        chunks: Порции ключей (например, из stream_keys)
+        table_sizes: Размеры таблиц
+        hash_names: Имена хеш-функций (по умолчанию - все пакетные)
+        avalanche_sample: Размер выборки ключей для лавинного теста
+        seed: Зерно генератора для выборки
+
+    Returns:
+        {имя функции: {'tables': [отчёты по размерам], 'avalanche': ...}}
+    """
+    if hash_names is None:
+        hash_names = list(BATCH_HASH_FUNCTIONS)
+    profiles = {name: [BucketProfile(size) for size in table_sizes]
+                for name in hash_names}
+    rng = random.Random(seed)
+    sample: List[str] = []
+    seen = 0
+
+    for chunk in chunks:
+        for name in hash_names:
+            hashes = BATCH_HASH_FUNCTIONS[name](chunk)
+            for profile in profiles[name]:
+                profile.update(hashes)
+
+        # Выборка резервуаром фиксированного размера
+        for key in chunk:
+            seen += 1
+            if len(sample) < avalanche_sample:
+                sample.append(key)
+            else:
+                slot = rng.randrange(seen)
+                if slot < avalanche_sample:
+                    sample[slot] = key
+
+    return {
+        name: {
+            'tables': [profile.report() for profile in profiles[name]],
+            'avalanche': avalanche_score(name, sample),
+        }
+        for name in hash_names
+    }
+
+
+def print_report(report: Dict[str, Dict[str, object]]) -> None:
+    """Вывод отчёта профилировщика."""
+    for name, result in report.items():
+        avalanche = result['avalanche']
+        print(f"Hash: {name}")
+        print(f"  Avalanche: {avalanche['avalanche']:.3f} "
+              f"(max bit bias {avalanche['max_bit_bias']:.3f})")
+        for table in result['tables']:
+            print(f"  Size: {table['table_size']}, "
+                  f"Load: {table['load_factor']:.2f}")
+            print(f"    Chi-squared: {table['chi_squared']:.1f} "
+                  f"(z = {table['chi_squared_z']:.2f})")
+            print(f"    Empty buckets: {table['empty_buckets']}, "
+                  f"Max chain: {table['max_chain_length']}")
+            print(f"    Probe length: expected "
+                  f"{table['expected_probe_length']:.3f}, observed "
+                  f"{table['observed_probe_length']:.3f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Профилирование хеш-функций на файле ключей'
+    )
+    parser.add_argument('keys_file', help='Файл ключей, по одному в строке')
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1009, 65537], help='Размеры таблиц')
+    parser.add_argument('--functions', nargs='+',
+                        choices=list(BATCH_HASH_FUNCTIONS),
+                        help='Хеш-функции (по умолчанию все)')
+    parser.add_argument('--chunk-size', type=int, default=100000,
+                        help='Число ключей в порции чтения')
+    args = parser.parse_args()
+
+    print_report(profile_keys(stream_keys(args.keys_file, args.chunk_size),
+                              args.sizes, args.functions))
@@ -0,0 +1,275 @@
+"""Хранилище, разделённое на шарды по нескольким процессам."""
+
+import multiprocessing
+import os
+from multiprocessing.reduction import ForkingPickler
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from hash_functions import seeded_hash_functions
+from hash_table_open_addressing import HashTableOpenAddressing
+
+
+# Команды протокола клиент -> шард
+SET_MANY = 'set_many'
+GET_MANY = 'get_many'
+DELETE_MANY = 'delete_many'
+STATS = 'stats'
+STOP = 'stop'
+
+# Константы финализатора fmix64 из MurmurHash3
+_FMIX_MUL1 = 0xff51afd7ed558ccd
+_FMIX_MUL2 = 0xc4ceb9fe1a85ec53
+_MASK64 = (1 << 64) - 1
+
+
+def _mix64(key_hash: int) -> int:
+    """
+    Перемешивание 64-битного хеша (fmix64): каждый входной бит влияет
+    на все выходные, поэтому ключи, отличающиеся последним символом,
+    расходятся по разным шардам даже у слабых функций (fnv1a, djb2).
+    """
+    key_hash ^= key_hash >> 33
+    key_hash = (key_hash * _FMIX_MUL1) & _MASK64
+    key_hash ^= key_hash >> 33
+    key_hash = (key_hash * _FMIX_MUL2) & _MASK64
+    return key_hash ^ (key_hash >> 33)
+
+
+def _mix64_batch(hashes: np.ndarray) -> np.ndarray:
+    """Пакетный вариант _mix64 над массивом numpy uint64."""
+    shift = np.uint64(33)
+    mixed = hashes ^ (hashes >> shift)
+    mixed = mixed * np.uint64(_FMIX_MUL1)
+    mixed ^= mixed >> shift
+    mixed = mixed * np.uint64(_FMIX_MUL2)
+    return mixed ^ (mixed >> shift)
+
+
+def _shard_worker(connection, table_kwargs: Dict[str, Any]) -> None:
+    """
+    Цикл процесса-шарда: владеет своей таблицей и выполняет пакеты команд.
+
+    Пакет приходит вместе с хешами ключей, уже вычисленными клиентом
+    для выбора шарда: таблица шарда использует ту же функцию с тем же
+    зерном, поэтому ключи повторно не хешируются.
+
+    Args:
+        connection: Конец канала со стороны шарда
+        table_kwargs: Параметры HashTableOpenAddressing
+    """
+    table = HashTableOpenAddressing(**table_kwargs)
+    while True:
+        command, payload = connection.recv()
+        if command == GET_MANY:
+            keys, hashes = payload
+            connection.send(table._search_many_hashed(keys, hashes.tolist()))
+        elif command == SET_MANY:
+            pairs, hashes = payload
+            table._insert_many_hashed(pairs, hashes.tolist())
+            connection.send(len(pairs))
+        elif command == DELETE_MANY:
+            keys, hashes = payload
+            table._finish_migration()
+            connection.send([table._delete_hashed(key, key_hash)
+                             for key, key_hash
+                             in zip(keys, hashes.tolist())])
+        elif command == STATS:
+            connection.send({'count': table.count, 'size': table.size,
+                             'load_factor': table.load_factor})
+        else:
+            connection.close()
+            return
+
+
+class ShardedHashStore:
+    """
+    Хранилище ключ-значение из num_shards процессов, у каждого свой
+    HashTableOpenAddressing, поэтому работа не упирается в GIL
+    одного процесса.
+
+    Шард ключа выбирается по его хешу, пропущенному через финализатор
+    fmix64: у сырого хеша fnv1a или djb2 ключи, отличающиеся последним
+    символом, совпадают в старших битах и попадали бы в один шард.
+    Ячейку в таблице шарда по-прежнему выбирает исходный хеш; номер
+    шарда после перемешивания от его битов не зависит, поэтому ключи
+    шарда не теснятся в части ячеек. Пакетные операции раскладывают ключи
+    по шардам, сначала отправляют запросы всем шардам, потом собирают
+    ответы: шарды обрабатывают свои части параллельно.
+    """
+
+    def __init__(self, num_shards: Optional[int] = None,
+                 hash_func: str = 'fnv1a', seed: Optional[int] = None,
+                 **table_kwargs):
+        """
+        Запуск процессов-шардов.
+
+        Args:
+            num_shards: Число шардов (по умолчанию - число ядер)
+            hash_func: Хеш-функция разбиения и таблиц шардов
+            seed: Зерно хеш-функции (по умолчанию - случайное)
+            table_kwargs: Дополнительные параметры HashTableOpenAddressing
+        """
+        self.num_shards = num_shards or os.cpu_count() or 1
+        self.seed, self.hash_func, self.batch_hash_func = \
+            seeded_hash_functions(hash_func, seed)
+        table_kwargs = dict(table_kwargs, hash_func=hash_func,
+                            seed=self.seed)
+
+        self._connections = []
+        self._processes = []
+        for _ in range(self.num_shards):
+            client_end, shard_end = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_shard_worker, args=(shard_end, table_kwargs),
+                daemon=True
+            )
+            process.start()
+            shard_end.close()
+            self._connections.append(client_end)
+            self._processes.append(process)
+
+    def _send_one(self, command: str, key: Any, item: Any) -> Any:
+        """Пакет из одного элемента шарду ключа и ответ шарда."""
+        key_hash = self.hash_func(key)
+        connection = self._connections[_mix64(key_hash) % self.num_shards]
+        connection.send((command, ([item], np.array([key_hash],
+                                                    dtype=np.uint64))))
+        return connection.recv()
+
+    def _partition(self, hashes: np.ndarray) -> List[np.ndarray]:
+        """
+        Разбиение позиций ключей по шардам.
+
+        Args:
+            hashes: Хеши ключей (numpy uint64)
+
+        Returns:
+            Для каждого шарда - массив индексов его ключей
+        """
+        shards = _mix64_batch(hashes) % np.uint64(self.num_shards)
+        order = np.argsort(shards, kind='stable')
+        bounds = np.searchsorted(shards[order],
+                                 np.arange(self.num_shards + 1))
+        return [order[bounds[i]:bounds[i + 1]]
+                for i in range(self.num_shards)]
+
+    def _scatter(self, command: str, keys: List[Any],
+                 payloads: List[Any]) -> List[Tuple[np.ndarray, Any]]:
+        """
+        Отправка пакетов всем шардам и сбор ответов. Каждый шард
+        получает свои элементы вместе с хешами ключей.
+
+        Все пакеты сериализуются до отправки первого: если элемент
+        не сериализуется, ни один шард не получает запрос, и в каналах
+        не остаётся ответов, которые прочитал бы следующий вызов.
+
+        Args:
+            command: Команда протокола
+            keys: Ключи (по ним выбираются шарды)
+            payloads: Элементы пакета в порядке keys
+
+        Returns:
+            Пары (индексы ключей шарда, ответ шарда)
+        """
+        hashes = self.batch_hash_func(keys)
+        parts = self._partition(hashes)
+        batches = []
+        for connection, indexes in zip(self._connections, parts):
+            if len(indexes):
+                message = ForkingPickler.dumps(
+                    (command, ([payloads[i] for i in indexes.tolist()],
+                               hashes[indexes]))
+                )
+                batches.append((connection, indexes, message))
+
+        pending = []
+        for connection, indexes, message in batches:
+            connection.send_bytes(message)
+            pending.append((connection, indexes))
+        return [(indexes, connection.recv())
+                for connection, indexes in pending]
+
+    def set_many(self, pairs: Iterable[Tuple[Any, Any]]) -> None:
+        """
+        Пакетная запись пар во все шарды.
+
+        Args:
+            pairs: Пары (ключ, значение); значения должны сериализоваться
+                pickle
+        """
+        pairs = list(pairs)
+        if pairs:
+            self._scatter(SET_MANY, [key for key, _ in pairs], pairs)
+
+    def get_many(self, keys: Iterable[Any]) -> List[Optional[Any]]:
+        """
+        Пакетный поиск.
+
+        Args:
+            keys: Ключи
+
+        Returns:
+            Значения в порядке keys (None для отсутствующих)
+        """
+        keys = list(keys)
+        results: List[Optional[Any]] = [None] * len(keys)
+        if not keys:
+            return results
+        for indexes, values in self._scatter(GET_MANY, keys, keys):
+            for index, value in zip(indexes.tolist(), values):
+                results[index] = value
+        return results
+
+    def delete_many(self, keys: Iterable[Any]) -> List[bool]:
+        """
+        Пакетное удаление.
+
+        Returns:
+            Для каждого ключа - был ли он удалён
+        """
+        keys = list(keys)
+        results = [False] * len(keys)
+        if not keys:
+            return results
+        for indexes, deleted in self._scatter(DELETE_MANY, keys, keys):
+            for index, flag in zip(indexes.tolist(), deleted):
+                results[index] = flag
+        return results
+
+    def set(self, key: Any, value: Any) -> None:
+        """Запись одной пары (один обмен с шардом)."""
+        self._send_one(SET_MANY, key, (key, value))
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Поиск одного ключа (один обмен с шардом)."""
+        return self._send_one(GET_MANY, key, key)[0]
+
+    def get_stats(self) -> List[Dict[str, float]]:
+        """Число элементов, размер и заполнение таблицы каждого шарда."""
+        for connection in self._connections:
+            connection.send((STATS, None))
+        return [connection.recv() for connection in self._connections]
+
+    def __len__(self) -> int:
+        return sum(stats['count'] for stats in self.get_stats())
+
+    def close(self) -> None:
+        """Остановка процессов-шардов."""
+        for connection in self._connections:
+            try:
+                connection.send((STOP, None))
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
+
+    def __enter__(self) -> 'ShardedHashStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
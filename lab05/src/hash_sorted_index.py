@@ -0,0 +1,152 @@
+"""Отсортированный вторичный индекс ключей для хеш-таблиц."""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, Iterator, List, Optional
+
+
+class SortedKeyIndex:
+    """
+    Отсортированный список ключей, разбитый на блоки.
+
+    Ключи хранятся в отсортированных блоках не длиннее 2 * BLOCK_SIZE,
+    рядом - список наибольших ключей блоков. Блок находится бинарным
+    поиском по этому списку, вставка и удаление сдвигают элементы
+    только внутри блока, поэтому изменения и начало диапазонного
+    запроса стоят O(log n + BLOCK_SIZE) независимо от того, как
+    запросы чередуются с записью.
+
+    Ключи индекса должны быть взаимно сравнимы (например, только str).
+    """
+
+    BLOCK_SIZE = 256
+
+    def __init__(self, keys: Iterable[Any] = ()):
+        """
+        Args:
+            keys: Начальные ключи (без повторов)
+        """
+        ordered = sorted(keys)
+        size = self.BLOCK_SIZE
+        self._blocks: List[List[Any]] = [ordered[i:i + size]
+                                         for i in range(0, len(ordered), size)]
+        self._maxes: List[Any] = [block[-1] for block in self._blocks]
+        self._count = len(ordered)
+
+    def add(self, key: Any) -> None:
+        """
+        Добавление ключа (повтор игнорируется).
+
+        Time Complexity: O(log n + BLOCK_SIZE)
+        """
+        if not self._blocks:
+            self._blocks.append([key])
+            self._maxes.append(key)
+            self._count = 1
+            return
+
+        index = bisect_left(self._maxes, key)
+        if index == len(self._maxes):
+            index -= 1
+        block = self._blocks[index]
+        position = bisect_left(block, key)
+        if position < len(block) and block[position] == key:
+            return
+
+        block.insert(position, key)
+        self._maxes[index] = block[-1]
+        self._count += 1
+        if len(block) > 2 * self.BLOCK_SIZE:
+            # Разделение переполненного блока пополам
+            half = block[self.BLOCK_SIZE:]
+            del block[self.BLOCK_SIZE:]
+            self._blocks.insert(index + 1, half)
+            self._maxes[index] = block[-1]
+            self._maxes.insert(index + 1, half[-1])
+
+    def discard(self, key: Any) -> None:
+        """
+        Удаление ключа, если он есть.
+
+        Time Complexity: O(log n + BLOCK_SIZE)
+        """
+        index = bisect_left(self._maxes, key)
+        if index == len(self._maxes):
+            return
+        block = self._blocks[index]
+        position = bisect_left(block, key)
+        if position == len(block) or block[position] != key:
+            return
+
+        del block[position]
+        self._count -= 1
+        if block:
+            self._maxes[index] = block[-1]
+        else:
+            del self._blocks[index]
+            del self._maxes[index]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.range()
+
+    def _tail(self, key: Any, inclusive: bool) -> List[Any]:
+        """
+        Остаток блока, где начинаются ключи >= key (> key, если
+        inclusive ложно); пустой список, если таких ключей нет.
+        """
+        maxes = self._maxes
+        index = (bisect_left if inclusive else bisect_right)(maxes, key)
+        if index == len(maxes):
+            return []
+        block = self._blocks[index]
+        start = (bisect_left if inclusive else bisect_right)(block, key)
+        return block[start:]
+
+    def range(self, lo: Optional[Any] = None,
+              hi: Optional[Any] = None) -> Iterator[Any]:
+        """
+        Ключи из полуинтервала [lo, hi) по возрастанию.
+
+        Генератор копирует по одному блоку и продолжает от последнего
+        выданного ключа, поэтому изменения индекса во время обхода
+        не ломают его: удалённые ключи впереди не выдаются, добавленные
+        впереди - выдаются.
+
+        Args:
+            lo: Нижняя граница включительно (None - без границы)
+            hi: Верхняя граница не включительно (None - без границы)
+
+        Yields:
+            Ключи по возрастанию
+
+        Time Complexity: O(log n + k)
+        """
+        if lo is None:
+            if not self._blocks:
+                return
+            chunk = list(self._blocks[0])
+        else:
+            chunk = self._tail(lo, inclusive=True)
+
+        while chunk:
+            for key in chunk:
+                if hi is not None and not key < hi:
+                    return
+                yield key
+            chunk = self._tail(chunk[-1], inclusive=False)
+
+    def prefix(self, prefix: Any) -> Iterator[Any]:
+        """
+        Ключи с заданным префиксом (str или bytes) по возрастанию.
+
+        Yields:
+            Ключи, начинающиеся с prefix
+
+        Time Complexity: O(log n + k)
+        """
+        for key in self.range(prefix):
+            if not key.startswith(prefix):
+                return
+            yield key
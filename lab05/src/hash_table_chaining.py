@@ -1,49 +1,197 @@
 """Реализация хеш-таблицы с методом цепочек."""
 
-from typing import Any, Optional, Tuple
-from hash_functions import simple_hash, polynomial_hash, djb2_hash
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from hash_functions import seeded_hash_functions
+from hash_memory import POINTER_SIZE, build_report, dict_bytes
+from hash_sorted_index import SortedKeyIndex
+from hash_table_snapshot import MappedHashTableChaining, save_snapshot
 
 
 class HashTableChaining:
-    """Хеш-таблица с методом цепочек для разрешения коллизий."""
+    """
+    Хеш-таблица с методом цепочек для разрешения коллизий.
+
+    Каждая запись цепочки хранит кортеж (ключ, значение, хеш), где хеш -
+    полноразрядное значение, не зависящее от размера таблицы.
+
+    При incremental_resize=True рост таблицы не перехеширует всё сразу:
+    старая и новая таблицы существуют одновременно, и каждая операция
+    переносит не более migrate_step корзин старой таблицы (плюс корзину
+    ключа, к которому обращается операция). Корзины новой таблицы
+    создаются при первой вставке в них (пустая корзина - None), чтобы
+    и выделение памяти под таблицу не требовало O(n) работы за раз.
+
+    При lazy_buckets=True так устроена и основная таблица: список
+    корзины создаётся при первой вставке и освобождается, когда
+    корзина пустеет, поэтому пустая корзина стоит одну ссылку.
+
+    При ordered_index=True рядом с таблицей ведётся отсортированный
+    индекс ключей (SortedKeyIndex), и items(), range() и prefix()
+    выдают элементы в порядке ключей.
+    """
 
     def __init__(self, size: int = 101, hash_func: str = 'simple', 
-                 load_factor_threshold: float = 0.7):
+                 load_factor_threshold: float = 0.7,
+                 incremental_resize: bool = False, migrate_step: int = 4,
+                 seed: Optional[int] = None, lazy_buckets: bool = False,
+                 ordered_index: bool = False):
         """
         Инициализация хеш-таблицы.
 
         Args:
             size: Начальный размер таблицы (простое число)
-            hash_func: Используемая хеш-функция ('simple', 'polynomial', 'djb2')
+            hash_func: Используемая хеш-функция (имя из FULL_HASH_FUNCTIONS:
+                'simple', 'polynomial', 'djb2', 'fnv1a', 'xxhash64',
+                'siphash24')
             load_factor_threshold: Порог для рехеширования
+            incremental_resize: Постепенный перенос элементов при росте
+            migrate_step: Число корзин, переносимых за одну операцию
+            seed: Зерно хеш-функции (по умолчанию - случайное)
+            lazy_buckets: Создавать списки корзин при первой вставке
+            ordered_index: Вести отсортированный индекс ключей
+                (ключи должны быть взаимно сравнимы)
         """
         self.size = size
         self.count = 0
         self.load_factor_threshold = load_factor_threshold
-        self.table = [[] for _ in range(size)]
+        self.lazy_buckets = lazy_buckets
+        self.table = self._new_table(size)
+        self._index = SortedKeyIndex() if ordered_index else None
+
+        # Состояние постепенного перехеширования
+        self.incremental_resize = incremental_resize
+        self.migrate_step = migrate_step
+        self._old_table: Optional[List[Optional[list]]] = None
+        self._old_size = 0
+        self._migrate_index = 0
 
         # Выбор хеш-функции
-        hash_functions = {
-            'simple': simple_hash,
-            'polynomial': polynomial_hash,
-            'djb2': djb2_hash
-        }
-        self.hash_func = hash_functions[hash_func]
+        self.hash_func_name = hash_func
+        self.seed, self.hash_func, self.batch_hash_func = \
+            seeded_hash_functions(hash_func, seed)
 
     def _hash(self, key: str) -> int:
-        """Вычисление хеша для ключа."""
-        return self.hash_func(key, self.size)
+        """Вычисление индекса корзины для ключа."""
+        return self.hash_func(key) % self.size
+
+    def _new_table(self, size: int) -> List[Optional[list]]:
+        """Пустая таблица: ленивые корзины (None) или пустые списки."""
+        if self.lazy_buckets:
+            return [None] * size
+        return [[] for _ in range(size)]
 
     def _resize(self, new_size: int) -> None:
-        """Изменение размера таблицы и перехеширование всех элементов."""
+        """
+        Изменение размера таблицы.
+
+        Записи распределяются по новым корзинам за один проход
+        по сохранённым хешам, без повторного хеширования ключей.
+        """
+        self._finish_migration()
         old_table = self.table
         self.size = new_size
-        self.table = [[] for _ in range(new_size)]
-        self.count = 0
+        if not self.lazy_buckets:
+            table = self.table = [[] for _ in range(new_size)]
+            for bucket in old_table:
+                for entry in bucket or ():
+                    table[entry[2] % new_size].append(entry)
+            return
 
+        table = self.table = [None] * new_size
         for bucket in old_table:
-            for key, value in bucket:
-                self.insert(key, value)
+            for entry in bucket or ():
+                index = entry[2] % new_size
+                if table[index] is None:
+                    table[index] = [entry]
+                else:
+                    table[index].append(entry)
+
+    def _start_migration(self, new_size: int) -> None:
+        """Начало постепенного переноса элементов в таблицу нового размера."""
+        self._finish_migration()
+        self._old_table = self.table
+        self._old_size = self.size
+        self._migrate_index = 0
+        self.size = new_size
+        self.table = [None] * new_size
+
+    def _migrate_bucket(self, old_index: int) -> None:
+        """Перенос одной корзины старой таблицы по сохранённым хешам."""
+        bucket = self._old_table[old_index]
+        if bucket is None:
+            return
+        table = self.table
+        size = self.size
+        for entry in bucket:
+            index = entry[2] % size
+            if table[index] is None:
+                table[index] = [entry]
+            else:
+                table[index].append(entry)
+        self._old_table[old_index] = None
+
+    def _migrate(self, key_hash: Optional[int] = None) -> None:
+        """
+        Шаг постепенного перехеширования.
+
+        Args:
+            key_hash: Хеш ключа текущей операции - его корзина
+                переносится первой, чтобы операция работала
+                только с новой таблицей
+        """
+        if self._old_table is None:
+            return
+        if key_hash is not None:
+            self._migrate_bucket(key_hash % self._old_size)
+
+        end = min(self._migrate_index + self.migrate_step, self._old_size)
+        for old_index in range(self._migrate_index, end):
+            self._migrate_bucket(old_index)
+        self._migrate_index = end
+
+        if end == self._old_size:
+            self._old_table = None
+
+    def _finish_migration(self) -> None:
+        """Завершение незаконченного постепенного перехеширования."""
+        if self._old_table is not None:
+            for old_index in range(self._migrate_index, self._old_size):
+                self._migrate_bucket(old_index)
+            self._old_table = None
+
+    def _reserve(self, required_count: int) -> None:
+        """Однократное увеличение таблицы под заданное число элементов."""
+        new_size = self.size
+        while required_count / new_size > self.load_factor_threshold:
+            new_size *= 2
+        if new_size != self.size:
+            self._resize(new_size)
+
+    def _insert_hashed(self, key: str, value: Any, key_hash: int) -> None:
+        """Вставка элемента с уже вычисленным хешем без проверки заполнения."""
+        index = key_hash % self.size
+        bucket = self.table[index]
+        if bucket is None:
+            # Индекс - первым: несравнимый ключ (TypeError) не попадает
+            # и в таблицу
+            if self._index is not None:
+                self._index.add(key)
+            self.table[index] = [(key, value, key_hash)]
+            self.count += 1
+            return
+
+        # Проверка на существование ключа
+        for i, (k, v, h) in enumerate(bucket):
+            if h == key_hash and k == key:
+                bucket[i] = (key, value, key_hash)
+                return
+
+        # Вставка нового элемента
+        if self._index is not None:
+            self._index.add(key)
+        bucket.append((key, value, key_hash))
+        self.count += 1
 
     def insert(self, key: str, value: Any) -> None:
         """
@@ -55,22 +203,47 @@ class HashTableChaining:
 
         Time Complexity: O(1) в среднем, O(n) в худшем случае
         """
+        key_hash = self.hash_func(key)
+        self._migrate(key_hash)
+
         # Проверка необходимости рехеширования
         if self.load_factor > self.load_factor_threshold:
-            self._resize(self.size * 2)
+            if self.incremental_resize:
+                self._start_migration(self.size * 2)
+                self._migrate(key_hash)
+            else:
+                self._resize(self.size * 2)
 
-        index = self._hash(key)
-        bucket = self.table[index]
+        self._insert_hashed(key, value, key_hash)
 
-        # Проверка на существование ключа
-        for i, (k, v) in enumerate(bucket):
-            if k == key:
-                bucket[i] = (key, value)
-                return
+    def insert_many(self, pairs: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Пакетная вставка элементов.
 
-        # Вставка нового элемента
-        bucket.append((key, value))
-        self.count += 1
+        Таблица один раз увеличивается под итоговое число элементов,
+        хеши всех ключей вычисляются одним пакетом. Повторяющиеся ключи
+        перезаписываются так же, как при insert.
+
+        Args:
+            pairs: Пары (ключ, значение)
+
+        Time Complexity: O(n) в среднем
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return
+
+        self._insert_many_hashed(
+            pairs, self.batch_hash_func([key for key, _ in pairs]).tolist()
+        )
+
+    def _insert_many_hashed(self, pairs: List[Tuple[str, Any]],
+                            hashes: List[int]) -> None:
+        """Пакетная вставка пар с уже вычисленными хешами."""
+        self._finish_migration()
+        self._reserve(self.count + len(pairs))
+        for (key, value), key_hash in zip(pairs, hashes):
+            self._insert_hashed(key, value, key_hash)
 
     def search(self, key: str) -> Optional[Any]:
         """
@@ -84,14 +257,47 @@ class HashTableChaining:
 
         Time Complexity: O(1) в среднем, O(n) в худшем случае
         """
-        index = self._hash(key)
-        bucket = self.table[index]
+        key_hash = self.hash_func(key)
+        self._migrate(key_hash)
+        bucket = self.table[key_hash % self.size]
 
-        for k, v in bucket:
-            if k == key:
+        for k, v, h in bucket or ():
+            if h == key_hash and k == key:
                 return v
         return None
 
+    def search_many(self, keys: Iterable[str]) -> List[Optional[Any]]:
+        """
+        Пакетный поиск элементов.
+
+        Args:
+            keys: Ключи для поиска
+
+        Returns:
+            Список найденных значений (None для отсутствующих ключей)
+        """
+        keys = list(keys)
+        return self._search_many_hashed(
+            keys, self.batch_hash_func(keys).tolist()
+        )
+
+    def _search_many_hashed(self, keys: List[str],
+                            hashes: List[int]) -> List[Optional[Any]]:
+        """Пакетный поиск ключей с уже вычисленными хешами."""
+        self._finish_migration()
+        table = self.table
+        size = self.size
+        results = []
+
+        for key, key_hash in zip(keys, hashes):
+            for k, v, h in table[key_hash % size] or ():
+                if h == key_hash and k == key:
+                    results.append(v)
+                    break
+            else:
+                results.append(None)
+        return results
+
     def delete(self, key: str) -> bool:
         """
         Удаление элемента по ключу.
@@ -104,16 +310,117 @@ class HashTableChaining:
 
         Time Complexity: O(1) в среднем, O(n) в худшем случае
         """
-        index = self._hash(key)
-        bucket = self.table[index]
+        key_hash = self.hash_func(key)
+        self._migrate(key_hash)
+        bucket = self.table[key_hash % self.size]
 
-        for i, (k, v) in enumerate(bucket):
-            if k == key:
+        for i, (k, v, h) in enumerate(bucket or ()):
+            if h == key_hash and k == key:
                 del bucket[i]
+                if not bucket and self.lazy_buckets:
+                    self.table[key_hash % self.size] = None
                 self.count -= 1
+                if self._index is not None:
+                    self._index.discard(key)
                 return True
         return False
 
+    def _entry(self, key: Any) -> Optional[tuple]:
+        """Запись (ключ, значение, хеш) или None."""
+        key_hash = self.hash_func(key)
+        self._migrate(key_hash)
+        for entry in self.table[key_hash % self.size] or ():
+            if entry[2] == key_hash and entry[0] == key:
+                return entry
+        return None
+
+    def _ordered_items(self, keys: Iterator[Any]) -> Iterator[Tuple[Any, Any]]:
+        """Пары (ключ, значение) для ключей индекса."""
+        for key in keys:
+            entry = self._entry(key)
+            if entry is not None:
+                yield key, entry[1]
+
+    def _require_index(self) -> SortedKeyIndex:
+        """Индекс ключей; без него упорядоченные запросы недоступны."""
+        if self._index is None:
+            raise ValueError("Таблица создана без ordered_index=True")
+        return self._index
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """
+        Все пары (ключ, значение).
+
+        С ordered_index - по возрастанию ключей, иначе в порядке корзин.
+
+        Yields:
+            Пары (ключ, значение)
+        """
+        if self._index is not None:
+            yield from self._ordered_items(iter(self._index))
+            return
+        self._finish_migration()
+        for bucket in self.table:
+            for key, value, _ in bucket or ():
+                yield key, value
+
+    def range(self, lo: Optional[Any] = None,
+              hi: Optional[Any] = None) -> Iterator[Tuple[Any, Any]]:
+        """
+        Пары с ключами из [lo, hi) по возрастанию ключей.
+
+        Args:
+            lo: Нижняя граница включительно (None - без границы)
+            hi: Верхняя граница не включительно (None - без границы)
+
+        Yields:
+            Пары (ключ, значение)
+
+        Time Complexity: O(log n + k)
+        """
+        yield from self._ordered_items(self._require_index().range(lo, hi))
+
+    def prefix(self, prefix: Any) -> Iterator[Tuple[Any, Any]]:
+        """
+        Пары с ключами, начинающимися с prefix, по возрастанию ключей.
+
+        Args:
+            prefix: Префикс (str или bytes)
+
+        Yields:
+            Пары (ключ, значение)
+
+        Time Complexity: O(log n + k)
+        """
+        yield from self._ordered_items(self._require_index().prefix(prefix))
+
+    def save(self, path: str) -> None:
+        """
+        Сохранение таблицы в компактный бинарный файл (без pickle).
+
+        Ключи и значения должны быть None, bool, int, float, str или bytes.
+
+        Args:
+            path: Путь к файлу снимка
+        """
+        save_snapshot(self, path)
+
+    @staticmethod
+    def load(path: str) -> MappedHashTableChaining:
+        """
+        Загрузка снимка через отображение файла в память.
+
+        Поиск по загруженной таблице доступен сразу, без перехеширования;
+        для изменения таблицы используйте to_table().
+
+        Args:
+            path: Путь к файлу снимка
+
+        Returns:
+            Таблица только для чтения над отображённым файлом
+        """
+        return MappedHashTableChaining(path)
+
     @property
     def load_factor(self) -> float:
         """Коэффициент заполнения таблицы."""
@@ -126,13 +433,49 @@ class HashTableChaining:
         Returns:
             (количество коллизий, средняя длина цепочки)
         """
+        self._finish_migration()
         collisions = 0
         total_chain_length = 0
 
         for bucket in self.table:
-            if len(bucket) > 1:
-                collisions += len(bucket) - 1
-            total_chain_length += len(bucket)
+            chain_length = len(bucket) if bucket else 0
+            if chain_length > 1:
+                collisions += chain_length - 1
+            total_chain_length += chain_length
 
         avg_chain_length = total_chain_length / self.size if self.size else 0
-        return collisions, avg_chain_length
\ No newline at end of file
+        return collisions, avg_chain_length
+
+    def memory_report(self) -> Dict[str, float]:
+        """
+        Память, занимаемая структурами таблицы.
+
+        Учитываются массив корзин, списки корзин и кортежи записей
+        (без самих ключей и значений). Пустая корзина стоит ссылку
+        в массиве плюс пустой список, если корзины не ленивые.
+
+        Returns:
+            Отчёт build_report: байт всего и на элемент, потери
+            на пустые корзины, сравнение с dict
+        """
+        total_bytes = 0
+        empty_bytes = 0
+        for table in (self.table, self._old_table):
+            if table is None:
+                continue
+            total_bytes += sys.getsizeof(table)
+            for bucket in table:
+                if not bucket:
+                    empty_bytes += POINTER_SIZE
+                    if bucket is not None:
+                        empty_bytes += sys.getsizeof(bucket)
+                        total_bytes += sys.getsizeof(bucket)
+                    continue
+                total_bytes += sys.getsizeof(bucket)
+                total_bytes += sum(sys.getsizeof(entry) for entry in bucket)
+
+        pairs = ((k, v) for table in (self._old_table, self.table)
+                 if table is not None for bucket in table
+                 for k, v, _ in bucket or ())
+        return build_report(self.count, total_bytes, empty_bytes, 0,
+                            dict_bytes(pairs))
@@ -0,0 +1,223 @@
+"""Потокобезопасная хеш-таблица с методом цепочек и разделёнными блокировками."""
+
+import sys
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from hash_functions import seeded_hash_functions
+from hash_memory import POINTER_SIZE, build_report, dict_bytes
+
+
+class ConcurrentHashTableChaining:
+    """
+    Хеш-таблица с методом цепочек для работы из нескольких потоков.
+
+    Корзины разбиты на num_stripes диапазонов, у каждого диапазона своя
+    блокировка, поэтому записи в разные диапазоны не мешают друг другу.
+    Корзина - неизменяемый кортеж записей (ключ, значение, хеш): запись
+    заменяет кортеж целиком, поэтому чтение идёт без блокировок и всегда
+    видит согласованную корзину. Таблица и её размер публикуются одной
+    парой, так что при росте читатели продолжают работать со старой
+    таблицей, пока новая не будет подменена; ждут только писатели.
+    """
+
+    def __init__(self, size: int = 101, hash_func: str = 'simple',
+                 load_factor_threshold: float = 0.7, num_stripes: int = 16,
+                 seed: Optional[int] = None):
+        """
+        Инициализация хеш-таблицы.
+
+        Args:
+            size: Начальный размер таблицы (простое число)
+            hash_func: Используемая хеш-функция (имя из FULL_HASH_FUNCTIONS)
+            load_factor_threshold: Порог для рехеширования
+            num_stripes: Число блокировок (диапазонов корзин)
+            seed: Зерно хеш-функции (по умолчанию - случайное)
+        """
+        self.load_factor_threshold = load_factor_threshold
+        self.num_stripes = num_stripes
+        self._locks = [threading.Lock() for _ in range(num_stripes)]
+        self._counts = [0] * num_stripes
+        self._state: Tuple[List[tuple], int] = ([()] * size, size)
+
+        # Выбор хеш-функции
+        self.hash_func_name = hash_func
+        self.seed, self.hash_func, _ = seeded_hash_functions(hash_func, seed)
+
+    @property
+    def size(self) -> int:
+        """Текущее число корзин."""
+        return self._state[1]
+
+    @property
+    def count(self) -> int:
+        """Число элементов в таблице."""
+        return sum(self._counts)
+
+    def _stripe(self, index: int, size: int) -> int:
+        """Номер блокировки для корзины (корзины делятся на диапазоны)."""
+        return index * self.num_stripes // size
+
+    def _resize(self, new_size: int) -> None:
+        """
+        Рост таблицы под всеми блокировками.
+
+        Новая таблица строится по сохранённым хешам и публикуется одной
+        операцией присваивания; читатели при этом не блокируются.
+        """
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            table, size = self._state
+            if size >= new_size:
+                # Другой поток уже увеличил таблицу
+                return
+
+            new_table: List[list] = [[] for _ in range(new_size)]
+            for bucket in table:
+                for entry in bucket:
+                    new_table[entry[2] % new_size].append(entry)
+
+            counts = [0] * self.num_stripes
+            for index, bucket in enumerate(new_table):
+                counts[self._stripe(index, new_size)] += len(bucket)
+
+            self._state = ([tuple(bucket) for bucket in new_table], new_size)
+            self._counts = counts
+        finally:
+            for lock in self._locks:
+                lock.release()
+
+    def insert(self, key: str, value: Any) -> None:
+        """
+        Вставка элемента в хеш-таблицу.
+
+        Args:
+            key: Ключ
+            value: Значение
+
+        Time Complexity: O(1) в среднем, O(n) в худшем случае
+        """
+        key_hash = self.hash_func(key)
+
+        while True:
+            table, size = self._state
+            index = key_hash % size
+            stripe = self._stripe(index, size)
+            with self._locks[stripe]:
+                if self._state[0] is not table:
+                    # Таблица выросла, пока ждали блокировку
+                    continue
+
+                bucket = table[index]
+                for i, (k, v, h) in enumerate(bucket):
+                    if h == key_hash and k == key:
+                        table[index] = (bucket[:i] + ((key, value, key_hash),)
+                                        + bucket[i + 1:])
+                        return
+
+                table[index] = bucket + ((key, value, key_hash),)
+                self._counts[stripe] += 1
+            break
+
+        if self.load_factor > self.load_factor_threshold:
+            self._resize(size * 2)
+
+    def search(self, key: str) -> Optional[Any]:
+        """
+        Поиск элемента по ключу без блокировок.
+
+        Args:
+            key: Ключ для поиска
+
+        Returns:
+            Найденное значение или None
+
+        Time Complexity: O(1) в среднем, O(n) в худшем случае
+        """
+        key_hash = self.hash_func(key)
+        table, size = self._state
+
+        for k, v, h in table[key_hash % size]:
+            if h == key_hash and k == key:
+                return v
+        return None
+
+    def delete(self, key: str) -> bool:
+        """
+        Удаление элемента по ключу.
+
+        Args:
+            key: Ключ для удаления
+
+        Returns:
+            True если элемент удален, False если не найден
+
+        Time Complexity: O(1) в среднем, O(n) в худшем случае
+        """
+        key_hash = self.hash_func(key)
+
+        while True:
+            table, size = self._state
+            index = key_hash % size
+            stripe = self._stripe(index, size)
+            with self._locks[stripe]:
+                if self._state[0] is not table:
+                    continue
+
+                bucket = table[index]
+                for i, (k, v, h) in enumerate(bucket):
+                    if h == key_hash and k == key:
+                        table[index] = bucket[:i] + bucket[i + 1:]
+                        self._counts[stripe] -= 1
+                        return True
+                return False
+
+    def memory_report(self) -> Dict[str, float]:
+        """
+        Память, занимаемая структурами таблицы.
+
+        Пустая корзина - общий пустой кортеж, то есть одна ссылка;
+        учитываются также блокировки.
+
+        Returns:
+            Отчёт build_report: байт всего и на элемент, потери
+            на пустые корзины, сравнение с dict
+        """
+        table, _ = self._state
+        total_bytes = sys.getsizeof(table)
+        total_bytes += sum(map(sys.getsizeof, self._locks))
+        empty_bytes = 0
+        for bucket in table:
+            if not bucket:
+                empty_bytes += POINTER_SIZE
+                continue
+            total_bytes += sys.getsizeof(bucket)
+            total_bytes += sum(sys.getsizeof(entry) for entry in bucket)
+
+        pairs = ((k, v) for bucket in table for k, v, _ in bucket)
+        return build_report(self.count, total_bytes, empty_bytes, 0,
+                            dict_bytes(pairs))
+
+    @property
+    def load_factor(self) -> float:
+        """Коэффициент заполнения таблицы."""
+        return self.count / self.size
+
+    def get_collision_stats(self) -> Tuple[int, float]:
+        """
+        Статистика коллизий.
+
+        Returns:
+            (количество коллизий, средняя длина цепочки)
+        """
+        table, size = self._state
+        collisions = 0
+        total_chain_length = 0
+
+        for bucket in table:
+            if len(bucket) > 1:
+                collisions += len(bucket) - 1
+            total_chain_length += len(bucket)
+
+        avg_chain_length = total_chain_length / size if size else 0
+        return collisions, avg_chain_length
@@ -0,0 +1,452 @@
+"""Реализация хеш-таблицы с кукушкиным хешированием."""
+
+import random
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from hash_functions import SEED_SENSITIVE_FUNCTIONS, seeded_hash_functions
+from hash_memory import build_report, dict_bytes
+
+
+class HashTableCuckoo:
+    """
+    Хеш-таблица с кукушкиным хешированием.
+
+    У каждого ключа ровно num_hashes возможных ячеек - по одной на
+    хеш-функцию, поэтому поиск в худшем случае проверяет эти ячейки
+    и небольшой стэш (stash) и выполняется за O(1). При вставке
+    в занятые ячейки элемент вытесняет жильца, тот переезжает в свою
+    другую ячейку, и так не более max_relocations раз; элемент,
+    которому места не нашлось, кладётся в стэш, а при переполнении
+    стэша таблица растёт.
+
+    Для каждого элемента хранятся полноразрядные хеши всех функций,
+    поэтому перемещения и рост таблицы не хешируют ключи заново.
+    """
+
+    # Наибольшее число удвоений при одном перестроении таблицы
+    MAX_RESIZE_ATTEMPTS = 4
+
+    def __init__(self, size: int = 101,
+                 hash_funcs: Sequence[str] = ('fnv1a', 'djb2'),
+                 load_factor_threshold: Optional[float] = None,
+                 max_relocations: int = 32, stash_size: int = 4,
+                 seed: Optional[int] = None):
+        """
+        Инициализация хеш-таблицы.
+
+        Args:
+            size: Начальный размер таблицы
+            hash_funcs: Имена хеш-функций (не меньше двух). Повторять
+                можно только функции из SEED_SENSITIVE_FUNCTIONS: зёрна
+                у повторов разные, но у остальных функций зерно
+                не меняет коллизий, и такие ключи не разместить
+            load_factor_threshold: Порог для роста таблицы; по умолчанию
+                0.45 для двух функций и 0.85 для трёх и более
+            max_relocations: Наибольшая длина цепочки вытеснений
+            stash_size: Размер стэша
+            seed: Зерно первой хеш-функции (остальные выводятся из него);
+                по умолчанию - случайное
+        """
+        if len(hash_funcs) < 2:
+            raise ValueError("Нужно не меньше двух хеш-функций")
+        for name in set(hash_funcs):
+            if (list(hash_funcs).count(name) > 1
+                    and name not in SEED_SENSITIVE_FUNCTIONS):
+                raise ValueError(f"Хеш-функцию '{name}' нельзя повторять: "
+                                 f"зерно не меняет её коллизий")
+        if load_factor_threshold is None:
+            load_factor_threshold = 0.45 if len(hash_funcs) == 2 else 0.85
+
+        self.count = 0
+        self.load_factor_threshold = load_factor_threshold
+        self.max_relocations = max_relocations
+        self.stash_size = stash_size
+        self.num_hashes = len(hash_funcs)
+        self.relocation_count = 0
+        self._stash: List[Tuple[Any, Any, Tuple[int, ...]]] = []
+        self._allocate(size)
+
+        # Выбор хеш-функций: у каждой своё зерно
+        self.hash_func_names = list(hash_funcs)
+        self.seeds = []
+        self.hash_funcs = []
+        self.batch_hash_funcs = []
+        for i, name in enumerate(hash_funcs):
+            func_seed, hash_func, batch_hash_func = seeded_hash_functions(
+                name, None if seed is None else seed + i
+            )
+            self.seeds.append(func_seed)
+            self.hash_funcs.append(hash_func)
+            self.batch_hash_funcs.append(batch_hash_func)
+        self._rng = random.Random(self.seeds[0])
+
+    def _allocate(self, size: int) -> None:
+        """Создание пустых массивов на size ячеек."""
+        self.size = size
+        self._keys: List[Any] = [None] * size
+        self._values: List[Any] = [None] * size
+        self._hashes = [array('Q', bytes(8 * size))
+                        for _ in range(self.num_hashes)]
+        self._occupied = bytearray(size)
+
+    def _key_hashes(self, key: Any) -> Tuple[int, ...]:
+        """Хеши ключа всеми функциями."""
+        return tuple(hash_func(key) for hash_func in self.hash_funcs)
+
+    def _write(self, slot: int, key: Any, value: Any,
+               hashes: Tuple[int, ...]) -> None:
+        """Запись элемента в ячейку."""
+        self._keys[slot] = key
+        self._values[slot] = value
+        for table_hashes, key_hash in zip(self._hashes, hashes):
+            table_hashes[slot] = key_hash
+        self._occupied[slot] = 1
+
+    def _find(self, key: Any, hashes: Tuple[int, ...]) -> int:
+        """
+        Поиск ячейки с ключом.
+
+        Returns:
+            Индекс ячейки, -(i + 2) для i-го элемента стэша или -1
+        """
+        size = self.size
+        for table_hashes, key_hash in zip(self._hashes, hashes):
+            slot = key_hash % size
+            if (self._occupied[slot] and table_hashes[slot] == key_hash
+                    and self._keys[slot] == key):
+                return slot
+        for i, (stashed_key, _, stashed_hashes) in enumerate(self._stash):
+            if stashed_hashes == hashes and stashed_key == key:
+                return -(i + 2)
+        return -1
+
+    def _place(self, key: Any, value: Any,
+               hashes: Tuple[int, ...]) -> Optional[tuple]:
+        """
+        Размещение нового элемента с вытеснениями.
+
+        Returns:
+            None при успехе; иначе элемент (ключ, значение, хеши),
+            оставшийся без места после исчерпания вытеснений при полном
+            стэше - это не обязательно вставляемый элемент
+        """
+        size = self.size
+        occupied = self._occupied
+        candidates = [key_hash % size for key_hash in hashes]
+        for slot in candidates:
+            if not occupied[slot]:
+                self._write(slot, key, value, hashes)
+                return None
+
+        slot = self._rng.choice(candidates)
+        for _ in range(self.max_relocations):
+            # Вытеснение жильца ячейки, элемент в руке занимает его место
+            evicted = (self._keys[slot], self._values[slot],
+                       tuple(table_hashes[slot]
+                             for table_hashes in self._hashes))
+            self._write(slot, key, value, hashes)
+            self.relocation_count += 1
+            key, value, hashes = evicted
+
+            candidates = [key_hash % size for key_hash in hashes]
+            for candidate in candidates:
+                if not occupied[candidate]:
+                    self._write(candidate, key, value, hashes)
+                    return None
+            others = [candidate for candidate in candidates
+                      if candidate != slot]
+            if not others:
+                break
+            slot = self._rng.choice(others)
+
+        if len(self._stash) < self.stash_size:
+            self._stash.append((key, value, hashes))
+            return None
+        return key, value, hashes
+
+    def _resize(self, new_size: int, pending: Optional[tuple] = None) -> None:
+        """
+        Перестроение таблицы на new_size ячеек по сохранённым хешам.
+
+        Если элементы не помещаются, размер снова удваивается, но не
+        более MAX_RESIZE_ATTEMPTS раз: ключи с одинаковыми хешами всех
+        функций не разместить ни в какой таблице. Тогда таблица
+        остаётся прежней, а pending не вставляется.
+
+        Args:
+            new_size: Новый размер таблицы
+            pending: Элемент (ключ, значение, хеши), ещё не попавший
+                в таблицу
+
+        Raises:
+            RuntimeError: Элементы не удалось разместить
+        """
+        entries = [
+            (self._keys[slot], self._values[slot],
+             tuple(table_hashes[slot] for table_hashes in self._hashes))
+            for slot in range(self.size) if self._occupied[slot]
+        ]
+        entries.extend(self._stash)
+        if pending is not None:
+            entries.append(pending)
+
+        old_state = (self.size, self._keys, self._values, self._hashes,
+                     self._occupied, self._stash)
+        for _ in range(self.MAX_RESIZE_ATTEMPTS):
+            self._allocate(new_size)
+            self._stash = []
+            if all(self._place(*entry) is None for entry in entries):
+                self.count = len(entries)
+                return
+            new_size *= 2
+
+        (self.size, self._keys, self._values, self._hashes,
+         self._occupied, self._stash) = old_state
+        raise RuntimeError("Не удалось разместить элементы: слишком много "
+                           "ключей с одинаковыми хешами всех функций")
+
+    def _reserve(self, required_count: int) -> None:
+        """Рост таблицы так, чтобы required_count элементов помещались
+        без превышения порога заполнения."""
+        new_size = self.size
+        while required_count > new_size * self.load_factor_threshold:
+            new_size *= 2
+        if new_size != self.size:
+            self._resize(new_size)
+
+    def _insert_hashed(self, key: Any, value: Any,
+                       hashes: Tuple[int, ...]) -> None:
+        """Вставка с уже вычисленными хешами."""
+        index = self._find(key, hashes)
+        if index >= 0:
+            self._values[index] = value
+            return
+        if index < -1:
+            stash_index = -index - 2
+            self._stash[stash_index] = (key, value, hashes)
+            return
+
+        if (self.count + 1) / self.size > self.load_factor_threshold:
+            self._resize(self.size * 2)
+        homeless = self._place(key, value, hashes)
+        if homeless is None:
+            self.count += 1
+            return
+
+        # Цепочка вытеснений не сошлась и стэш полон
+        try:
+            self._resize(self.size * 2, homeless)
+        except RuntimeError:
+            self._undo_place(key, hashes, homeless)
+            raise
+
+    def _undo_place(self, key: Any, hashes: Tuple[int, ...],
+                    homeless: tuple) -> None:
+        """
+        Отмена вставки после неудачного перестроения: новый ключ
+        убирается, а вытесненный им старый элемент кладётся в стэш
+        сверх stash_size, чтобы не потерять его.
+        """
+        homeless_key, _, homeless_hashes = homeless
+        if homeless_hashes == hashes and homeless_key == key:
+            return
+
+        index = self._find(key, hashes)
+        if index >= 0:
+            self._keys[index] = None
+            self._values[index] = None
+            self._occupied[index] = 0
+        else:
+            del self._stash[-index - 2]
+        self._stash.append(homeless)
+
+    def insert(self, key: Any, value: Any) -> None:
+        """
+        Вставка элемента в хеш-таблицу.
+
+        Args:
+            key: Ключ
+            value: Значение
+
+        Time Complexity: O(1) в среднем (амортизированно)
+        """
+        self._insert_hashed(key, value, self._key_hashes(key))
+
+    def insert_many(self, pairs: Iterable[Tuple[Any, Any]]) -> None:
+        """
+        Пакетная вставка элементов.
+
+        Таблица один раз увеличивается под итоговое число элементов,
+        хеши всех ключей вычисляются пакетами.
+
+        Args:
+            pairs: Пары (ключ, значение)
+
+        Time Complexity: O(n) в среднем
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return
+
+        self._reserve(self.count + len(pairs))
+        keys = [key for key, _ in pairs]
+        hashes = zip(*(batch_hash_func(keys).tolist()
+                       for batch_hash_func in self.batch_hash_funcs))
+        for (key, value), key_hashes in zip(pairs, hashes):
+            self._insert_hashed(key, value, key_hashes)
+
+    def search(self, key: Any) -> Optional[Any]:
+        """
+        Поиск элемента по ключу.
+
+        Хеши вычисляются по мере надобности: если ключ лежит в ячейке
+        первой функции, остальные не вычисляются.
+
+        Args:
+            key: Ключ для поиска
+
+        Returns:
+            Найденное значение или None
+
+        Time Complexity: O(1) в худшем случае
+        """
+        size = self.size
+        for hash_func, table_hashes in zip(self.hash_funcs, self._hashes):
+            key_hash = hash_func(key)
+            slot = key_hash % size
+            if (self._occupied[slot] and table_hashes[slot] == key_hash
+                    and self._keys[slot] == key):
+                return self._values[slot]
+        for stashed_key, stashed_value, _ in self._stash:
+            if stashed_key == key:
+                return stashed_value
+        return None
+
+    def search_many(self, keys: Iterable[Any]) -> List[Optional[Any]]:
+        """
+        Пакетный поиск элементов.
+
+        Args:
+            keys: Ключи для поиска
+
+        Returns:
+            Список найденных значений (None для отсутствующих ключей)
+        """
+        keys = list(keys)
+        hashes = zip(*(batch_hash_func(keys).tolist()
+                       for batch_hash_func in self.batch_hash_funcs))
+        results = []
+
+        for key, key_hashes in zip(keys, hashes):
+            index = self._find(key, key_hashes)
+            if index >= 0:
+                results.append(self._values[index])
+            elif index < -1:
+                results.append(self._stash[-index - 2][1])
+            else:
+                results.append(None)
+        return results
+
+    def delete(self, key: Any) -> bool:
+        """
+        Удаление элемента по ключу.
+
+        Освободившаяся ячейка может принять элемент из стэша.
+
+        Args:
+            key: Ключ для удаления
+
+        Returns:
+            True если элемент удален, False если не найден
+
+        Time Complexity: O(1) в худшем случае
+        """
+        index = self._find(key, self._key_hashes(key))
+        if index == -1:
+            return False
+
+        self.count -= 1
+        if index < -1:
+            del self._stash[-index - 2]
+            return True
+
+        self._keys[index] = None
+        self._values[index] = None
+        self._occupied[index] = 0
+        for i, (stashed_key, stashed_value, hashes) in enumerate(self._stash):
+            if any(key_hash % self.size == index for key_hash in hashes):
+                del self._stash[i]
+                self._write(index, stashed_key, stashed_value, hashes)
+                break
+        return True
+
+    def memory_report(self) -> Dict[str, float]:
+        """
+        Память, занимаемая структурами таблицы.
+
+        Ячейка стоит две ссылки (ключ, значение), по 8 байт на хеш
+        каждой функции и байт занятости; стэш - список кортежей.
+
+        Returns:
+            Отчёт build_report: байт всего и на элемент, потери
+            на пустые ячейки, сравнение с dict
+        """
+        parts = [self._keys, self._values, self._occupied, *self._hashes]
+        slots_bytes = sum(map(sys.getsizeof, parts))
+        total_bytes = slots_bytes + sys.getsizeof(self._stash)
+        total_bytes += sum(sys.getsizeof(entry) for entry in self._stash)
+        slot_bytes = slots_bytes / self.size
+
+        pairs = [(self._keys[slot], self._values[slot])
+                 for slot in range(self.size) if self._occupied[slot]]
+        pairs.extend((key, value) for key, value, _ in self._stash)
+        empty_slots = self.size - self._occupied.count(1)
+        return build_report(self.count, total_bytes,
+                            int(empty_slots * slot_bytes), 0,
+                            dict_bytes(pairs))
+
+    @property
+    def load_factor(self) -> float:
+        """Коэффициент заполнения таблицы."""
+        return self.count / self.size
+
+    def get_collision_stats(
+        self, histogram: bool = False
+    ) -> Union[Tuple[int, int], Tuple[int, int, Dict[int, int]]]:
+        """
+        Статистика коллизий.
+
+        Длина пробирования элемента - номер хеш-функции, чья ячейка
+        им занята (0 - первая); элементы стэша имеют длину num_hashes.
+
+        Args:
+            histogram: Добавить гистограмму длин пробирования
+
+        Returns:
+            (количество коллизий, максимальная длина пробирования)
+            или, при histogram=True,
+            (количество коллизий, максимальная длина пробирования,
+             {длина пробирования: число элементов})
+        """
+        probe_histogram: Dict[int, int] = {}
+        size = self.size
+
+        for slot in range(size):
+            if self._occupied[slot]:
+                probe_length = next(
+                    i for i, table_hashes in enumerate(self._hashes)
+                    if table_hashes[slot] % size == slot
+                )
+                probe_histogram[probe_length] = (
+                    probe_histogram.get(probe_length, 0) + 1
+                )
+        if self._stash:
+            probe_histogram[self.num_hashes] = len(self._stash)
+
+        collisions = sum(count for probe_length, count
+                         in probe_histogram.items() if probe_length)
+        max_probe_length = max(probe_histogram, default=0)
+        if histogram:
+            return collisions, max_probe_length, probe_histogram
+        return collisions, max_probe_length
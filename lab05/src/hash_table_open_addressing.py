@@ -1,69 +1,403 @@
 """Реализация хеш-таблицы с открытой адресацией."""
 
-from typing import Any, Optional, Tuple
-from hash_functions import simple_hash, polynomial_hash, djb2_hash
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from hash_functions import seeded_hash_functions
+from hash_memory import POINTER_SIZE, build_report, dict_bytes
 
 
-class HashItem:
-    """Элемент хеш-таблицы для открытой адресации."""
-
-    def __init__(self, key: Optional[str] = None, value: Any = None):
-        self.key = key
-        self.value = value
-        self.is_deleted = False
+# Состояния ячеек таблицы
+EMPTY = 0
+OCCUPIED = 1
+DELETED = 2
 
 
 class HashTableOpenAddressing:
-    """Хеш-таблица с открытой адресацией."""
+    """
+    Хеш-таблица с открытой адресацией.
+
+    Ячейки хранятся не объектами, а параллельными плоскими массивами:
+    ключи, значения, закешированные хеши и состояние ячейки
+    (пустая / занятая / удалённая). Это убирает по одному Python-объекту
+    на ячейку и обращения к атрибутам при пробировании.
+
+    Хеш хранится полноразрядным, поэтому при изменении размера
+    таблицы ключи заново не хешируются.
+
+    Методы пробирования:
+        'linear' - линейное, шаг 1;
+        'double' - двойное хеширование, шаг выводится из того же хеша;
+        'quadratic' - квадратичное по треугольным числам, размер таблицы
+            округляется до степени двойки, чтобы обойти все ячейки;
+        'robin_hood' - линейное с вытеснением "богатых" элементов
+            и удалением обратным сдвигом вместо надгробий.
+
+    При incremental_resize=True рост таблицы не перехеширует всё сразу:
+    старые массивы остаются рядом с новыми, поиск и удаление смотрят
+    в обе таблицы, а каждая операция переносит не более migrate_step
+    ячеек старой таблицы. Перенесённая ячейка старой таблицы
+    превращается в надгробие, поэтому её цепочки пробирования
+    остаются корректными до конца переноса.
+
+    Политика удаления: если доля надгробий превышает
+    tombstone_threshold, таблица постепенно переносится в таблицу того же
+    размера (надгробия при этом отбрасываются); если заполнение падает
+    ниже shrink_threshold, таблица так же постепенно уменьшается
+    делением пополам, но не меньше начального размера.
+    """
 
     def __init__(self, size: int = 101, hash_func: str = 'simple',
-                    probing='linear', load_factor=0.7):
+                 probing_method: str = 'linear',
+                 load_factor_threshold: float = 0.7,
+                 incremental_resize: bool = False, migrate_step: int = 4,
+                 shrink_threshold: float = 0.1,
+                 tombstone_threshold: float = 0.2,
+                 seed: Optional[int] = None):
         """
         Инициализация хеш-таблицы.
 
         Args:
             size: Начальный размер таблицы (простое число)
             hash_func: Используемая хеш-функция
-            probing_method: Метод пробирования ('linear', 'double')
+            probing_method: Метод пробирования
+                ('linear', 'double', 'quadratic', 'robin_hood')
             load_factor_threshold: Порог коэффициента заполнения
+            incremental_resize: Постепенный перенос элементов при росте
+            migrate_step: Число ячеек, переносимых за одну операцию
+            shrink_threshold: Нижний порог заполнения для уменьшения
+                таблицы (0 - не уменьшать)
+            tombstone_threshold: Доля надгробий, после которой
+                начинается их постепенная очистка
+            seed: Зерно хеш-функции (по умолчанию - случайное)
         """
-        self.size = size
+        if probing_method not in ('linear', 'double', 'quadratic',
+                                  'robin_hood'):
+            raise ValueError("Неизвестный метод пробирования")
+        if probing_method == 'quadratic':
+            size = 1 << (size - 1).bit_length()
+
         self.count = 0
         self.deleted_count = 0
         self.load_factor_threshold = load_factor_threshold
         self.probing_method = probing_method
-        self.table = [HashItem() for _ in range(size)]
+        self._step_growth = 1 if probing_method == 'quadratic' else 0
+        self._allocate(size)
+
+        # Состояние постепенного перехеширования
+        self.incremental_resize = incremental_resize
+        self.migrate_step = migrate_step
+        self._old_table: Optional[HashTableOpenAddressing] = None
+        self._migrate_index = 0
+
+        # Политика уменьшения и очистки надгробий
+        self.shrink_threshold = shrink_threshold
+        self.tombstone_threshold = tombstone_threshold
+        self.min_size = size
+        self.shrink_count = 0
+        self.compaction_count = 0
 
         # Выбор хеш-функции
-        hash_functions = {
-            'simple': simple_hash,
-            'polynomial': polynomial_hash,
-            'djb2': djb2_hash
-        }
-        self.hash_func = hash_functions[hash_func]
+        self.hash_func_name = hash_func
+        self.seed, self.hash_func, self.batch_hash_func = \
+            seeded_hash_functions(hash_func, seed)
+
+    def _allocate(self, size: int) -> None:
+        """Выделение пустых массивов ячеек заданного размера."""
+        self.size = size
+        self._keys = [None] * size
+        self._values = [None] * size
+        self._hashes = array('Q', bytes(8 * size))
+        self._states = bytearray(size)
+
+    def _probe_start(self, key_hash: int) -> Tuple[int, int]:
+        """Начальная ячейка и шаг пробирования для хеша ключа."""
+        home = key_hash % self.size
+        if self.probing_method == 'double':
+            return home, 1 + key_hash % (self.size - 1)
+        return home, 1
 
     def _hash(self, key: str, attempt: int = 0) -> int:
         """Вычисление хеша с учетом номера попытки."""
-        if self.probing_method == 'linear':
-            return (self.hash_func(key, self.size) + attempt) % self.size
-        elif self.probing_method == 'double':
-            h1 = self.hash_func(key, self.size)
-            h2 = 1 + (self.hash_func(key, self.size - 1))
-            return (h1 + attempt * h2) % self.size
-        else:
-            raise ValueError("Неизвестный метод пробирования")
+        home, step = self._probe_start(self.hash_func(key))
+        if self._step_growth:
+            return (home + attempt * (attempt + 1) // 2) % self.size
+        return (home + attempt * step) % self.size
+
+    def _probe_length(self, index: int, key_hash: int) -> int:
+        """Номер попытки, на которой ключ с данным хешем попадает в ячейку."""
+        size = self.size
+        if self.probing_method in ('linear', 'robin_hood'):
+            return (index - key_hash) % size
+
+        current, step = self._probe_start(key_hash)
+        growth = self._step_growth
+        for attempt in range(size):
+            if current == index:
+                return attempt
+            current = (current + step) % size
+            step += growth
+        return size
+
+    def _find(self, key: str, key_hash: int) -> Tuple[int, int]:
+        """
+        Проход по последовательности пробирования ключа.
+
+        Returns:
+            (индекс ячейки с ключом или -1,
+             индекс первой свободной ячейки или -1)
+        """
+        if self.probing_method == 'robin_hood':
+            return self._find_robin_hood(key, key_hash)
+
+        keys = self._keys
+        hashes = self._hashes
+        states = self._states
+        size = self.size
+        first_free = -1
+        index, step = self._probe_start(key_hash)
+        growth = self._step_growth
+
+        for _ in range(size):
+            state = states[index]
+            if state == EMPTY:
+                if first_free < 0:
+                    first_free = index
+                return -1, first_free
+            if state == DELETED:
+                if first_free < 0:
+                    first_free = index
+            elif hashes[index] == key_hash and keys[index] == key:
+                return index, first_free
+            index = (index + step) % size
+            step += growth
+
+        return -1, first_free
+
+    def _find_robin_hood(self, key: str, key_hash: int) -> Tuple[int, int]:
+        """
+        Поиск при пробировании Robin Hood.
+
+        Поиск прекращается, как только встречается элемент, сдвинутый
+        от своей начальной ячейки меньше, чем искомый ключ на этом шаге:
+        при вставке такой элемент был бы вытеснен.
+        """
+        keys = self._keys
+        hashes = self._hashes
+        states = self._states
+        size = self.size
+        index = key_hash % size
+
+        for distance in range(size):
+            if states[index] == EMPTY:
+                return -1, index
+            slot_hash = hashes[index]
+            if (index - slot_hash) % size < distance:
+                return -1, index
+            if slot_hash == key_hash and keys[index] == key:
+                return index, -1
+            index = (index + 1) % size
+
+        return -1, -1
+
+    def _place(self, key: str, value: Any, key_hash: int) -> bool:
+        """
+        Размещение заведомо отсутствующего ключа в таблице без удалений.
+
+        Returns:
+            False, если последовательность пробирования не нашла места
+        """
+        if self.probing_method == 'robin_hood':
+            return self._place_robin_hood(key, value, key_hash)
+
+        states = self._states
+        size = self.size
+        index, step = self._probe_start(key_hash)
+        growth = self._step_growth
+
+        for _ in range(size):
+            if states[index] == EMPTY:
+                self._keys[index] = key
+                self._values[index] = value
+                self._hashes[index] = key_hash
+                states[index] = OCCUPIED
+                return True
+            index = (index + step) % size
+            step += growth
+
+        return False
+
+    def _place_robin_hood(self, key: str, value: Any, key_hash: int) -> bool:
+        """
+        Размещение с вытеснением: элемент, ушедший от своей начальной
+        ячейки дальше, занимает место элемента, ушедшего ближе,
+        а вытесненный элемент продолжает пробирование.
+        """
+        keys = self._keys
+        values = self._values
+        hashes = self._hashes
+        states = self._states
+        size = self.size
+        index = key_hash % size
+        distance = 0
+
+        for _ in range(size):
+            if states[index] == EMPTY:
+                keys[index] = key
+                values[index] = value
+                hashes[index] = key_hash
+                states[index] = OCCUPIED
+                return True
+            slot_distance = (index - hashes[index]) % size
+            if slot_distance < distance:
+                key, keys[index] = keys[index], key
+                value, values[index] = values[index], value
+                key_hash, hashes[index] = hashes[index], key_hash
+                distance = slot_distance
+            index = (index + 1) % size
+            distance += 1
+
+        return False
+
+    def _remove_robin_hood(self, index: int) -> None:
+        """Удаление обратным сдвигом: хвост кластера сдвигается на место."""
+        keys = self._keys
+        values = self._values
+        hashes = self._hashes
+        states = self._states
+        size = self.size
+        next_index = (index + 1) % size
+
+        while (states[next_index] == OCCUPIED
+               and (next_index - hashes[next_index]) % size != 0):
+            keys[index] = keys[next_index]
+            values[index] = values[next_index]
+            hashes[index] = hashes[next_index]
+            index = next_index
+            next_index = (next_index + 1) % size
+
+        keys[index] = None
+        values[index] = None
+        states[index] = EMPTY
 
     def _resize(self, new_size: int) -> None:
-        """Изменение размера таблицы и перехеширование."""
-        old_table = self.table
-        self.size = new_size
-        self.table = [HashItem() for _ in range(new_size)]
-        self.count = 0
+        """
+        Изменение размера таблицы.
+
+        Занятые ячейки переносятся за один проход по сохранённым хешам,
+        без повторного хеширования ключей и проверок заполнения.
+        """
+        self._finish_migration()
+        old_keys = self._keys
+        old_values = self._values
+        old_hashes = self._hashes
+        occupied = [i for i, state in enumerate(self._states)
+                    if state == OCCUPIED]
+
+        while True:
+            self._allocate(new_size)
+            if all(self._place(old_keys[i], old_values[i], old_hashes[i])
+                   for i in occupied):
+                break
+            # Шаг двойного хеширования не покрыл таблицу - увеличиваем
+            new_size *= 2
+
+        self.deleted_count = 0
+
+    def _detach(self) -> 'HashTableOpenAddressing':
+        """Отдельная таблица над текущими массивами ячеек."""
+        old_table = object.__new__(HashTableOpenAddressing)
+        old_table.__dict__.update(self.__dict__)
+        old_table._old_table = None
+        return old_table
+
+    def _start_migration(self, new_size: int) -> None:
+        """Начало постепенного переноса элементов в таблицу нового размера."""
+        self._finish_migration()
+        self._old_table = self._detach()
+        self._migrate_index = 0
+        self._allocate(new_size)
         self.deleted_count = 0
 
-        for item in old_table:
-            if item.key is not None and not item.is_deleted:
-                self.insert(item.key, item.value)
+    def _migrate(self, steps: Optional[int] = None) -> None:
+        """
+        Перенос очередных ячеек старой таблицы в новую.
+
+        Args:
+            steps: Число просматриваемых ячеек (None - все оставшиеся)
+        """
+        old_table = self._old_table
+        if old_table is None:
+            return
+
+        start = self._migrate_index
+        end = old_table.size
+        if steps is not None:
+            end = min(start + steps, end)
+        self._migrate_index = end
+
+        old_keys = old_table._keys
+        old_values = old_table._values
+        old_states = old_table._states
+        for i in range(start, end):
+            if old_states[i] == OCCUPIED:
+                key, value = old_keys[i], old_values[i]
+                old_keys[i] = None
+                old_values[i] = None
+                old_states[i] = DELETED
+                key_hash = old_table._hashes[i]
+                if not self._place(key, value, key_hash):
+                    # _insert_hashed снова учтёт элемент в count
+                    self.count -= 1
+                    self._insert_hashed(key, value, key_hash)
+
+        if end == old_table.size and self._old_table is old_table:
+            self._old_table = None
+            if steps is not None:
+                # Перенос завершён обычной операцией - политика могла
+                # отложить уменьшение или очистку до этого момента
+                self._apply_delete_policy()
+
+    def _finish_migration(self) -> None:
+        """Завершение незаконченного постепенного перехеширования."""
+        self._migrate()
+
+    def _reserve(self, required_count: int) -> None:
+        """Однократное увеличение таблицы под заданное число элементов."""
+        new_size = self.size
+        while required_count / new_size > self.load_factor_threshold:
+            new_size *= 2
+        if new_size != self.size:
+            self._resize(new_size)
+
+    def _insert_hashed(self, key: str, value: Any, key_hash: int) -> None:
+        """Вставка элемента с уже вычисленным хешем без проверки заполнения."""
+        index, free = self._find(key, key_hash)
+
+        if index >= 0:
+            # Обновление существующего ключа
+            self._values[index] = value
+            return
+
+        if self.probing_method == 'robin_hood':
+            if self.count < self.size and self._place(key, value, key_hash):
+                self.count += 1
+                return
+            free = -1
+
+        if free < 0:
+            # Если не нашли место - рехеширование
+            self._resize(self.size * 2)
+            self._insert_hashed(key, value, key_hash)
+            return
+
+        if self._states[free] == DELETED:
+            self.deleted_count -= 1
+        self._keys[free] = key
+        self._values[free] = value
+        self._hashes[free] = key_hash
+        self._states[free] = OCCUPIED
+        self.count += 1
 
     def insert(self, key: str, value: Any) -> None:
         """
@@ -75,35 +409,54 @@ class HashTableOpenAddressing:
 
         Time Complexity: O(1) в среднем, O(n) в худшем случае
         """
+        self._migrate(self.migrate_step)
+
         # Проверка необходимости рехеширования
         if self.effective_load_factor > self.load_factor_threshold:
-            self._resize(self.size * 2)
+            if self.incremental_resize:
+                self._start_migration(self.size * 2)
+            else:
+                self._resize(self.size * 2)
+
+        key_hash = self.hash_func(key)
+        old_table = self._old_table
+        if old_table is not None:
+            # Ключ, ещё не перенесённый из старой таблицы, обновляется на месте
+            index, _ = old_table._find(key, key_hash)
+            if index >= 0:
+                old_table._values[index] = value
+                return
 
-        attempt = 0
-        while attempt < self.size:
-            index = self._hash(key, attempt)
-            item = self.table[index]
+        self._insert_hashed(key, value, key_hash)
 
-            if item.key is None or item.is_deleted:
-                # Нашли свободную ячейку
-                item.key = key
-                item.value = value
-                item.is_deleted = False
-                self.count += 1
-                if item.key is None:  # Была полностью пустая ячейка
-                    self.count += 0  # Уже учтено в self.count
-                return
-            elif item.key == key:
-                # Обновление существующего ключа
-                item.value = value
-                item.is_deleted = False
-                return
+    def insert_many(self, pairs: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Пакетная вставка элементов.
 
-            attempt += 1
+        Таблица один раз увеличивается под итоговое число элементов,
+        хеши всех ключей вычисляются одним пакетом. Повторяющиеся ключи
+        перезаписываются так же, как при insert.
 
-        # Если не нашли место - рехеширование
-        self._resize(self.size * 2)
-        self.insert(key, value)
+        Args:
+            pairs: Пары (ключ, значение)
+
+        Time Complexity: O(n) в среднем
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return
+
+        self._insert_many_hashed(
+            pairs, self.batch_hash_func([key for key, _ in pairs]).tolist()
+        )
+
+    def _insert_many_hashed(self, pairs: List[Tuple[str, Any]],
+                            hashes: List[int]) -> None:
+        """Пакетная вставка пар с уже вычисленными хешами."""
+        self._finish_migration()
+        self._reserve(self.count + len(pairs))
+        for (key, value), key_hash in zip(pairs, hashes):
+            self._insert_hashed(key, value, key_hash)
 
     def search(self, key: str) -> Optional[Any]:
         """
@@ -117,21 +470,45 @@ class HashTableOpenAddressing:
 
         Time Complexity: O(1) в среднем, O(n) в худшем случае
         """
-        attempt = 0
-        while attempt < self.size:
-            index = self._hash(key, attempt)
-            item = self.table[index]
+        self._migrate(self.migrate_step)
+        key_hash = self.hash_func(key)
+        index, _ = self._find(key, key_hash)
+        if index >= 0:
+            return self._values[index]
+
+        old_table = self._old_table
+        if old_table is not None:
+            index, _ = old_table._find(key, key_hash)
+            if index >= 0:
+                return old_table._values[index]
+        return None
 
-            if item.key is None and not item.is_deleted:
-                # Достигли пустой ячейки
-                return None
-            elif item.key == key and not item.is_deleted:
-                # Нашли ключ
-                return item.value
+    def search_many(self, keys: Iterable[str]) -> List[Optional[Any]]:
+        """
+        Пакетный поиск элементов.
 
-            attempt += 1
+        Args:
+            keys: Ключи для поиска
 
-        return None
+        Returns:
+            Список найденных значений (None для отсутствующих ключей)
+        """
+        keys = list(keys)
+        return self._search_many_hashed(
+            keys, self.batch_hash_func(keys).tolist()
+        )
+
+    def _search_many_hashed(self, keys: List[str],
+                            hashes: List[int]) -> List[Optional[Any]]:
+        """Пакетный поиск ключей с уже вычисленными хешами."""
+        self._finish_migration()
+        values = self._values
+        results = []
+
+        for key, key_hash in zip(keys, hashes):
+            index, _ = self._find(key, key_hash)
+            results.append(values[index] if index >= 0 else None)
+        return results
 
     def delete(self, key: str) -> bool:
         """
@@ -145,27 +522,113 @@ class HashTableOpenAddressing:
 
         Time Complexity: O(1) в среднем, O(n) в худшем случае
         """
-        attempt = 0
-        while attempt < self.size:
-            index = self._hash(key, attempt)
-            item = self.table[index]
-
-            if item.key is None and not item.is_deleted:
+        self._migrate(self.migrate_step)
+        return self._delete_hashed(key, self.hash_func(key))
+
+    def _delete_hashed(self, key: str, key_hash: int) -> bool:
+        """Удаление ключа с уже вычисленным хешем."""
+        index, _ = self._find(key, key_hash)
+        if index < 0:
+            old_table = self._old_table
+            if old_table is None:
+                return False
+            index, _ = old_table._find(key, key_hash)
+            if index < 0:
                 return False
-            elif item.key == key and not item.is_deleted:
-                item.is_deleted = True
-                self.count -= 1
-                self.deleted_count += 1
+            # В старой таблице только надгробие: она дочитывается до конца
+            old_table._keys[index] = None
+            old_table._values[index] = None
+            old_table._states[index] = DELETED
+            self.count -= 1
+            return True
+
+        if self.probing_method == 'robin_hood':
+            self._remove_robin_hood(index)
+        else:
+            self._keys[index] = None
+            self._values[index] = None
+            self._states[index] = DELETED
+            self.deleted_count += 1
+        self.count -= 1
+
+        self._apply_delete_policy()
+        return True
+
+    def _apply_delete_policy(self) -> None:
+        """Запуск постепенного уменьшения таблицы или очистки надгробий."""
+        if self._old_table is not None:
+            return
+
+        target_size = self._shrink_target()
+        if (target_size < self.size
+                and self.count < self.size * self.shrink_threshold):
+            self.shrink_count += 1
+            self._start_migration(target_size)
+        elif self.deleted_count > self.size * self.tombstone_threshold:
+            self.compaction_count += 1
+            self._start_migration(target_size)
+
+    def _shrink_target(self) -> int:
+        """
+        Размер после уменьшения: таблица делится пополам, пока заполнение
+        не превысит половину порога роста или не достигнут начальный размер.
+        """
+        new_size = self.size
+        while (new_size // 2 >= self.min_size
+               and self.count <= new_size // 2 * self.load_factor_threshold / 2):
+            new_size //= 2
+        return new_size
 
-                # Периодическая очистка удаленных элементов
-                if self.deleted_count > self.count:
-                    self._resize(self.size)
+    @property
+    def tombstone_density(self) -> float:
+        """Доля ячеек-надгробий в текущей таблице."""
+        return self.deleted_count / self.size
 
-                return True
+    def get_tombstone_stats(self) -> Dict[str, float]:
+        """
+        Статистика надгробий и политики уменьшения.
+
+        Returns:
+            Словарь: число надгробий, их доля, число очисток и уменьшений
+        """
+        return {
+            'deleted_count': self.deleted_count,
+            'tombstone_density': self.tombstone_density,
+            'compaction_count': self.compaction_count,
+            'shrink_count': self.shrink_count
+        }
 
-            attempt += 1
+    def memory_report(self) -> Dict[str, float]:
+        """
+        Память, занимаемая структурами таблицы.
 
-        return False
+        Ячейка стоит две ссылки (ключ, значение), 8 байт хеша и байт
+        состояния; пустые ячейки и надгробия стоят столько же.
+        Во время постепенного переноса учитывается и старая таблица.
+
+        Returns:
+            Отчёт build_report: байт всего и на элемент, потери
+            на пустые ячейки и надгробия, сравнение с dict
+        """
+        total_bytes = 0
+        empty_bytes = 0
+        tombstone_bytes = 0
+        pairs = []
+        for table in (self, self._old_table):
+            if table is None:
+                continue
+            states = table._states
+            slot_bytes = 2 * POINTER_SIZE + table._hashes.itemsize + 1
+            total_bytes += sum(sys.getsizeof(part) for part in (
+                table._keys, table._values, table._hashes, states))
+            empty_bytes += states.count(EMPTY) * slot_bytes
+            tombstone_bytes += states.count(DELETED) * slot_bytes
+            pairs.extend((table._keys[i], table._values[i])
+                         for i, state in enumerate(states)
+                         if state == OCCUPIED)
+
+        return build_report(self.count, total_bytes, empty_bytes,
+                            tombstone_bytes, dict_bytes(pairs))
 
     @property
     def load_factor(self) -> float:
@@ -177,22 +640,37 @@ class HashTableOpenAddressing:
         """Эффективный коэффициент заполнения (без учета удаленных)."""
         return self.count / self.size
 
-    def get_collision_stats(self) -> Tuple[int, int]:
+    def get_collision_stats(
+        self, histogram: bool = False
+    ) -> Union[Tuple[int, int], Tuple[int, int, Dict[int, int]]]:
         """
         Статистика коллизий.
 
+        Args:
+            histogram: Добавить гистограмму длин пробирования
+
         Returns:
             (количество коллизий, максимальная длина пробирования)
+            или, при histogram=True,
+            (количество коллизий, максимальная длина пробирования,
+             {длина пробирования: число элементов})
         """
+        self._finish_migration()
         collisions = 0
         max_probe_length = 0
+        probe_histogram: Dict[int, int] = {}
+        hashes = self._hashes
 
-        for i, item in enumerate(self.table):
-            if item.key is not None and not item.is_deleted:
-                original_index = self._hash(item.key, 0)
-                if original_index != i:
+        for i, state in enumerate(self._states):
+            if state == OCCUPIED:
+                probe_length = self._probe_length(i, hashes[i])
+                if probe_length:
                     collisions += 1
-                    probe_length = abs(i - original_index) % self.size
                     max_probe_length = max(max_probe_length, probe_length)
+                probe_histogram[probe_length] = (
+                    probe_histogram.get(probe_length, 0) + 1
+                )
 
-        return collisions, max_probe_length
\ No newline at end of file
+        if histogram:
+            return collisions, max_probe_length, probe_histogram
+        return collisions, max_probe_length
@@ -0,0 +1,464 @@
+"""Хеш-таблица с открытой адресацией в разделяемой памяти процессов."""
+
+import os
+import struct
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Iterable, List, Optional, Tuple
+
+from hash_functions import seeded_hash_functions
+from hash_table_snapshot import decode_value, encode_value
+
+
+# Формат блока (порядок байтов - little-endian):
+#   заголовок   HEADER: магия, счётчик seqlock, число ячеек, ширина
+#               ключа и значения, число элементов и надгробий, размер
+#               и заполнение арены, имя хеш-функции, зерно
+#   ячейки      capacity x (SLOT + key_width + value_width)
+#   арена       arena_size байт для ключей и значений длиннее ширины
+#               ячейки; в ячейке тогда лежит смещение в арене (u64)
+MAGIC = b'HTSHMEM1'
+HEADER = struct.Struct('<8sQQIIQQQQ16s16s')
+SEQ_OFFSET = 8
+COUNTERS = struct.Struct('<QQ')
+COUNTERS_OFFSET = 32
+ARENA_USED_OFFSET = 56
+
+# Заголовок ячейки: состояние, теги типов ключа и значения, длины, хеш
+SLOT = struct.Struct('<BBBxIIQ')
+_U64 = struct.Struct('<Q')
+
+EMPTY = 0
+OCCUPIED = 1
+DELETED = 2
+
+
+class SharedHashTableOpenAddressing:
+    """
+    Хеш-таблица с линейным пробированием в блоке
+    multiprocessing.shared_memory.
+
+    Ячейки имеют фиксированную ширину: ключ и значение хранятся
+    в кодировке снимка (тег типа + байты) прямо в ячейке, а не
+    помещающиеся - в общей арене переполнения. Процессы-читатели
+    подключаются к блоку по имени и ищут в нём без копий таблицы
+    и без сериализации.
+
+    Писатель один. Он публикует изменения по протоколу seqlock: перед
+    изменением счётчик становится нечётным, после - чётным. Читатель
+    запоминает счётчик, ищет и повторяет поиск, если счётчик был
+    нечётным или изменился. Размер блока фиксирован: таблица не растёт.
+
+    Когда надгробий становится больше доли TOMBSTONE_THRESHOLD ячеек
+    (как tombstone_threshold у HashTableOpenAddressing), писатель
+    перестраивает ячейки на месте, иначе промахи при чередовании
+    вставок и удалений вырождаются в просмотр всей таблицы. Заодно
+    уплотняется арена: место перезаписанных значений освобождается.
+    Та же перестройка запускается, если новому элементу не хватает
+    места в арене.
+    """
+
+    TOMBSTONE_THRESHOLD = 0.2
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        """
+        Используйте create() или attach().
+
+        Args:
+            shm: Блок разделяемой памяти
+            owner: Процесс создал блок и является писателем
+        """
+        self._shm = shm
+        self._buf = shm.buf
+        self.owner = owner
+        self.compaction_count = 0
+
+        (magic, _, capacity, key_width, value_width, _, _, arena_size, _,
+         name, seed) = HEADER.unpack_from(self._buf)
+        if magic != MAGIC:
+            raise ValueError("Блок не является разделяемой хеш-таблицей")
+
+        self.name = shm.name
+        self.capacity = capacity
+        self.key_width = key_width
+        self.value_width = value_width
+        self.arena_size = arena_size
+        self.slot_size = SLOT.size + key_width + value_width
+        self._arena_offset = HEADER.size + capacity * self.slot_size
+        self.hash_func_name = name.rstrip(b'\x00').decode('ascii')
+        self.seed, self.hash_func, self.batch_hash_func = \
+            seeded_hash_functions(self.hash_func_name,
+                                  int.from_bytes(seed, 'little'))
+
+    @classmethod
+    def create(cls, capacity: int = 1024, key_width: int = 32,
+               value_width: int = 32, arena_size: int = 1 << 20,
+               hash_func: str = 'fnv1a', seed: Optional[int] = None,
+               name: Optional[str] = None) -> 'SharedHashTableOpenAddressing':
+        """
+        Создание блока и таблицы-писателя.
+
+        Args:
+            capacity: Число ячеек (постоянно)
+            key_width: Байт под ключ в ячейке (не меньше 8)
+            value_width: Байт под значение в ячейке (не меньше 8)
+            arena_size: Размер арены переполнения в байтах
+            hash_func: Используемая хеш-функция
+            seed: Зерно хеш-функции (по умолчанию - случайное)
+            name: Имя блока (по умолчанию выбирается системой)
+
+        Returns:
+            Таблица, через которую пишет этот процесс
+        """
+        if key_width < 8 or value_width < 8:
+            raise ValueError("Ширина ключа и значения - не меньше 8 байт")
+
+        seed, _, _ = seeded_hash_functions(hash_func, seed)
+        slot_size = SLOT.size + key_width + value_width
+        size = HEADER.size + capacity * slot_size + arena_size
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        shm.buf[:size] = bytes(size)
+        HEADER.pack_into(shm.buf, 0, MAGIC, 0, capacity, key_width,
+                         value_width, 0, 0, arena_size, 0,
+                         hash_func.encode('ascii'),
+                         seed.to_bytes(16, 'little'))
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedHashTableOpenAddressing':
+        """
+        Подключение читателя к существующему блоку.
+
+        SharedMemory регистрирует блок в resource_tracker процесса,
+        и при выходе читателя блок был бы удалён. Регистрация снимается:
+        удаляет блок только писатель.
+
+        Args:
+            name: Имя блока (атрибут name таблицы-писателя)
+
+        Returns:
+            Таблица только для чтения
+        """
+        shm = shared_memory.SharedMemory(name=name)
+        if os.name == 'posix':
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        return cls(shm, owner=False)
+
+    # Протокол seqlock
+
+    def _sequence(self) -> int:
+        """Текущее значение счётчика seqlock."""
+        return _U64.unpack_from(self._buf, SEQ_OFFSET)[0]
+
+    def _publish(self, sequence: int) -> None:
+        """Запись счётчика seqlock."""
+        _U64.pack_into(self._buf, SEQ_OFFSET, sequence)
+
+    def _counters(self) -> Tuple[int, int]:
+        """(число элементов, число надгробий)."""
+        return COUNTERS.unpack_from(self._buf, COUNTERS_OFFSET)
+
+    # Чтение и запись ячеек
+
+    def _slot_offset(self, index: int) -> int:
+        """Смещение ячейки в блоке."""
+        return HEADER.size + index * self.slot_size
+
+    def _read_field(self, offset: int, width: int, length: int) -> memoryview:
+        """Байты ключа или значения: из ячейки или из арены."""
+        if length <= width:
+            return self._buf[offset:offset + length]
+        arena_offset = _U64.unpack_from(self._buf, offset)[0]
+        start = self._arena_offset + arena_offset
+        return self._buf[start:start + length]
+
+    def _write_field(self, offset: int, width: int, data: bytes) -> None:
+        """Запись ключа или значения в ячейку или в арену."""
+        if len(data) <= width:
+            self._buf[offset:offset + len(data)] = data
+            return
+
+        used = _U64.unpack_from(self._buf, ARENA_USED_OFFSET)[0]
+        if used + len(data) > self.arena_size:
+            raise ValueError("Арена переполнения заполнена")
+        start = self._arena_offset + used
+        self._buf[start:start + len(data)] = data
+        _U64.pack_into(self._buf, ARENA_USED_OFFSET, used + len(data))
+        _U64.pack_into(self._buf, offset, used)
+
+    def _arena_needed(self, key_bytes: bytes, value_bytes: bytes) -> int:
+        """Байт арены под ключ и значение, не помещающиеся в ячейку."""
+        needed = 0
+        if len(key_bytes) > self.key_width:
+            needed += len(key_bytes)
+        if len(value_bytes) > self.value_width:
+            needed += len(value_bytes)
+        return needed
+
+    def _compact(self) -> None:
+        """
+        Перестроение ячеек и арены на месте: надгробия отбрасываются,
+        в арену заново записываются только живые ключи и значения.
+        Читатели на время перестроения видят нечётный счётчик и ждут.
+
+        Time Complexity: O(capacity + arena_used)
+        """
+        buf = self._buf
+        entries = []
+        for index in range(self.capacity):
+            offset = self._slot_offset(index)
+            header = SLOT.unpack_from(buf, offset)
+            if header[0] == OCCUPIED:
+                key_len, value_len = header[3], header[4]
+                entries.append((
+                    header,
+                    bytes(self._read_field(offset + SLOT.size,
+                                           self.key_width, key_len)),
+                    bytes(self._read_field(
+                        offset + SLOT.size + self.key_width,
+                        self.value_width, value_len
+                    )),
+                ))
+
+        sequence = self._sequence()
+        self._publish(sequence + 1)
+        try:
+            buf[HEADER.size:self._arena_offset] = bytes(
+                self._arena_offset - HEADER.size
+            )
+            _U64.pack_into(buf, ARENA_USED_OFFSET, 0)
+            for header, key_bytes, value_bytes in entries:
+                index = header[5] % self.capacity
+                while buf[self._slot_offset(index)] != EMPTY:
+                    index = (index + 1) % self.capacity
+                offset = self._slot_offset(index)
+                self._write_field(offset + SLOT.size, self.key_width,
+                                  key_bytes)
+                self._write_field(offset + SLOT.size + self.key_width,
+                                  self.value_width, value_bytes)
+                SLOT.pack_into(buf, offset, *header)
+            COUNTERS.pack_into(buf, COUNTERS_OFFSET, len(entries), 0)
+        finally:
+            self._publish(sequence + 2)
+        self.compaction_count += 1
+
+    def _find(self, key_type: int, key_bytes: bytes,
+              key_hash: int) -> Tuple[int, int]:
+        """
+        Поиск ячейки с ключом.
+
+        Returns:
+            (индекс ячейки с ключом или -1,
+             первая свободная ячейка на пути или -1)
+        """
+        buf = self._buf
+        capacity = self.capacity
+        index = key_hash % capacity
+        first_free = -1
+
+        for _ in range(capacity):
+            offset = self._slot_offset(index)
+            state, slot_key_type, _, key_len, _, slot_hash = \
+                SLOT.unpack_from(buf, offset)
+            if state == EMPTY:
+                return -1, first_free if first_free >= 0 else index
+            if state == DELETED:
+                if first_free < 0:
+                    first_free = index
+            elif (slot_hash == key_hash and slot_key_type == key_type
+                  and key_len == len(key_bytes)
+                  and self._read_field(offset + SLOT.size, self.key_width,
+                                       key_len) == key_bytes):
+                return index, first_free
+            index = (index + 1) % capacity
+        return -1, first_free
+
+    def _read_value(self, index: int) -> Any:
+        """Декодированное значение ячейки."""
+        offset = self._slot_offset(index)
+        _, _, value_type, _, value_len, _ = SLOT.unpack_from(self._buf, offset)
+        data = self._read_field(offset + SLOT.size + self.key_width,
+                                self.value_width, value_len)
+        return decode_value(value_type, bytes(data))
+
+    def _lookup(self, key: Any, key_hash: int) -> Optional[Any]:
+        """
+        Поиск под защитой seqlock с повтором при гонке с писателем.
+
+        При конфликте читатель уступает процессор, чтобы писатель,
+        вытесненный посреди записи, мог её закончить.
+        """
+        key_type, key_bytes = encode_value(key)
+        while True:
+            before = self._sequence()
+            if before & 1:
+                time.sleep(0)
+                continue
+            try:
+                index, _ = self._find(key_type, key_bytes, key_hash)
+                value = self._read_value(index) if index >= 0 else None
+            except (ValueError, IndexError, struct.error,
+                    UnicodeDecodeError):
+                # Прочитана недописанная ячейка; ниже счётчик изменится
+                value = None
+                if self._sequence() == before:
+                    raise
+            if self._sequence() == before:
+                return value
+            time.sleep(0)
+
+    def _require_owner(self) -> None:
+        """Изменять таблицу может только создавший её процесс."""
+        if not self.owner:
+            raise PermissionError("Таблица подключена только для чтения")
+
+    def insert(self, key: Any, value: Any) -> None:
+        """
+        Вставка элемента (только писатель).
+
+        Место в арене под ключ и значение проверяется до записи,
+        поэтому неудачная вставка не занимает арену.
+
+        Args:
+            key: Ключ (None, bool, int, float, str или bytes)
+            value: Значение тех же типов
+
+        Time Complexity: O(1) в среднем
+        """
+        self._require_owner()
+        key_type, key_bytes = encode_value(key)
+        value_type, value_bytes = encode_value(value)
+        key_hash = self.hash_func(key)
+        index, first_free = self._find(key_type, key_bytes, key_hash)
+        count, deleted = self._counters()
+        if index < 0 and (first_free < 0 or count + 1 > self.capacity * 0.9):
+            raise ValueError("Разделяемая таблица заполнена")
+
+        needed = self._arena_needed(key_bytes if index < 0 else b'',
+                                    value_bytes)
+        if self.arena_used + needed > self.arena_size:
+            self._compact()
+            if self.arena_used + needed > self.arena_size:
+                raise ValueError("Арена переполнения заполнена")
+            index, first_free = self._find(key_type, key_bytes, key_hash)
+            count, deleted = self._counters()
+        if index < 0:
+            index = first_free
+
+        sequence = self._sequence()
+        self._publish(sequence + 1)
+        try:
+            offset = self._slot_offset(index)
+            state = self._buf[offset]
+            self._write_field(offset + SLOT.size + self.key_width,
+                              self.value_width, value_bytes)
+            if state != OCCUPIED:
+                self._write_field(offset + SLOT.size, self.key_width,
+                                  key_bytes)
+                COUNTERS.pack_into(self._buf, COUNTERS_OFFSET, count + 1,
+                                   deleted - (state == DELETED))
+            SLOT.pack_into(self._buf, offset, OCCUPIED, key_type,
+                           value_type, len(key_bytes), len(value_bytes),
+                           key_hash)
+        finally:
+            self._publish(sequence + 2)
+
+    def insert_many(self, pairs: Iterable[Tuple[Any, Any]]) -> None:
+        """Пакетная вставка элементов (только писатель)."""
+        for key, value in pairs:
+            self.insert(key, value)
+
+    def delete(self, key: Any) -> bool:
+        """
+        Удаление элемента (только писатель).
+
+        Ячейка становится надгробием; когда их больше доли
+        TOMBSTONE_THRESHOLD, таблица перестраивается.
+
+        Returns:
+            True если элемент удален, False если не найден
+        """
+        self._require_owner()
+        key_type, key_bytes = encode_value(key)
+        index, _ = self._find(key_type, key_bytes, self.hash_func(key))
+        if index < 0:
+            return False
+
+        count, deleted = self._counters()
+        sequence = self._sequence()
+        self._publish(sequence + 1)
+        try:
+            self._buf[self._slot_offset(index)] = DELETED
+            COUNTERS.pack_into(self._buf, COUNTERS_OFFSET, count - 1,
+                               deleted + 1)
+        finally:
+            self._publish(sequence + 2)
+
+        if deleted + 1 > self.capacity * self.TOMBSTONE_THRESHOLD:
+            self._compact()
+        return True
+
+    def search(self, key: Any) -> Optional[Any]:
+        """
+        Поиск элемента по ключу (любой процесс).
+
+        Args:
+            key: Ключ для поиска
+
+        Returns:
+            Найденное значение или None
+
+        Time Complexity: O(1) в среднем
+        """
+        return self._lookup(key, self.hash_func(key))
+
+    def search_many(self, keys: Iterable[Any]) -> List[Optional[Any]]:
+        """Пакетный поиск элементов с пакетным хешированием."""
+        keys = list(keys)
+        return [self._lookup(key, key_hash) for key, key_hash
+                in zip(keys, self.batch_hash_func(keys).tolist())]
+
+    @property
+    def count(self) -> int:
+        """Число элементов в таблице."""
+        return self._counters()[0]
+
+    @property
+    def size(self) -> int:
+        """Число ячеек."""
+        return self.capacity
+
+    @property
+    def load_factor(self) -> float:
+        """Коэффициент заполнения таблицы."""
+        return self.count / self.capacity
+
+    @property
+    def arena_used(self) -> int:
+        """Занято байт в арене переполнения."""
+        return _U64.unpack_from(self._buf, ARENA_USED_OFFSET)[0]
+
+    def close(self) -> None:
+        """Отключение от блока; писатель также удаляет блок."""
+        self._buf = None
+        self._shm.close()
+        if not self.owner:
+            return
+
+        name = self._shm._name
+        if os.name == 'posix':
+            # Читатель с общим resource_tracker (в том же процессе или
+            # дочернем) мог снять и регистрацию писателя; повторная
+            # регистрация ничего не меняет, а unlink её снимает
+            resource_tracker.register(name, 'shared_memory')
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            if os.name == 'posix':
+                resource_tracker.unregister(name, 'shared_memory')
+
+    def __enter__(self) -> 'SharedHashTableOpenAddressing':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
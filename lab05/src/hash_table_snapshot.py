@@ -0,0 +1,324 @@
+"""Бинарный снимок хеш-таблицы с методом цепочек и загрузка через mmap."""
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import Any, List, Optional, Tuple
+
+from hash_functions import seeded_hash_functions
+
+
+# Формат файла (все целые - беззнаковые 64-битные, порядок байтов
+# записывается в заголовок):
+#   заголовок            HEADER
+#   bucket_offsets       (size + 1) x u64 - начало цепочки каждой корзины
+#   entry_hashes         count x u64      - сохранённые полноразрядные хеши
+#   blob_offsets         (2 * count + 1) x u64 - границы в blob: ключ
+#                        записи i занимает [2i, 2i + 1], значение -
+#                        [2i + 1, 2i + 2]
+#   key_types            count x u8
+#   value_types          count x u8
+#   blob                 закодированные ключи и значения
+MAGIC = b'HTCHAIN2'
+HEADER = struct.Struct('<8sBxxxxxxxQQ16s16s')
+
+TYPE_NONE = 0
+TYPE_STR = 1
+TYPE_BYTES = 2
+TYPE_INT = 3
+TYPE_FLOAT = 4
+TYPE_BOOL = 5
+
+_FLOAT = struct.Struct('<d')
+_BYTE_ORDERS = {'little': 0, 'big': 1}
+
+
+def encode_value(obj: Any) -> Tuple[int, bytes]:
+    """
+    Кодирование ключа или значения без pickle.
+
+    Args:
+        obj: None, bool, int, float, str или bytes
+
+    Returns:
+        (тег типа, байтовое представление)
+    """
+    if obj is None:
+        return TYPE_NONE, b''
+    if isinstance(obj, bool):
+        return TYPE_BOOL, b'\x01' if obj else b'\x00'
+    if isinstance(obj, int):
+        length = (obj.bit_length() + 8) // 8
+        return TYPE_INT, obj.to_bytes(length, 'little', signed=True)
+    if isinstance(obj, float):
+        return TYPE_FLOAT, _FLOAT.pack(obj)
+    if isinstance(obj, str):
+        return TYPE_STR, obj.encode('utf-8', 'surrogatepass')
+    if isinstance(obj, (bytes, bytearray)):
+        return TYPE_BYTES, bytes(obj)
+    raise TypeError(f"Тип {type(obj).__name__} не поддерживается снимком")
+
+
+def encode_key(key: Any) -> Tuple[int, bytes]:
+    """
+    Кодирование ключа для сравнения: равные числа (True, 1 и 1.0 - один
+    ключ в живой таблице) получают одну запись - тег TYPE_INT.
+
+    Args:
+        key: Ключ
+
+    Returns:
+        (тег типа, байтовое представление)
+    """
+    if isinstance(key, bool) or (isinstance(key, float)
+                                 and key.is_integer()):
+        key = int(key)
+    return encode_value(key)
+
+
+def decode_value(type_tag: int, data: bytes) -> Any:
+    """
+    Декодирование значения, записанного encode_value.
+
+    Args:
+        type_tag: Тег типа
+        data: Байтовое представление
+
+    Returns:
+        Исходный объект
+    """
+    if type_tag == TYPE_STR:
+        return bytes(data).decode('utf-8', 'surrogatepass')
+    if type_tag == TYPE_INT:
+        return int.from_bytes(data, 'little', signed=True)
+    if type_tag == TYPE_BYTES:
+        return bytes(data)
+    if type_tag == TYPE_FLOAT:
+        return _FLOAT.unpack(data)[0]
+    if type_tag == TYPE_BOOL:
+        return data == b'\x01'
+    return None
+
+
+def save_snapshot(table, path: str) -> None:
+    """
+    Запись таблицы с методом цепочек в бинарный файл.
+
+    Сохраняется текущее распределение записей по корзинам вместе
+    с полноразрядными хешами, так что при загрузке ключи не хешируются.
+
+    Args:
+        table: HashTableChaining
+        path: Путь к файлу снимка
+    """
+    name = table.hash_func_name.encode('ascii')
+    if len(name) > 16:
+        raise ValueError(
+            f"Имя хеш-функции длиннее 16 байтов: {table.hash_func_name}"
+        )
+
+    table._finish_migration()
+    size = table.size
+
+    bucket_offsets = array('Q', [0])
+    entry_hashes = array('Q')
+    blob_offsets = array('Q', [0])
+    key_types = bytearray()
+    value_types = bytearray()
+    blob = bytearray()
+
+    for bucket in table.table:
+        for key, value, key_hash in bucket or ():
+            key_type, key_bytes = encode_value(key)
+            value_type, value_bytes = encode_value(value)
+            entry_hashes.append(key_hash)
+            key_types.append(key_type)
+            blob += key_bytes
+            blob_offsets.append(len(blob))
+            value_types.append(value_type)
+            blob += value_bytes
+            blob_offsets.append(len(blob))
+        bucket_offsets.append(len(entry_hashes))
+
+    header = HEADER.pack(MAGIC, _BYTE_ORDERS[sys.byteorder], size,
+                         len(entry_hashes), name,
+                         table.seed.to_bytes(16, 'little'))
+    with open(path, 'wb') as file:
+        file.write(header)
+        for section in (bucket_offsets, entry_hashes, blob_offsets):
+            section.tofile(file)
+        file.write(key_types)
+        file.write(value_types)
+        file.write(blob)
+
+
+class MappedHashTableChaining:
+    """
+    Хеш-таблица с методом цепочек, отображённая из файла снимка.
+
+    Файл отображается в память через mmap, массивы смещений читаются
+    напрямую из отображения, поэтому поиск доступен сразу после
+    открытия, без повторной вставки ключей. Таблица только для чтения;
+    to_table() строит изменяемую HashTableChaining.
+    """
+
+    def __init__(self, path: str):
+        """
+        Открытие снимка.
+
+        Args:
+            path: Путь к файлу снимка
+        """
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, byte_order, size, count, name,
+         seed) = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError("Файл не является снимком хеш-таблицы")
+        if byte_order != _BYTE_ORDERS[sys.byteorder]:
+            raise ValueError("Снимок записан с другим порядком байтов")
+
+        self.size = size
+        self.count = count
+        self.hash_func_name = name.rstrip(b'\x00').decode('ascii')
+        self.seed, self.hash_func, _ = seeded_hash_functions(
+            self.hash_func_name, int.from_bytes(seed, 'little'))
+
+        view = self._view = memoryview(self._mmap)
+        offset = HEADER.size
+        sections = []
+        for length in (size + 1, count, 2 * count + 1):
+            end = offset + 8 * length
+            sections.append(view[offset:end].cast('Q'))
+            offset = end
+        self._bucket_offsets, self._hashes, self._blob_offsets = sections
+        self._key_types = view[offset:offset + count]
+        self._value_types = view[offset + count:offset + 2 * count]
+        self._blob = view[offset + 2 * count:]
+
+    def _find(self, key: Any) -> int:
+        """
+        Индекс записи с ключом или -1.
+
+        Ключи сравниваются в записи encode_key: сохранённый ключ True
+        или 1.0 находится и по 1, как в живой таблице.
+        """
+        key_hash = self.hash_func(key)
+        key_type, key_bytes = encode_key(key)
+        bucket = key_hash % self.size
+        hashes = self._hashes
+        blob_offsets = self._blob_offsets
+
+        for entry in range(self._bucket_offsets[bucket],
+                           self._bucket_offsets[bucket + 1]):
+            if hashes[entry] != key_hash:
+                continue
+            entry_type = self._key_types[entry]
+            if entry_type in (TYPE_BOOL, TYPE_FLOAT):
+                if encode_key(self._key(entry)) == (key_type, key_bytes):
+                    return entry
+            elif (entry_type == key_type
+                  and self._blob[blob_offsets[2 * entry]:
+                                 blob_offsets[2 * entry + 1]] == key_bytes):
+                return entry
+        return -1
+
+    def _key(self, entry: int) -> Any:
+        """Декодированный ключ записи."""
+        start = self._blob_offsets[2 * entry]
+        end = self._blob_offsets[2 * entry + 1]
+        return decode_value(self._key_types[entry], self._blob[start:end])
+
+    def _value(self, entry: int) -> Any:
+        """Декодированное значение записи."""
+        start = self._blob_offsets[2 * entry + 1]
+        end = self._blob_offsets[2 * entry + 2]
+        return decode_value(self._value_types[entry], self._blob[start:end])
+
+    def search(self, key: Any) -> Optional[Any]:
+        """
+        Поиск элемента по ключу.
+
+        Args:
+            key: Ключ для поиска
+
+        Returns:
+            Найденное значение или None
+
+        Time Complexity: O(1) в среднем
+        """
+        entry = self._find(key)
+        return self._value(entry) if entry >= 0 else None
+
+    def search_many(self, keys: List[Any]) -> List[Optional[Any]]:
+        """Поиск нескольких ключей."""
+        return [self.search(key) for key in keys]
+
+    @property
+    def load_factor(self) -> float:
+        """Коэффициент заполнения таблицы."""
+        return self.count / self.size
+
+    def get_collision_stats(self) -> Tuple[int, float]:
+        """
+        Статистика коллизий.
+
+        Returns:
+            (количество коллизий, средняя длина цепочки)
+        """
+        offsets = self._bucket_offsets
+        collisions = 0
+        for bucket in range(self.size):
+            chain_length = offsets[bucket + 1] - offsets[bucket]
+            if chain_length > 1:
+                collisions += chain_length - 1
+        avg_chain_length = self.count / self.size if self.size else 0
+        return collisions, avg_chain_length
+
+    def to_table(self, **kwargs):
+        """
+        Построение изменяемой HashTableChaining из снимка.
+
+        Записи раскладываются по корзинам по сохранённым хешам,
+        ключи заново не хешируются.
+
+        Args:
+            kwargs: Дополнительные параметры конструктора таблицы
+
+        Returns:
+            HashTableChaining с теми же элементами
+        """
+        from hash_table_chaining import HashTableChaining
+
+        table = HashTableChaining(size=self.size,
+                                  hash_func=self.hash_func_name,
+                                  seed=self.seed, **kwargs)
+        for bucket in range(self.size):
+            chain = []
+            for entry in range(self._bucket_offsets[bucket],
+                               self._bucket_offsets[bucket + 1]):
+                chain.append((self._key(entry), self._value(entry),
+                              self._hashes[entry]))
+            if chain:
+                table.table[bucket] = chain
+                if table._index is not None:
+                    for key, _, _ in chain:
+                        table._index.add(key)
+        table.count = self.count
+        return table
+
+    def close(self) -> None:
+        """Освобождение отображения файла."""
+        for view in (self._bucket_offsets, self._hashes, self._blob_offsets,
+                     self._key_types,
+                     self._value_types, self._blob, self._view):
+            view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> 'MappedHashTableChaining':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
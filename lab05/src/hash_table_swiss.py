@@ -0,0 +1,421 @@
+"""Хеш-таблица с открытой адресацией в стиле Swiss table."""
+
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from hash_functions import seeded_hash_functions
+from hash_memory import build_report, dict_bytes
+
+
+# Ячейки разбиты на группы по GROUP_SIZE, у каждой ячейки есть
+# управляющий байт: 0b0hhhhhhh - занята (7 старших битов хеша),
+# CTRL_EMPTY - пуста, CTRL_DELETED - надгробие.
+GROUP_SIZE = 16
+CTRL_EMPTY = 0x80
+CTRL_DELETED = 0xFE
+
+# Константы для побайтовых операций над группой как над 128-битным числом
+LSB = int.from_bytes(b'\x01' * GROUP_SIZE, 'little')
+MSB = LSB << 7
+GROUP_EMPTY = CTRL_EMPTY * LSB
+TAG_SHIFT = 57
+
+MAX_LOAD_FACTOR = 0.875
+
+
+class HashTableSwiss:
+    """
+    Хеш-таблица с открытой адресацией и групповыми метаданными.
+
+    Ячейки разбиты на группы по 16, управляющие байты группы хранятся
+    одним 128-битным числом. Поиск сравнивает 7-битный тег ключа сразу
+    со всеми 16 байтами группы (SWAR: XOR с повторённым тегом и поиск
+    нулевого байта) и сравнивает ключи только в ячейках-кандидатах.
+    Промах заканчивается на первой группе, в которой есть пустая ячейка.
+    При заполнении 0.875 группы заполнены неравномерно (переполнение
+    группы уходит в следующие по пути пробирования), поэтому промах
+    просматривает в среднем от 1.3 до 2.5 группы в зависимости
+    от набора ключей и зерна, а не больше двух групп - от 65 до 95%
+    промахов (probe_groups; замер - measure_high_load_lookups).
+    Теги экономят сравнения ключей, но не шаги интерпретатора: на чистом
+    Python промах при таком заполнении не быстрее, чем в цепочках.
+
+    Группы пробируются квадратично (по треугольным числам), число групп -
+    степень двойки. Номер группы берётся из младших битов хеша, тег -
+    из старших, поэтому нужна хеш-функция с хорошим перемешиванием всех
+    битов (по умолчанию 'fnv1a').
+    """
+
+    def __init__(self, size: int = 101, hash_func: str = 'fnv1a',
+                 load_factor_threshold: float = MAX_LOAD_FACTOR,
+                 seed: Optional[int] = None):
+        """
+        Инициализация хеш-таблицы.
+
+        Args:
+            size: Начальное число ячеек (округляется вверх до степени
+                двойки групп по 16 ячеек)
+            hash_func: Используемая хеш-функция (имя из FULL_HASH_FUNCTIONS)
+            load_factor_threshold: Порог заполнения с учётом надгробий
+                (не больше 0.875, чтобы в таблице оставались пустые ячейки)
+            seed: Зерно хеш-функции (по умолчанию - случайное)
+        """
+        if not 0 < load_factor_threshold <= MAX_LOAD_FACTOR:
+            raise ValueError("Порог заполнения должен быть в (0, 0.875]")
+
+        self.count = 0
+        self.deleted_count = 0
+        self.load_factor_threshold = load_factor_threshold
+        num_groups = max(-(-size // GROUP_SIZE), 1)
+        self._allocate(1 << (num_groups - 1).bit_length())
+
+        # Выбор хеш-функции
+        self.hash_func_name = hash_func
+        self.seed, self.hash_func, self.batch_hash_func = \
+            seeded_hash_functions(hash_func, seed)
+
+    def _allocate(self, num_groups: int) -> None:
+        """Создание пустых массивов на num_groups групп."""
+        self.size = num_groups * GROUP_SIZE
+        self._group_mask = num_groups - 1
+        self._groups = [GROUP_EMPTY] * num_groups
+        self._keys: List[Any] = [None] * self.size
+        self._values: List[Any] = [None] * self.size
+        self._hashes = array('Q', bytes(8 * self.size))
+
+    def _set_ctrl(self, slot: int, ctrl: int) -> None:
+        """Запись управляющего байта ячейки."""
+        group, offset = divmod(slot, GROUP_SIZE)
+        shift = 8 * offset
+        self._groups[group] = ((self._groups[group] & ~(0xFF << shift))
+                               | (ctrl << shift))
+
+    def _find(self, key: Any, key_hash: int) -> int:
+        """
+        Поиск ячейки с ключом.
+
+        Returns:
+            Индекс ячейки или -1
+        """
+        groups = self._groups
+        mask = self._group_mask
+        hashes = self._hashes
+        keys = self._keys
+        pattern = (key_hash >> TAG_SHIFT) * LSB
+        group = key_hash & mask
+        step = 0
+
+        while True:
+            ctrl = groups[group]
+            # Нулевые байты ctrl ^ pattern - ячейки с совпавшим тегом;
+            # ложные срабатывания отсеиваются сравнением хешей
+            diff = ctrl ^ pattern
+            match = (diff - LSB) & ~diff & MSB
+            while match:
+                low = match & -match
+                slot = (group << 4) | ((low.bit_length() >> 3) - 1)
+                if hashes[slot] == key_hash and keys[slot] == key:
+                    return slot
+                match ^= low
+
+            # Есть пустая ячейка - дальше ключ искать не нужно
+            if ctrl & ~(ctrl << 1) & MSB:
+                return -1
+            step += 1
+            group = (group + step) & mask
+
+    def _find_free(self, key_hash: int) -> int:
+        """Первая пустая или удалённая ячейка на пути пробирования."""
+        groups = self._groups
+        mask = self._group_mask
+        group = key_hash & mask
+        step = 0
+
+        while True:
+            free = groups[group] & MSB
+            if free:
+                return (group << 4) | (((free & -free).bit_length() >> 3) - 1)
+            step += 1
+            group = (group + step) & mask
+
+    def _place(self, key: Any, value: Any, key_hash: int) -> None:
+        """Запись нового элемента в свободную ячейку."""
+        slot = self._find_free(key_hash)
+        if self._groups[slot >> 4] >> (8 * (slot & 15)) & 0xFF == CTRL_DELETED:
+            self.deleted_count -= 1
+        self._set_ctrl(slot, key_hash >> TAG_SHIFT)
+        self._keys[slot] = key
+        self._values[slot] = value
+        self._hashes[slot] = key_hash
+        self.count += 1
+
+    def _resize(self, new_size: int) -> None:
+        """
+        Перестроение таблицы на new_size ячеек по сохранённым хешам.
+
+        Надгробия при этом отбрасываются.
+        """
+        old_groups = self._groups
+        old_keys = self._keys
+        old_values = self._values
+        old_hashes = self._hashes
+
+        self._allocate(max(new_size // GROUP_SIZE, 1))
+        self.count = 0
+        self.deleted_count = 0
+
+        for group, ctrl in enumerate(old_groups):
+            full = ~ctrl & MSB
+            while full:
+                low = full & -full
+                slot = (group << 4) | ((low.bit_length() >> 3) - 1)
+                self._place(old_keys[slot], old_values[slot],
+                            old_hashes[slot])
+                full ^= low
+
+    def _reserve(self, required_count: int) -> None:
+        """Рост таблицы так, чтобы required_count элементов помещались
+        без превышения порога заполнения."""
+        new_size = self.size
+        while required_count > new_size * self.load_factor_threshold:
+            new_size *= 2
+        if new_size != self.size:
+            self._resize(new_size)
+
+    def _insert_hashed(self, key: Any, value: Any, key_hash: int) -> None:
+        """Вставка с уже вычисленным хешем."""
+        slot = self._find(key, key_hash)
+        if slot >= 0:
+            self._values[slot] = value
+            return
+
+        if (self.count + self.deleted_count + 1
+                > self.size * self.load_factor_threshold):
+            # Если таблицу заполнили в основном надгробия, достаточно
+            # перестроить её того же размера
+            if self.count + 1 > self.size * self.load_factor_threshold / 2:
+                self._resize(self.size * 2)
+            else:
+                self._resize(self.size)
+        self._place(key, value, key_hash)
+
+    def insert(self, key: Any, value: Any) -> None:
+        """
+        Вставка элемента в хеш-таблицу.
+
+        Args:
+            key: Ключ
+            value: Значение
+
+        Time Complexity: O(1) в среднем
+        """
+        self._insert_hashed(key, value, self.hash_func(key))
+
+    def insert_many(self, pairs: Iterable[Tuple[Any, Any]]) -> None:
+        """
+        Пакетная вставка элементов.
+
+        Таблица один раз увеличивается под итоговое число элементов,
+        хеши всех ключей вычисляются одним пакетом.
+
+        Args:
+            pairs: Пары (ключ, значение)
+
+        Time Complexity: O(n) в среднем
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return
+
+        self._insert_many_hashed(
+            pairs, self.batch_hash_func([key for key, _ in pairs]).tolist()
+        )
+
+    def _insert_many_hashed(self, pairs: List[Tuple[Any, Any]],
+                            hashes: List[int]) -> None:
+        """Пакетная вставка пар с уже вычисленными хешами."""
+        self._reserve(self.count + self.deleted_count + len(pairs))
+        for (key, value), key_hash in zip(pairs, hashes):
+            self._insert_hashed(key, value, key_hash)
+
+    def search(self, key: Any) -> Optional[Any]:
+        """
+        Поиск элемента по ключу.
+
+        Args:
+            key: Ключ для поиска
+
+        Returns:
+            Найденное значение или None
+
+        Time Complexity: O(1) в среднем
+        """
+        slot = self._find(key, self.hash_func(key))
+        return self._values[slot] if slot >= 0 else None
+
+    def search_many(self, keys: Iterable[Any]) -> List[Optional[Any]]:
+        """
+        Пакетный поиск элементов.
+
+        Args:
+            keys: Ключи для поиска
+
+        Returns:
+            Список найденных значений (None для отсутствующих ключей)
+        """
+        keys = list(keys)
+        return self._search_many_hashed(
+            keys, self.batch_hash_func(keys).tolist()
+        )
+
+    def _search_many_hashed(self, keys: List[Any],
+                            hashes: List[int]) -> List[Optional[Any]]:
+        """Пакетный поиск ключей с уже вычисленными хешами."""
+        values = self._values
+        results = []
+
+        for key, key_hash in zip(keys, hashes):
+            slot = self._find(key, key_hash)
+            results.append(values[slot] if slot >= 0 else None)
+        return results
+
+    def delete(self, key: Any) -> bool:
+        """
+        Удаление элемента по ключу.
+
+        Если в группе есть пустая ячейка, ни одна цепочка пробирования
+        не проходила через эту группу дальше, и ячейка сразу становится
+        пустой; иначе остаётся надгробие.
+
+        Args:
+            key: Ключ для удаления
+
+        Returns:
+            True если элемент удален, False если не найден
+
+        Time Complexity: O(1) в среднем
+        """
+        slot = self._find(key, self.hash_func(key))
+        if slot < 0:
+            return False
+
+        ctrl = self._groups[slot >> 4]
+        if ctrl & ~(ctrl << 1) & MSB:
+            self._set_ctrl(slot, CTRL_EMPTY)
+        else:
+            self._set_ctrl(slot, CTRL_DELETED)
+            self.deleted_count += 1
+        self._keys[slot] = None
+        self._values[slot] = None
+        self.count -= 1
+        return True
+
+    def probe_groups(self, key: Any) -> int:
+        """
+        Число групп, просмотренных при поиске ключа.
+
+        Args:
+            key: Ключ
+
+        Returns:
+            Количество групп (не меньше 1)
+        """
+        key_hash = self.hash_func(key)
+        slot = self._find(key, key_hash)
+        mask = self._group_mask
+        group = key_hash & mask
+        target = slot >> 4 if slot >= 0 else -1
+        visited = 1
+        step = 0
+
+        while group != target:
+            ctrl = self._groups[group]
+            if target < 0 and ctrl & ~(ctrl << 1) & MSB:
+                break
+            step += 1
+            group = (group + step) & mask
+            visited += 1
+        return visited
+
+    def memory_report(self) -> Dict[str, float]:
+        """
+        Память, занимаемая структурами таблицы.
+
+        Ячейка стоит две ссылки (ключ, значение), 8 байт хеша и свою
+        долю 128-битного числа управляющих байтов группы.
+
+        Returns:
+            Отчёт build_report: байт всего и на элемент, потери
+            на пустые ячейки и надгробия, сравнение с dict
+        """
+        groups = self._groups
+        group_bytes = sys.getsizeof(groups) + sum(map(sys.getsizeof, groups))
+        total_bytes = group_bytes + sum(sys.getsizeof(part) for part in (
+            self._keys, self._values, self._hashes))
+        slot_bytes = total_bytes / self.size
+
+        pairs = []
+        for group, ctrl in enumerate(groups):
+            full = ~ctrl & MSB
+            while full:
+                low = full & -full
+                slot = (group << 4) | ((low.bit_length() >> 3) - 1)
+                pairs.append((self._keys[slot], self._values[slot]))
+                full ^= low
+
+        empty_slots = self.size - self.count - self.deleted_count
+        return build_report(self.count, total_bytes,
+                            int(empty_slots * slot_bytes),
+                            int(self.deleted_count * slot_bytes),
+                            dict_bytes(pairs))
+
+    @property
+    def load_factor(self) -> float:
+        """Коэффициент заполнения таблицы."""
+        return self.count / self.size
+
+    def get_collision_stats(
+        self, histogram: bool = False
+    ) -> Union[Tuple[int, int], Tuple[int, int, Dict[int, int]]]:
+        """
+        Статистика коллизий.
+
+        Коллизия - элемент, лежащий не в своей начальной группе; длина
+        пробирования измеряется в группах.
+
+        Args:
+            histogram: Добавить гистограмму длин пробирования
+
+        Returns:
+            (количество коллизий, максимальная длина пробирования)
+            или, при histogram=True,
+            (количество коллизий, максимальная длина пробирования,
+             {длина пробирования: число элементов})
+        """
+        collisions = 0
+        max_probe_length = 0
+        probe_histogram: Dict[int, int] = {}
+        mask = self._group_mask
+
+        for group, ctrl in enumerate(self._groups):
+            full = ~ctrl & MSB
+            while full:
+                low = full & -full
+                slot = (group << 4) | ((low.bit_length() >> 3) - 1)
+                full ^= low
+
+                current = self._hashes[slot] & mask
+                probe_length = 0
+                while current != group:
+                    probe_length += 1
+                    current = (current + probe_length) & mask
+                if probe_length:
+                    collisions += 1
+                    max_probe_length = max(max_probe_length, probe_length)
+                probe_histogram[probe_length] = (
+                    probe_histogram.get(probe_length, 0) + 1
+                )
+
+        if histogram:
+            return collisions, max_probe_length, probe_histogram
+        return collisions, max_probe_length
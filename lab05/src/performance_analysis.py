@@ -3,9 +3,17 @@
 import time
 import random
 import string
+import threading
 import matplotlib.pyplot as plt
+from hash_benchmark import run_suite
+from hash_filter import FilteredHashTable
+from hash_functions import BATCH_HASH_FUNCTIONS, FULL_HASH_FUNCTIONS
 from hash_table_chaining import HashTableChaining
+from hash_table_concurrent import ConcurrentHashTableChaining
+from hash_table_cuckoo import HashTableCuckoo
 from hash_table_open_addressing import HashTableOpenAddressing
+from hash_table_swiss import HashTableSwiss
+from hash_sharded_store import ShardedHashStore
 
 
 def generate_random_string(length: int = 10) -> str:
@@ -13,13 +21,18 @@ def generate_random_string(length: int = 10) -> str:
     return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
 
 
-def measure_performance():
-    """Измерение производительности разных реализаций."""
-    # Параметры тестирования
-    table_sizes = [100, 500, 1000]
-    load_factors = [0.1, 0.5, 0.7, 0.9]
-    hash_functions = ['simple', 'polynomial', 'djb2']
-    
+def measure_performance(table_sizes=(100, 500, 1000),
+                        load_factors=(0.1, 0.5, 0.7, 0.9)):
+    """
+    Измерение производительности разных реализаций.
+
+    Подробные нагрузки (смесь операций, распределение Ципфа, промахи,
+    перцентили задержек) - в hash_benchmark.run_suite.
+
+    Args:
+        table_sizes: Начальные размеры таблиц
+        load_factors: Заполнение таблиц
+    """
     results = {}
     
     for size in table_sizes:
@@ -35,23 +48,39 @@ def measure_performance():
             
             # Тестирование разных реализаций
             implementations = [
-                ('Chaining', HashTableChaining(size=size)),
-                ('Linear Probing', HashTableOpenAddressing(size=size, probing_method='linear')),
-                ('Double Hashing', HashTableOpenAddressing(size=size, probing_method='double'))
+                ('Chaining', lambda: HashTableChaining(size=size)),
+                ('Linear Probing', lambda: HashTableOpenAddressing(size=size, probing_method='linear')),
+                ('Double Hashing', lambda: HashTableOpenAddressing(size=size, probing_method='double')),
+                ('Quadratic Probing', lambda: HashTableOpenAddressing(size=size, probing_method='quadratic')),
+                ('Robin Hood', lambda: HashTableOpenAddressing(size=size, probing_method='robin_hood')),
+                ('Swiss Table', lambda: HashTableSwiss(size=size)),
+                ('Cuckoo', lambda: HashTableCuckoo(size=size))
             ]
+            keys = [key for key, _ in test_data]
             
-            for impl_name, ht in implementations:
+            for impl_name, make_table in implementations:
+                ht = make_table()
                 # Измерение времени вставки
-                start_time = time.time()
+                start_time = time.perf_counter()
                 for key, value in test_data:
                     ht.insert(key, value)
-                insert_time = time.time() - start_time
+                insert_time = time.perf_counter() - start_time
                 
                 # Измерение времени поиска
-                start_time = time.time()
+                start_time = time.perf_counter()
                 for key, value in test_data:
                     ht.search(key)
-                search_time = time.time() - start_time
+                search_time = time.perf_counter() - start_time
+                
+                # Пакетная загрузка и пакетный поиск в новой таблице
+                bulk_ht = make_table()
+                start_time = time.perf_counter()
+                bulk_ht.insert_many(test_data)
+                bulk_insert_time = time.perf_counter() - start_time
+                
+                start_time = time.perf_counter()
+                bulk_ht.search_many(keys)
+                bulk_search_time = time.perf_counter() - start_time
                 
                 # Статистика коллизий
                 if hasattr(ht, 'get_collision_stats'):
@@ -63,21 +92,319 @@ def measure_performance():
                 results[key] = {
                     'insert_time': insert_time,
                     'search_time': search_time,
+                    'bulk_insert_time': bulk_insert_time,
+                    'bulk_search_time': bulk_search_time,
                     'collisions': collisions,
                     'load_factor': ht.load_factor
                 }
                 
                 print(f"Size: {size}, Load: {load_factor}, Impl: {impl_name}")
                 print(f"  Insert: {insert_time:.6f}s, Search: {search_time:.6f}s")
+                print(f"  Bulk insert: {bulk_insert_time:.6f}s, "
+                      f"Bulk search: {bulk_search_time:.6f}s")
                 print(f"  Collisions: {collisions}")
     
     return results
 
 
+def measure_hashing_performance(num_keys: int = 100000):
+    """Сравнение поштучного и пакетного хеширования ключей."""
+    keys = [generate_random_string() for _ in range(num_keys)]
+    results = {}
+
+    for name in FULL_HASH_FUNCTIONS:
+        hash_func = FULL_HASH_FUNCTIONS[name]
+        start_time = time.perf_counter()
+        for key in keys:
+            hash_func(key)
+        scalar_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        BATCH_HASH_FUNCTIONS[name](keys)
+        batch_time = time.perf_counter() - start_time
+
+        results[name] = {'scalar_time': scalar_time, 'batch_time': batch_time}
+        print(f"Hash: {name}, keys: {num_keys}")
+        print(f"  Scalar: {scalar_time:.6f}s, Batch: {batch_time:.6f}s, "
+              f"speedup: {scalar_time / batch_time:.1f}x")
+
+    return results
+
+
+def measure_hash_throughput(key_lengths=(8, 64, 1024),
+                            total_bytes: int = 1 << 20):
+    """
+    Пропускная способность хеш-функций (МБ/с) на байтовых ключах.
+
+    Args:
+        key_lengths: Длины ключей в байтах
+        total_bytes: Суммарный объём ключей для каждой длины
+    """
+    results = {}
+    for length in key_lengths:
+        keys = [random.randbytes(length)
+                for _ in range(max(total_bytes // length, 1))]
+        megabytes = len(keys) * length / (1 << 20)
+
+        for name in FULL_HASH_FUNCTIONS:
+            hash_func = FULL_HASH_FUNCTIONS[name]
+            start_time = time.perf_counter()
+            for key in keys:
+                hash_func(key, seed=1)
+            scalar_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            BATCH_HASH_FUNCTIONS[name](keys, seed=1)
+            batch_time = time.perf_counter() - start_time
+
+            results[(name, length)] = {
+                'scalar_mb_s': megabytes / scalar_time,
+                'batch_mb_s': megabytes / batch_time,
+            }
+            print(f"Hash: {name}, key length: {length} B")
+            print(f"  Scalar: {megabytes / scalar_time:.2f} MB/s, "
+                  f"Batch: {megabytes / batch_time:.2f} MB/s")
+
+    return results
+
+
+def measure_high_load_lookups(num_groups: int = 4096,
+                              load_factor: float = 0.875,
+                              num_lookups: int = 50000):
+    """
+    Поиск при высоком заполнении: попадания и промахи.
+
+    Все таблицы используют одну хеш-функцию и одинаковое число ячеек,
+    порог роста поднят, чтобы таблицы не увеличивались до замера.
+
+    Args:
+        num_groups: Число групп Swiss table (ячеек - в 16 раз больше)
+        load_factor: Заполнение таблиц
+        num_lookups: Число поисков каждого вида
+    """
+    size = num_groups * 16
+    keys = [generate_random_string() for _ in range(int(size * load_factor))]
+    misses = [generate_random_string(12) for _ in range(num_lookups)]
+    hits = random.sample(keys, min(num_lookups, len(keys)))
+
+    implementations = [
+        ('Chaining', HashTableChaining(
+            size=size, hash_func='fnv1a', load_factor_threshold=1.0)),
+        ('Linear Probing', HashTableOpenAddressing(
+            size=size, hash_func='fnv1a', load_factor_threshold=0.9)),
+        ('Swiss Table', HashTableSwiss(size=size, hash_func='fnv1a')),
+    ]
+    results = {}
+
+    for impl_name, ht in implementations:
+        ht.insert_many((key, key) for key in keys)
+
+        start_time = time.perf_counter()
+        for key in hits:
+            ht.search(key)
+        hit_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for key in misses:
+            ht.search(key)
+        miss_time = time.perf_counter() - start_time
+
+        results[impl_name] = {'hit_time': hit_time, 'miss_time': miss_time,
+                              'load_factor': ht.load_factor}
+        print(f"Impl: {impl_name}, Load: {ht.load_factor:.3f}")
+        print(f"  Hit: {hit_time:.6f}s, Miss: {miss_time:.6f}s")
+
+    swiss = implementations[-1][1]
+    groups = [swiss.probe_groups(key) for key in misses]
+    print(f"Swiss Table: групп на промах в среднем "
+          f"{sum(groups) / len(groups):.2f}, "
+          f"не больше двух - {sum(g <= 2 for g in groups) / len(groups):.1%}")
+    return results
+
+
+def measure_filtered_misses(num_keys: int = 20000, num_lookups: int = 50000,
+                            false_positive_rate: float = 0.01):
+    """
+    Поиск отсутствующих ключей с фильтром Блума перед таблицей и без него.
+
+    Args:
+        num_keys: Число элементов в таблицах
+        num_lookups: Число поисков отсутствующих ключей
+        false_positive_rate: Допустимая доля ложных срабатываний фильтра
+    """
+    keys = [generate_random_string() for _ in range(num_keys)]
+    misses = [generate_random_string(12) for _ in range(num_lookups)]
+    results = {}
+
+    for impl_name, factory in [('Chaining', HashTableChaining),
+                               ('Linear Probing', HashTableOpenAddressing)]:
+        for variant in ('plain', 'filtered'):
+            ht = factory(hash_func='fnv1a')
+            if variant == 'filtered':
+                ht = FilteredHashTable(ht, capacity=num_keys,
+                                       false_positive_rate=false_positive_rate)
+            ht.insert_many((key, key) for key in keys)
+
+            start_time = time.perf_counter()
+            for key in misses:
+                ht.search(key)
+            single_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            ht.search_many(misses)
+            batch_time = time.perf_counter() - start_time
+
+            results[(impl_name, variant)] = {'single_time': single_time,
+                                             'batch_time': batch_time}
+            print(f"Impl: {impl_name}, Variant: {variant}")
+            print(f"  Search: {single_time:.6f}s, "
+                  f"search_many: {batch_time:.6f}s")
+            if variant == 'filtered':
+                stats = ht.get_stats()
+                print(f"  False positives: "
+                      f"{stats['false_positive_ratio']:.4f}")
+
+    return results
+
+
+def measure_resize_latency(num_elements: int = 200000):
+    """Максимальная задержка одной вставки при полном и постепенном росте."""
+    keys = [generate_random_string() for _ in range(num_elements)]
+    implementations = [
+        ('Chaining', HashTableChaining),
+        ('Open Addressing', HashTableOpenAddressing),
+    ]
+    results = {}
+
+    for impl_name, table_class in implementations:
+        for incremental in (False, True):
+            ht = table_class(hash_func='djb2', incremental_resize=incremental)
+            max_latency = 0.0
+            start_total = time.perf_counter()
+            for key in keys:
+                start_time = time.perf_counter()
+                ht.insert(key, key)
+                max_latency = max(max_latency,
+                                  time.perf_counter() - start_time)
+            total_time = time.perf_counter() - start_total
+
+            mode = 'incremental' if incremental else 'stop-the-world'
+            results[(impl_name, mode)] = {
+                'max_latency': max_latency,
+                'total_time': total_time
+            }
+            print(f"Impl: {impl_name}, resize: {mode}")
+            print(f"  Max insert: {max_latency * 1000:.3f}ms, "
+                  f"Total: {total_time:.6f}s")
+
+    return results
+
+
+class GlobalLockHashTable:
+    """HashTableChaining под одной общей блокировкой (базовая линия)."""
+
+    def __init__(self, **kwargs):
+        self._table = HashTableChaining(**kwargs)
+        self._lock = threading.Lock()
+
+    def insert(self, key, value):
+        with self._lock:
+            self._table.insert(key, value)
+
+    def search(self, key):
+        with self._lock:
+            return self._table.search(key)
+
+    def delete(self, key):
+        with self._lock:
+            return self._table.delete(key)
+
+
+def measure_concurrency_performance(thread_counts=(1, 2, 4, 8),
+                                    ops_per_thread: int = 20000,
+                                    read_ratio: float = 0.8):
+    """Пропускная способность при конкурентном доступе из нескольких потоков."""
+    keys = [generate_random_string() for _ in range(5000)]
+    implementations = [
+        ('Global Lock', GlobalLockHashTable),
+        ('Striped Locks', ConcurrentHashTableChaining),
+    ]
+    results = {}
+
+    for impl_name, table_class in implementations:
+        for num_threads in thread_counts:
+            ht = table_class(hash_func='djb2')
+            for key in keys:
+                ht.insert(key, key)
+
+            def worker(seed):
+                rng = random.Random(seed)
+                for _ in range(ops_per_thread):
+                    key = rng.choice(keys)
+                    operation = rng.random()
+                    if operation < read_ratio:
+                        ht.search(key)
+                    elif operation < (1 + read_ratio) / 2:
+                        ht.insert(key, key)
+                    else:
+                        ht.delete(key)
+
+            threads = [threading.Thread(target=worker, args=(seed,))
+                       for seed in range(num_threads)]
+            start_time = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            total_time = time.perf_counter() - start_time
+
+            ops_per_sec = num_threads * ops_per_thread / total_time
+            results[(impl_name, num_threads)] = ops_per_sec
+            print(f"Impl: {impl_name}, threads: {num_threads}, "
+                  f"{ops_per_sec:,.0f} ops/s")
+
+    return results
+
+
+def measure_sharded_throughput(shard_counts=(1, 2, 4),
+                               num_keys: int = 200000,
+                               batch_size: int = 10000):
+    """
+    Пропускная способность хранилища из процессов-шардов.
+
+    Ключи пишутся и читаются пакетами по batch_size; рост с числом
+    шардов ограничен числом ядер машины.
+    """
+    pairs = [(generate_random_string(), i) for i in range(num_keys)]
+    keys = [key for key, _ in pairs]
+    results = {}
+
+    for num_shards in shard_counts:
+        with ShardedHashStore(num_shards=num_shards) as store:
+            start_time = time.perf_counter()
+            for start in range(0, num_keys, batch_size):
+                store.set_many(pairs[start:start + batch_size])
+            set_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            for start in range(0, num_keys, batch_size):
+                store.get_many(keys[start:start + batch_size])
+            get_time = time.perf_counter() - start_time
+
+        results[num_shards] = {'set_ops_per_sec': num_keys / set_time,
+                               'get_ops_per_sec': num_keys / get_time}
+        print(f"Shards: {num_shards}, set: {num_keys / set_time:,.0f} ops/s, "
+              f"get: {num_keys / get_time:,.0f} ops/s")
+
+    return results
+
+
 def plot_results(results):
     """Построение графиков результатов."""
     # Группировка результатов по реализации
-    implementations = ['Chaining', 'Linear Probing', 'Double Hashing']
+    implementations = ['Chaining', 'Linear Probing', 'Double Hashing',
+                       'Quadratic Probing', 'Robin Hood', 'Swiss Table',
+                       'Cuckoo']
     load_factors = [0.1, 0.5, 0.7, 0.9]
     
     fig, axes = plt.subplots(2, 2, figsize=(15, 10))
@@ -153,6 +480,22 @@ def plot_results(results):
 if __name__ == '__main__':
     print("Запуск анализа производительности...")
     results = measure_performance()
+    print("\nНабор нагрузок (p50/p99, ops/s)...")
+    run_suite(repeat=3)
+    print("\nСравнение поштучного и пакетного хеширования...")
+    measure_hashing_performance()
+    print("\nПропускная способность хеш-функций...")
+    measure_hash_throughput()
+    print("\nПоиск при заполнении 0.875...")
+    measure_high_load_lookups()
+    print("\nПромахи с фильтром Блума...")
+    measure_filtered_misses()
+    print("\nЗадержка вставки при росте таблицы...")
+    measure_resize_latency()
+    print("\nКонкурентный доступ...")
+    measure_concurrency_performance()
+    print("\nШарды в отдельных процессах...")
+    measure_sharded_throughput()
     print("\nПостроение графиков...")
     plot_results(results)
     print("Анализ завершен. Результаты сохранены в performance_results.png")
\ No newline at end of file
@@ -1,8 +1,27 @@
 """Unit-тесты для хеш-таблиц."""
 
+import itertools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
 import unittest
+from hash_benchmark import (WorkloadSpec, compare_runs, generate_keys,
+                            generate_operations, run_suite)
+from hash_cache import HashTableCache
+from hash_filter import CountingBloomFilter, FilteredHashTable
+from hash_functions import (BATCH_HASH_FUNCTIONS, FULL_HASH_FUNCTIONS,
+                            fnv1a_hash, siphash24, xxhash64)
 from hash_table_chaining import HashTableChaining
+from hash_table_concurrent import ConcurrentHashTableChaining
+from hash_table_cuckoo import HashTableCuckoo
+from hash_profiler import profile_keys, stream_keys
+from hash_sharded_store import ShardedHashStore
 from hash_table_open_addressing import HashTableOpenAddressing
+from hash_table_shared import SharedHashTableOpenAddressing
+from hash_table_swiss import HashTableSwiss
 
 
 class TestHashTables(unittest.TestCase):
@@ -91,6 +110,778 @@ class TestHashTables(unittest.TestCase):
         for i in range(10):
             self.assertEqual(ht.search(f"key{i}"), f"value{i}")
 
+    def test_open_addressing_tombstone_reuse(self):
+        """Тест повторного использования удалённых ячеек без дубликатов."""
+        for method in ['linear', 'double']:
+            ht = HashTableOpenAddressing(size=11, probing_method=method)
+            keys = [f"key{i}" for i in range(6)]
+            for i, key in enumerate(keys):
+                ht.insert(key, i)
+
+            ht.delete(keys[0])
+            for i, key in enumerate(keys[1:], start=1):
+                ht.insert(key, i * 10)
+                self.assertEqual(ht.search(key), i * 10)
+
+            self.assertEqual(ht.count, len(keys) - 1)
+            self.assertIsNone(ht.search(keys[0]))
+
+    def test_resize_reuses_stored_hashes(self):
+        """Тест: при изменении размера ключи повторно не хешируются."""
+        tables = [
+            HashTableChaining(size=5, hash_func='djb2'),
+            HashTableOpenAddressing(size=5, hash_func='djb2'),
+            HashTableOpenAddressing(size=5, hash_func='djb2',
+                                    probing_method='double'),
+        ]
+        for ht in tables:
+            calls = []
+            original = ht.hash_func
+
+            def counting_hash(key, original=original, calls=calls):
+                calls.append(key)
+                return original(key)
+
+            ht.hash_func = counting_hash
+            for i in range(50):
+                ht.insert(f"key{i}", i)
+
+            self.assertEqual(len(calls), 50)
+            self.assertGreater(ht.size, 5)
+            for i in range(50):
+                self.assertEqual(ht.search(f"key{i}"), i)
+
+    def test_batch_hash_matches_scalar(self):
+        """Тест совпадения пакетных и поштучных хеш-функций."""
+        keys = ["", "a", "key1", "ключ", "a\x00", "x" * 40, "emoji😀",
+                b"raw\x00", 0, -1, 2 ** 70]
+        for name, batch_func in BATCH_HASH_FUNCTIONS.items():
+            for seed in (0, 2 ** 100 + 7):
+                expected = [FULL_HASH_FUNCTIONS[name](key, seed=seed)
+                            for key in keys]
+                self.assertEqual(batch_func(keys, seed=seed).tolist(),
+                                 expected)
+
+    def test_seeded_hash_functions(self):
+        """Тест эталонных значений и зерна хеш-функций."""
+        self.assertEqual(fnv1a_hash(b"a"), 0xaf63dc4c8601ec8c)
+        self.assertEqual(xxhash64(b""), 0xef46db3751d8e999)
+        self.assertEqual(xxhash64(b"a"), 0xd24ec4f1a98c6e5b)
+        sip_key = int.from_bytes(bytes(range(16)), 'little')
+        self.assertEqual(siphash24(bytes(range(15)), seed=sip_key),
+                         0xa129ca6149be45e5)
+        self.assertEqual(fnv1a_hash("ключ"), fnv1a_hash("ключ".encode()))
+
+        for name in FULL_HASH_FUNCTIONS:
+            first = HashTableChaining(hash_func=name)
+            second = HashTableOpenAddressing(hash_func=name)
+            self.assertNotEqual(first.seed, second.seed)
+            self.assertNotEqual(first.hash_func("key"),
+                                second.hash_func("key"))
+
+            same = HashTableChaining(hash_func=name, seed=first.seed)
+            self.assertEqual(same.hash_func("key"), first.hash_func("key"))
+
+        ht = HashTableOpenAddressing(size=5, hash_func='siphash24')
+        for key in ["text", b"bytes", 12345, -7]:
+            ht.insert(key, repr(key))
+        for key in ["text", b"bytes", 12345, -7]:
+            self.assertEqual(ht.search(key), repr(key))
+        self.assertIsNone(ht.search("bytes"))
+
+        with self.assertRaises(ValueError):
+            HashTableChaining(hash_func='unknown')
+
+    def test_bulk_operations(self):
+        """Тест пакетной вставки и поиска с перезаписью дубликатов."""
+        tables = [
+            HashTableChaining(size=5),
+            HashTableOpenAddressing(size=5, probing_method='linear'),
+            HashTableOpenAddressing(size=5, probing_method='double'),
+        ]
+        pairs = [(f"key{i}", i) for i in range(100)]
+        pairs += [("key0", "new_value0"), ("key1", "new_value1")]
+
+        for ht in tables:
+            ht.insert("key2", "old_value2")
+            ht.insert_many(pairs)
+            self.assertEqual(ht.count, 100)
+
+            results = ht.search_many(["key0", "key1", "key2", "missing"])
+            self.assertEqual(results, ["new_value0", "new_value1", 2, None])
+            for i in range(3, 100):
+                self.assertEqual(ht.search(f"key{i}"), i)
+
+    def test_quadratic_and_robin_hood_probing(self):
+        """Тест квадратичного пробирования и пробирования Robin Hood."""
+        for method in ['quadratic', 'robin_hood']:
+            ht = HashTableOpenAddressing(size=8, probing_method=method)
+            for i in range(40):
+                ht.insert(f"key{i}", i)
+            for i in range(0, 40, 2):
+                self.assertTrue(ht.delete(f"key{i}"))
+
+            for i in range(40):
+                expected = None if i % 2 == 0 else i
+                self.assertEqual(ht.search(f"key{i}"), expected)
+
+            collisions, max_probe, histogram = ht.get_collision_stats(
+                histogram=True
+            )
+            self.assertEqual(sum(histogram.values()), ht.count)
+            self.assertEqual(collisions, ht.count - histogram.get(0, 0))
+            self.assertEqual(max_probe, max(histogram))
+
+        # Robin Hood удаляет обратным сдвигом, без надгробий
+        self.assertEqual(ht.deleted_count, 0)
+
+    def test_incremental_resize(self):
+        """Тест постепенного перехеширования: все ключи видны во время переноса."""
+        tables = [
+            HashTableChaining(size=5, incremental_resize=True,
+                              migrate_step=1),
+            HashTableOpenAddressing(size=5, incremental_resize=True,
+                                    migrate_step=1),
+            HashTableOpenAddressing(size=5, probing_method='robin_hood',
+                                    incremental_resize=True, migrate_step=1),
+        ]
+        for ht in tables:
+            migrating = False
+            for i in range(60):
+                ht.insert(f"key{i}", i)
+                migrating = migrating or ht._old_table is not None
+                self.assertEqual(ht.search(f"key{i // 2}"), i // 2)
+
+            self.assertTrue(migrating)
+            self.assertTrue(ht.delete("key7"))
+            ht.insert("key8", "new_value8")
+            for i in range(60):
+                expected = {7: None, 8: "new_value8"}.get(i, i)
+                self.assertEqual(ht.search(f"key{i}"), expected)
+            self.assertEqual(ht.count, 59)
+
+    def test_shrink_and_tombstone_compaction(self):
+        """Тест уменьшения таблицы и очистки надгробий после удалений."""
+        ht = HashTableOpenAddressing(size=11, hash_func='djb2')
+        for i in range(500):
+            ht.insert(f"key{i}", i)
+        peak_size = ht.size
+
+        for i in range(490):
+            self.assertTrue(ht.delete(f"key{i}"))
+        for _ in range(peak_size):
+            ht.search("missing")
+
+        stats = ht.get_tombstone_stats()
+        self.assertLess(ht.size, peak_size)
+        self.assertGreater(stats['shrink_count'], 0)
+        self.assertLessEqual(stats['tombstone_density'],
+                             ht.tombstone_threshold)
+        for i in range(490, 500):
+            self.assertEqual(ht.search(f"key{i}"), i)
+
+    def test_snapshot_save_and_load(self):
+        """Тест бинарного снимка и загрузки через mmap."""
+        ht = HashTableChaining(size=5, hash_func='djb2')
+        values = ["value", 42, -10 ** 20, 1.5, None, True, b"raw"]
+        for i, value in enumerate(values):
+            ht.insert(f"key{i}", value)
+        ht.insert("ключ", "значение")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.bin")
+            ht.save(path)
+
+            with HashTableChaining.load(path) as mapped:
+                self.assertEqual(mapped.count, ht.count)
+                self.assertEqual(mapped.size, ht.size)
+                for i, value in enumerate(values):
+                    self.assertEqual(mapped.search(f"key{i}"), value)
+                self.assertEqual(mapped.search("ключ"), "значение")
+                self.assertIsNone(mapped.search("missing"))
+                self.assertEqual(mapped.get_collision_stats(),
+                                 ht.get_collision_stats())
+
+                restored = mapped.to_table()
+            restored.insert("key0", "new_value")
+            self.assertEqual(restored.search("key0"), "new_value")
+            self.assertEqual(restored.search("key1"), 42)
+
+        # Числовые ключи: True, 1 и 1.0 - один ключ и после загрузки
+        numeric = HashTableChaining(size=5)
+        numeric.hash_func = lambda key: int(key) * 7919
+        numeric.insert(True, "bool")
+        numeric.insert(7.0, "float")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "numeric.bin")
+            numeric.save(path)
+            with HashTableChaining.load(path) as mapped:
+                mapped.hash_func = numeric.hash_func
+                self.assertEqual(mapped.search(1), "bool")
+                self.assertEqual(mapped.search(1.0), "bool")
+                self.assertEqual(mapped.search(True), "bool")
+                self.assertEqual(mapped.search(7), "float")
+                self.assertIsNone(mapped.search(False))
+
+        numeric.hash_func_name = "x" * 17
+        with self.assertRaises(ValueError):
+            numeric.save(os.devnull)
+
+        # Вставить можно любое значение, но снимок его не сохраняет
+        ht.insert("bad", object())
+        with self.assertRaises(TypeError):
+            ht.save(os.devnull)
+
+    def test_concurrent_chaining(self):
+        """Тест конкурентной вставки, поиска и удаления из нескольких потоков."""
+        ht = ConcurrentHashTableChaining(size=5, num_stripes=4)
+        errors = []
+
+        def worker(thread_id):
+            for i in range(300):
+                key = f"t{thread_id}_key{i}"
+                ht.insert(key, i)
+                if ht.search(key) != i:
+                    errors.append(key)
+            for i in range(0, 300, 3):
+                if not ht.delete(f"t{thread_id}_key{i}"):
+                    errors.append(i)
+
+        threads = [threading.Thread(target=worker, args=(t,))
+                   for t in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(ht.count, 4 * 200)
+        self.assertGreater(ht.size, 5)
+        for t in range(4):
+            for i in range(300):
+                expected = None if i % 3 == 0 else i
+                self.assertEqual(ht.search(f"t{t}_key{i}"), expected)
+
+    def test_hash_profiler(self):
+        """Тест профилировщика распределения хеш-функций."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "keys.txt")
+            with open(path, "w", encoding="utf-8") as file:
+                file.writelines(f"key{i}\n" for i in range(1000))
+
+            chunks = stream_keys(path, chunk_size=300)
+            report = profile_keys(chunks, table_sizes=[97],
+                                  avalanche_sample=50)
+
+            # Ключи из файла с переводами строк CRLF - без '\r'
+            crlf_path = os.path.join(directory, "crlf.txt")
+            with open(crlf_path, "wb") as file:
+                file.write(b"alpha\r\nbeta\r\ngamma")
+            self.assertEqual(list(stream_keys(crlf_path, chunk_size=2)),
+                             [["alpha", "beta"], ["gamma"]])
+
+        for name, result in report.items():
+            table = result['tables'][0]
+            self.assertEqual(table['num_keys'], 1000)
+            self.assertEqual(sum(table['occupancy_histogram'].values()), 97)
+            self.assertGreaterEqual(result['avalanche']['avalanche'], 0.0)
+
+        # Сумма кодов символов даёт заметно худшую равномерность
+        self.assertGreater(report['simple']['tables'][0]['chi_squared'],
+                           report['djb2']['tables'][0]['chi_squared'])
+
+    def test_swiss_table(self):
+        """Тест Swiss table: теги групп, надгробия и рост."""
+        ht = HashTableSwiss(size=16, seed=1)
+        self.assertEqual(ht.size, 16)
+        for i in range(200):
+            ht.insert(f"key{i}", i)
+        ht.insert("key199", "updated")
+        self.assertEqual(ht.count, 200)
+        self.assertLessEqual(ht.load_factor, 0.875)
+        self.assertEqual(ht.search("key199"), "updated")
+        self.assertEqual(ht.search_many(["key7", "missing"]), [7, None])
+
+        for i in range(0, 200, 2):
+            self.assertTrue(ht.delete(f"key{i}"))
+        self.assertFalse(ht.delete("key0"))
+        for i in range(199):
+            expected = None if i % 2 == 0 else i
+            self.assertEqual(ht.search(f"key{i}"), expected)
+
+        # Повторные вставки переиспользуют надгробия
+        size = ht.size
+        for i in range(0, 200, 2):
+            ht.insert(f"key{i}", -i)
+        self.assertEqual(ht.size, size)
+        self.assertEqual(ht.search("key10"), -10)
+
+        # Одинаковый тег у разных ключей не мешает поиску
+        tagged = HashTableSwiss(size=64, seed=1)
+        tagged.hash_func = lambda key: (7 << 57) | hash(key) & 0xFFFF
+        for i in range(40):
+            tagged.insert(i, str(i))
+        for i in range(40):
+            self.assertEqual(tagged.search(i), str(i))
+        self.assertIsNone(tagged.search(1000))
+
+        # Промахи при заполнении 0.875: граница из docstring класса
+        for seed in range(4):
+            full = HashTableSwiss(size=16 * 256, seed=seed)
+            full.insert_many((f"k{i}", i)
+                             for i in range(int(full.size * 0.875)))
+            self.assertEqual(full.size, 16 * 256)
+            probes = [full.probe_groups(f"miss{i}") for i in range(1000)]
+            self.assertLessEqual(sum(probes) / len(probes), 2.5)
+            self.assertGreaterEqual(
+                sum(probe <= 2 for probe in probes) / len(probes), 0.65
+            )
+        collisions, max_probe = full.get_collision_stats()
+        self.assertGreater(collisions, 0)
+        self.assertGreater(max_probe, 0)
+
+    def test_cuckoo_hashing(self):
+        """Тест кукушкиного хеширования: вытеснения, стэш и рост."""
+        for hash_funcs in (('fnv1a', 'djb2'), ('fnv1a', 'fnv1a', 'djb2')):
+            ht = HashTableCuckoo(size=7, hash_funcs=hash_funcs, seed=1)
+            for i in range(500):
+                ht.insert(f"key{i}", i)
+            ht.insert("key4", "updated")
+            self.assertEqual(ht.count, 500)
+            self.assertLessEqual(ht.load_factor, ht.load_factor_threshold)
+            self.assertGreater(ht.relocation_count, 0)
+            self.assertEqual(ht.search("key4"), "updated")
+            self.assertEqual(ht.search_many(["key7", "missing"]), [7, None])
+
+            for i in range(0, 500, 2):
+                self.assertTrue(ht.delete(f"key{i}"))
+            self.assertFalse(ht.delete("key0"))
+            self.assertEqual(ht.count, 250)
+            for i in range(1, 500, 2):
+                self.assertEqual(ht.search(f"key{i}"), i)
+
+            collisions, max_probe, histogram = ht.get_collision_stats(True)
+            self.assertEqual(sum(histogram.values()), ht.count)
+            self.assertLessEqual(max_probe, len(hash_funcs))
+
+        # Ключи с одинаковыми ячейками уходят в стэш, затем таблица растёт
+        ht = HashTableCuckoo(size=11, stash_size=2, seed=1)
+        ht.hash_funcs = [lambda key: 0, lambda key: 11]
+        for i in range(4):
+            ht.insert(i, str(i))
+        self.assertGreater(ht.size, 11)
+        for i in range(4):
+            self.assertEqual(ht.search(i), str(i))
+
+        with self.assertRaises(ValueError):
+            HashTableCuckoo(hash_funcs=('fnv1a',))
+        with self.assertRaises(ValueError):
+            HashTableCuckoo(hash_funcs=('simple', 'simple'))
+        HashTableCuckoo(hash_funcs=('fnv1a', 'fnv1a'))
+
+        # Перестановки одних букв совпадают по simple: их не разместить,
+        # и вставка должна падать, не теряя уже вставленных элементов
+        ht = HashTableCuckoo(hash_funcs=('simple', 'djb2'), seed=0)
+        inserted = []
+        with self.assertRaises(RuntimeError):
+            for letters in itertools.permutations("abcdef"):
+                key = "".join(letters)
+                ht.insert(key, key)
+                inserted.append(key)
+        self.assertEqual(ht.count, len(inserted))
+        for key in inserted:
+            self.assertEqual(ht.search(key), key)
+        self.assertIsNone(ht.search("".join(letters)))
+
+    def test_benchmark_harness(self):
+        """Тест генерации нагрузок и формата результатов замера."""
+        spec = WorkloadSpec('mixed', num_keys=200, num_ops=2000,
+                            read_ratio=0.5, delete_ratio=0.2,
+                            distribution='zipf', miss_ratio=0.5,
+                            key_length=6)
+        keys, misses = generate_keys(spec)
+        self.assertEqual(len(keys), 200)
+        self.assertFalse(set(keys) & set(misses))
+        self.assertTrue(all(len(key) == 6 for key in keys))
+
+        operations = generate_operations(spec, keys, misses)
+        self.assertEqual(operations, generate_operations(spec, keys, misses))
+        kinds = [operation for operation, _ in operations]
+        self.assertAlmostEqual(kinds.count('search') / 2000, 0.5, delta=0.05)
+        self.assertAlmostEqual(kinds.count('delete') / 2000, 0.2, delta=0.05)
+        hot_key = max(set(keys), key=[key for _, key in operations].count)
+        self.assertEqual(hot_key, keys[0])
+
+        run = run_suite({'Chaining': lambda: HashTableChaining()},
+                        [spec], warmup=0, repeat=1, verbose=False)
+        run = json.loads(json.dumps(run))
+        result = run['results'][0]
+        self.assertEqual(result['workload']['name'], 'mixed')
+        self.assertEqual(result['latency']['count'], 2000)
+        self.assertLessEqual(result['latency']['p50_ns'],
+                             result['latency']['p99_ns'])
+        self.assertGreater(result['ops_per_sec'], 0)
+        self.assertEqual(set(result['by_operation']),
+                         {'search', 'insert', 'delete'})
+        self.assertEqual(compare_runs(run, run), {('mixed', 'Chaining'): 1.0})
+
+    def test_lru_and_lfu_cache(self):
+        """Тест кеша: порядок вытеснения LRU/LFU, объём и счётчики."""
+        cache = HashTableCache(capacity=3)
+        for key in "abc":
+            cache.put(key, key.upper())
+        self.assertEqual(cache.get("a"), "A")
+        cache.put("d", "D")
+        self.assertNotIn("b", cache)
+        self.assertEqual([key in cache for key in "acd"], [True] * 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get_stats()['evictions'], 1)
+        self.assertEqual(cache.get_stats()['hits'], 1)
+        self.assertEqual(cache.get_stats()['misses'], 1)
+
+        cache = HashTableCache(
+            capacity=3, policy='lfu',
+            table_factory=lambda: HashTableOpenAddressing(hash_func='fnv1a'))
+        for key in "abc":
+            cache.put(key, key)
+        for _ in range(3):
+            cache.get("a")
+        cache.get("b")
+        cache.put("d", "d")
+        self.assertNotIn("c", cache)
+        cache.put("e", "e")
+        self.assertNotIn("d", cache)
+        self.assertEqual(cache.get("a"), "a")
+        self.assertTrue(cache.delete("b"))
+        self.assertFalse(cache.delete("b"))
+        self.assertEqual(len(cache), 2)
+
+        cache = HashTableCache(capacity=None, max_bytes=1000)
+        for i in range(20):
+            cache.put(i, "x" * 100)
+        self.assertLessEqual(cache.total_bytes, 1000)
+        self.assertIn(19, cache)
+        self.assertNotIn(0, cache)
+        cache.put("huge", "x" * 2000)
+        self.assertNotIn("huge", cache)
+
+        # LFU с ограничением объёма: одна вставка вытесняет несколько
+        # элементов, переходя от наименьшей частоты к следующей
+        small = HashTableCache._entry_size("a", "x")
+        cache = HashTableCache(capacity=None, max_bytes=4 * small,
+                               policy='lfu')
+        for key in "abcd":
+            cache.put(key, "x")
+        for key in "aab":
+            cache.get(key)
+        cache.put("e", "x" * (3 * small - HashTableCache._entry_size("e", "")))
+        self.assertEqual([key in cache for key in "abcde"],
+                         [True, False, False, False, True])
+        cache.put("a", "y")
+        self.assertEqual(cache.get("a"), "y")
+        self.assertEqual(cache.count, 2)
+
+        calls = []
+        cache = HashTableCache(capacity=2)
+        compute = lambda key: calls.append(key) or key * 2
+        self.assertEqual(cache.get_or_compute(21, compute), 42)
+        self.assertEqual(cache.get_or_compute(21, compute), 42)
+        self.assertEqual(calls, [21])
+
+    def test_memory_report(self):
+        """Тест отчёта о памяти и ленивых корзин."""
+        tables = [
+            HashTableChaining(size=1009),
+            HashTableChaining(size=1009, lazy_buckets=True),
+            HashTableOpenAddressing(size=1009),
+            HashTableSwiss(size=1009),
+            HashTableCuckoo(size=1009),
+            ConcurrentHashTableChaining(size=1009),
+        ]
+        reports = []
+        for ht in tables:
+            for i in range(200):
+                ht.insert(f"key{i}", i)
+            for i in range(50):
+                ht.delete(f"key{i}")
+            report = ht.memory_report()
+            reports.append(report)
+            self.assertEqual(report['count'], 150)
+            self.assertGreater(report['dict_bytes'], 0)
+            self.assertGreater(report['empty_bytes'], 0)
+            self.assertLess(report['empty_bytes'], report['total_bytes'])
+            self.assertAlmostEqual(report['bytes_per_entry'],
+                                   report['total_bytes'] / 150)
+            self.assertAlmostEqual(
+                report['overhead_vs_dict'],
+                report['total_bytes'] / report['dict_bytes'])
+
+        eager, lazy = reports[0], reports[1]
+        self.assertLess(lazy['total_bytes'], eager['total_bytes'])
+        self.assertLess(lazy['empty_bytes'], eager['empty_bytes'])
+        self.assertGreater(reports[2]['tombstone_bytes'], 0)
+
+        lazy_table = tables[1]
+        # Опустевшие корзины освобождаются
+        self.assertTrue(all(bucket is None or bucket
+                            for bucket in lazy_table.table))
+        for i in range(50, 200):
+            self.assertEqual(lazy_table.search(f"key{i}"), i)
+        for i in range(2000):
+            lazy_table.insert(f"more{i}", i)
+        self.assertEqual(lazy_table.search("more1999"), 1999)
+        self.assertEqual(lazy_table.get_collision_stats()[1],
+                         lazy_table.load_factor)
+
+    def test_ordered_index(self):
+        """Тест упорядоченного обхода, диапазонов и префиксов."""
+        ht = HashTableChaining(size=5, ordered_index=True,
+                               incremental_resize=True)
+        words = ["pear", "apple", "peach", "banana", "plum", "apricot"]
+        for i, word in enumerate(words):
+            ht.insert(word, i)
+        ht.insert("apple", "updated")
+
+        self.assertEqual([key for key, _ in ht.items()], sorted(words))
+        self.assertEqual(dict(ht.items())["apple"], "updated")
+        self.assertEqual(list(ht.prefix("ap")),
+                         [("apple", "updated"), ("apricot", 5)])
+        self.assertEqual([key for key, _ in ht.range("b", "pl")],
+                         ["banana", "peach", "pear"])
+        self.assertEqual([key for key, _ in ht.range(hi="b")],
+                         ["apple", "apricot"])
+
+        # Генератор не материализует весь результат
+        scan = ht.range("a")
+        self.assertEqual(next(scan)[0], "apple")
+
+        self.assertTrue(ht.delete("peach"))
+        ht.insert("cherry", 7)
+        ht.delete("cherry")
+        ht.insert("cherry", 8)
+        self.assertEqual([key for key, _ in ht.prefix("p")],
+                         ["pear", "plum"])
+        self.assertEqual(list(ht.range("c", "d")), [("cherry", 8)])
+        self.assertEqual(len(list(ht.items())), ht.count)
+
+        # Несравнимый ключ отклоняется индексом и не остаётся в таблице
+        count = ht.count
+        for bad_key in (5, b"bytes"):
+            with self.assertRaises(TypeError):
+                ht.insert(bad_key, "bad")
+            self.assertIsNone(ht.search(bad_key))
+        self.assertEqual(ht.count, count)
+        self.assertEqual(len(list(ht.items())), count)
+
+        # Запись вперемешку с запросами на нескольких блоках индекса
+        many = HashTableChaining(ordered_index=True)
+        expected = set()
+        for i in range(3000):
+            key = "k%05d" % ((i * 7919) % 5000)
+            many.insert(key, i)
+            expected.add(key)
+            if i % 3 == 0:
+                many.delete("k%05d" % ((i * 104729) % 5000))
+                expected.discard("k%05d" % ((i * 104729) % 5000))
+            if i % 500 == 0:
+                self.assertEqual(
+                    [key for key, _ in many.range("k01000", "k02000")],
+                    sorted(k for k in expected if "k01000" <= k < "k02000"))
+        self.assertEqual([key for key, _ in many.items()], sorted(expected))
+
+        plain = HashTableChaining()
+        plain.insert("key", 1)
+        self.assertEqual(list(plain.items()), [("key", 1)])
+        with self.assertRaises(ValueError):
+            list(plain.range("a", "z"))
+
+    def test_sharded_store(self):
+        """Тест хранилища из процессов-шардов."""
+        with ShardedHashStore(num_shards=3, seed=1) as store:
+            pairs = [(f"key{i}", i) for i in range(1000)]
+            store.set_many(pairs)
+            store.set_many([("key1", "updated"), (42, b"int key")])
+            store.set("single", [1, 2])
+
+            self.assertEqual(len(store), 1002)
+            stats = store.get_stats()
+            self.assertEqual(len(stats), 3)
+            # Последовательные ключи расходятся по шардам равномерно
+            for shard in stats:
+                self.assertLess(abs(shard['count'] - 1002 / 3), 60)
+
+            values = store.get_many([key for key, _ in pairs] + ["missing"])
+            self.assertEqual(values[0], 0)
+            self.assertEqual(values[1], "updated")
+            self.assertEqual(values[2:1000], list(range(2, 1000)))
+            self.assertIsNone(values[-1])
+            self.assertEqual(store.get(42), b"int key")
+            self.assertEqual(store.get("single"), [1, 2])
+
+            self.assertEqual(store.delete_many(["key0", "missing"]),
+                             [True, False])
+            self.assertIsNone(store.get("key0"))
+            self.assertEqual(store.get_many([]), [])
+
+            # Несериализуемое значение: запрос не уходит ни одному шарду
+            batch = [(f"new{i}", i) for i in range(50)]
+            with self.assertRaises(TypeError):
+                store.set_many(batch + [("lock", threading.Lock())])
+            self.assertEqual(store.get_many([key for key, _ in batch]),
+                             [None] * 50)
+            self.assertEqual(store.get("key5"), 5)
+
+        for hash_func in ('fnv1a', 'djb2'):
+            with ShardedHashStore(num_shards=4, hash_func=hash_func,
+                                  seed=1) as store:
+                keys = [f"user{i}" for i in range(20000)]
+                sizes = [len(part) for part in
+                         store._partition(store.batch_hash_func(keys))]
+                self.assertEqual(sum(sizes), 20000)
+                self.assertLess(max(sizes) - min(sizes), 600)
+
+    def test_shared_memory_table(self):
+        """Тест таблицы в разделяемой памяти."""
+        writer = SharedHashTableOpenAddressing.create(
+            capacity=64, key_width=8, value_width=8, arena_size=4096, seed=3
+        )
+        reader = SharedHashTableOpenAddressing.attach(writer.name)
+        try:
+            self.assertEqual(reader.seed, writer.seed)
+            for i in range(20):
+                writer.insert(f"k{i}", i)
+            writer.insert(7, b"bytes")
+            writer.insert("long key overflow", "long value overflow")
+            writer.insert("k1", "updated")
+
+            self.assertEqual(reader.count, 22)
+            self.assertEqual(reader.search("k0"), 0)
+            self.assertEqual(reader.search("k1"), "updated")
+            self.assertEqual(reader.search(7), b"bytes")
+            self.assertEqual(reader.search("long key overflow"),
+                             "long value overflow")
+            self.assertGreater(writer.arena_used, 0)
+            self.assertEqual(reader.search_many(["k2", "missing"]), [2, None])
+
+            self.assertTrue(writer.delete("k2"))
+            self.assertFalse(writer.delete("k2"))
+            self.assertIsNone(reader.search("k2"))
+            self.assertEqual(reader.search("k3"), 3)
+
+            with self.assertRaises(PermissionError):
+                reader.insert("k", 1)
+            with self.assertRaises(ValueError):
+                for i in range(100):
+                    writer.insert(f"fill{i}", i)
+            self.assertLessEqual(writer.load_factor, 0.9)
+        finally:
+            reader.close()
+            writer.close()
+
+        churn = SharedHashTableOpenAddressing.create(
+            capacity=64, key_width=8, value_width=8, arena_size=256, seed=5
+        )
+        reader = SharedHashTableOpenAddressing.attach(churn.name)
+        try:
+            # Чередование вставок и удалений не копит надгробия
+            for i in range(500):
+                churn.insert(f"c{i}", i)
+                if i >= 20:
+                    self.assertTrue(churn.delete(f"c{i - 20}"))
+                self.assertLessEqual(churn._counters()[1],
+                                     64 * churn.TOMBSTONE_THRESHOLD)
+            self.assertGreater(churn.compaction_count, 0)
+            self.assertEqual(reader.count, 20)
+            self.assertEqual(reader.search("c499"), 499)
+            self.assertIsNone(reader.search("c0"))
+
+            # Перезаписанные длинные значения освобождают арену
+            for i in range(20):
+                churn.insert("long", "v" * 100 + str(i))
+            self.assertEqual(reader.search("long"), "v" * 100 + "19")
+
+            # Не поместившийся элемент не занимает арену: в ней остаётся
+            # только живое значение "long"
+            with self.assertRaises(ValueError):
+                churn.insert("k" * 100, "x" * 100)
+            self.assertEqual(churn.arena_used, 102)
+            self.assertIsNone(reader.search("k" * 100))
+            self.assertEqual(reader.count, 21)
+        finally:
+            reader.close()
+            churn.close()
+
+    def test_shared_memory_reader_processes(self):
+        """Тест подключения читателей из отдельных процессов."""
+        script = (
+            "import sys\n"
+            "from hash_table_shared import SharedHashTableOpenAddressing\n"
+            "reader = SharedHashTableOpenAddressing.attach(sys.argv[1])\n"
+            "print(reader.search('key'), reader.count)\n"
+            "reader.close()\n"
+        )
+        src_dir = os.path.dirname(os.path.abspath(__file__))
+        writer = SharedHashTableOpenAddressing.create(capacity=16, seed=1)
+        try:
+            writer.insert("key", 42)
+            for _ in range(2):
+                result = subprocess.run(
+                    [sys.executable, "-c", script, writer.name],
+                    cwd=src_dir, capture_output=True, text=True, timeout=60
+                )
+                self.assertEqual(result.returncode, 0, result.stderr)
+                self.assertEqual(result.stdout.split(), ["42", "1"])
+                self.assertNotIn("leaked", result.stderr)
+            self.assertEqual(writer.search("key"), 42)
+        finally:
+            writer.close()
+        with self.assertRaises(FileNotFoundError):
+            SharedHashTableOpenAddressing.attach(writer.name)
+
+    def test_bloom_filter_front_end(self):
+        """Тест считающего фильтра Блума перед таблицами."""
+        bloom = CountingBloomFilter(capacity=1000, false_positive_rate=0.01)
+        self.assertEqual(bloom.num_hashes, 7)
+        hashes = [FULL_HASH_FUNCTIONS['fnv1a'](f"key{i}") for i in range(1000)]
+        for key_hash in hashes:
+            bloom.add(key_hash)
+        self.assertTrue(all(bloom.might_contain(h) for h in hashes))
+        self.assertTrue(bloom.might_contain_many(hashes).all())
+        bloom.remove(hashes[0])
+        self.assertEqual(bloom.count, 999)
+
+        for factory in (HashTableChaining, HashTableOpenAddressing,
+                        HashTableSwiss, HashTableCuckoo):
+            ht = FilteredHashTable(factory(seed=5), capacity=2000,
+                                   false_positive_rate=0.01)
+            if factory is not HashTableCuckoo:
+                # Хеши фильтра передаются в таблицу: сама она не хеширует
+                ht.table.batch_hash_func = None
+            ht.insert_many((f"key{i}", i) for i in range(2000))
+            ht.insert("key1", "updated")
+            ht.insert_many([("key3", "again"), ("new", 1), ("new", 2)])
+            self.assertEqual(len(ht), 2001)
+            self.assertEqual(ht.filter.count, 2001)
+            self.assertEqual(ht.search("key3"), "again")
+            self.assertEqual(ht.search("new"), 2)
+            ht.insert_many([("key3", 3)])
+            self.assertEqual(ht.search("key1"), "updated")
+
+            misses = [f"miss{i}" for i in range(5000)]
+            self.assertEqual(ht.search_many(misses), [None] * 5000)
+            stats = ht.get_stats()
+            self.assertGreater(stats['filtered'], 4800)
+            self.assertLess(stats['false_positive_ratio'], 0.03)
+
+            self.assertTrue(ht.delete("key2"))
+            self.assertFalse(ht.delete("key2"))
+            self.assertIsNone(ht.search("key2"))
+            self.assertEqual(ht.search_many(["key3", "key2"]), [3, None])
+            self.assertEqual(ht.filter.count, 2000)
+
+        with self.assertRaises(ValueError):
+            FilteredHashTable(ht.table)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -2,11 +2,13 @@
 
 import random
 import time
+import tracemalloc
 from typing import Dict, List, Tuple
 
 import matplotlib.pyplot as plt
 
-from binary_search_tree import BinarySearchTree
+from binary_search_tree import AVLTree, BinarySearchTree, RedBlackTree
+from pooled_tree import PooledBinarySearchTree
 from tree_traversal import (
     inorder_iterative,
     inorder_recursive,
@@ -28,7 +30,7 @@ def system_info() -> None:
 
 def generate_balanced_tree(size: int) -> BinarySearchTree:
     """
-    Генерация сбалансированного дерева.
+    Генерация идеально сбалансированного дерева без случайных перестановок.
 
     Args:
         size: Количество элементов
@@ -36,14 +38,7 @@ def generate_balanced_tree(size: int) -> BinarySearchTree:
     Returns:
         Сбалансированное BST
     """
-    bst = BinarySearchTree()
-    values = list(range(size))
-    random.shuffle(values)
-
-    for value in values:
-        bst.insert(value)
-
-    return bst
+    return BinarySearchTree.from_sorted(range(size))
 
 
 def generate_degenerate_tree(size: int) -> BinarySearchTree:
@@ -63,6 +58,50 @@ def generate_degenerate_tree(size: int) -> BinarySearchTree:
     return bst
 
 
+def generate_avl_tree(size: int) -> AVLTree:
+    """
+    Генерация АВЛ-дерева из отсортированных значений.
+
+    Args:
+        size: Количество элементов
+
+    Returns:
+        АВЛ-дерево
+    """
+    tree = AVLTree()
+    for value in range(size):
+        tree.insert(value)
+
+    return tree
+
+
+def generate_red_black_tree(size: int) -> RedBlackTree:
+    """
+    Генерация красно-черного дерева из отсортированных значений.
+
+    Args:
+        size: Количество элементов
+
+    Returns:
+        Красно-черное дерево
+    """
+    tree = RedBlackTree()
+    for value in range(size):
+        tree.insert(value)
+
+    return tree
+
+
+# Виды деревьев в анализе: ключ результатов, генератор, подпись,
+# стиль линии на графиках
+TREE_KINDS = [
+    ('balanced', generate_balanced_tree, 'Сбалансированное', 'o-', 'blue'),
+    ('degenerate', generate_degenerate_tree, 'Вырожденное', 's-', 'red'),
+    ('avl', generate_avl_tree, 'АВЛ', '^-', 'green'),
+    ('red_black', generate_red_black_tree, 'Красно-черное', 'D-', 'purple'),
+]
+
+
 def measure_search_performance(
     bst: BinarySearchTree,
     operation_count: int = 100
@@ -114,7 +153,7 @@ def measure_delete_performance(
     total_time = 0
 
     for value in values_to_delete:
-        test_tree = BinarySearchTree()
+        test_tree = type(bst)()
 
         def copy_tree(node):
             if node:
@@ -195,80 +234,119 @@ def analyze_performance() -> Dict[str, Dict[str, List[Tuple[int, float]]]]:
         Словарь с результатами анализа
     """
     sizes = [50, 100, 150, 200, 250]
+    metrics = [
+        'search', 'delete', 'inorder_recursive', 'preorder_recursive',
+        'postorder_recursive', 'inorder_iterative'
+    ]
     results = {
-        'balanced': {
-            'search': [],
-            'delete': [],
-            'inorder_recursive': [],
-            'preorder_recursive': [],
-            'postorder_recursive': [],
-            'inorder_iterative': []
-        },
-        'degenerate': {
-            'search': [],
-            'delete': [],
-            'inorder_recursive': [],
-            'preorder_recursive': [],
-            'postorder_recursive': [],
-            'inorder_iterative': []
-        }
+        kind: {metric: [] for metric in metrics}
+        for kind, _, _, _, _ in TREE_KINDS
     }
 
     for size in sizes:
         print(f'Анализ для размера {size}')
 
-        try:
-            balanced_tree = generate_balanced_tree(size)
-            balanced_height = balanced_tree.height()
-            balanced_time = measure_search_performance(balanced_tree, 100)
-            delete_time = measure_delete_performance(balanced_tree, 20)
-            traversal_times = measure_traversal_performance(balanced_tree, 5)
-
-            results['balanced']['search'].append((size, balanced_time))
-            results['balanced']['delete'].append((size, delete_time))
-            results['balanced']['inorder_recursive'].append(
-                (size, traversal_times['inorder_recursive'])
-            )
-            results['balanced']['preorder_recursive'].append(
-                (size, traversal_times['preorder_recursive'])
-            )
-            results['balanced']['postorder_recursive'].append(
-                (size, traversal_times['postorder_recursive'])
-            )
-            results['balanced']['inorder_iterative'].append(
-                (size, traversal_times['inorder_iterative'])
-            )
-
-            print(f'  Сбалансированное: время={balanced_time:.6f}с, '
-                  f'высота={balanced_height}')
-
-            degenerate_tree = generate_degenerate_tree(size)
-            degenerate_height = degenerate_tree.height()
-            degenerate_time = measure_search_performance(degenerate_tree, 100)
-            delete_time = measure_delete_performance(degenerate_tree, 20)
-            traversal_times = measure_traversal_performance(degenerate_tree, 5)
-
-            results['degenerate']['search'].append((size, degenerate_time))
-            results['degenerate']['delete'].append((size, delete_time))
-            results['degenerate']['inorder_recursive'].append(
-                (size, traversal_times['inorder_recursive'])
-            )
-            results['degenerate']['preorder_recursive'].append(
-                (size, traversal_times['preorder_recursive'])
-            )
-            results['degenerate']['postorder_recursive'].append(
-                (size, traversal_times['postorder_recursive'])
-            )
-            results['degenerate']['inorder_iterative'].append(
-                (size, traversal_times['inorder_iterative'])
-            )
-
-            print(f'  Вырожденное: время={degenerate_time:.6f}с, '
-                  f'высота={degenerate_height}')
-
-        except Exception as e:
-            print(f'  Ошибка при размере {size}: {e}')
-            continue
+        for kind, generate, label, _, _ in TREE_KINDS:
+            try:
+                tree = generate(size)
+                tree_height = tree.height()
+                search_time = measure_search_performance(tree, 100)
+                delete_time = measure_delete_performance(tree, 20)
+                traversal_times = measure_traversal_performance(tree, 5)
+
+                results[kind]['search'].append((size, search_time))
+                results[kind]['delete'].append((size, delete_time))
+                for traversal, traversal_time in traversal_times.items():
+                    results[kind][traversal].append((size, traversal_time))
+
+                print(f'  {label}: время={search_time:.6f}с, '
+                      f'высота={tree_height}')
+
+            except Exception as e:
+                print(f'  Ошибка при размере {size} ({label}): {e}')
+                continue
+
+    return results
+
+
+def measure_memory_usage(
+    sizes: Tuple[int, ...] = (10000, 100000)
+) -> Dict[str, List[Tuple[int, float]]]:
+    """
+    Память дерева на узел: объекты TreeNode и пул на массивах.
+
+    Args:
+        sizes: Количества элементов
+
+    Returns:
+        Словарь с байтами на узел для каждого размера
+    """
+    results = {'nodes': [], 'pool': []}
+
+    for size in sizes:
+        for kind, tree_class in (('nodes', BinarySearchTree),
+                                 ('pool', PooledBinarySearchTree)):
+            tracemalloc.start()
+            tree = tree_class.from_sorted(range(size))
+            allocated, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del tree
+
+            results[kind].append((size, allocated / size))
+
+        print(f'Размер {size}: узлы - {results["nodes"][-1][1]:.1f} Б/узел, '
+              f'пул - {results["pool"][-1][1]:.1f} Б/узел')
+
+    return results
+
+
+def measure_order_statistics(
+    size: int = 100000,
+    operation_count: int = 100
+) -> Dict[str, float]:
+    """
+    Порядковые запросы по размерам поддеревьев против материализации
+    in-order обхода.
+
+    Args:
+        size: Количество элементов
+        operation_count: Количество запросов
+
+    Returns:
+        Словарь со средним временем запроса каждого вида
+    """
+    tree = BinarySearchTree.from_sorted(range(size))
+    ranks = [random.randrange(size) for _ in range(operation_count)]
+    results = {}
+
+    start_time = time.perf_counter()
+    for k in ranks:
+        inorder_iterative(tree.root)[k]
+    results['inorder_select'] = (
+        (time.perf_counter() - start_time) / operation_count
+    )
+
+    start_time = time.perf_counter()
+    for k in ranks:
+        tree.select(k)
+    results['select'] = (time.perf_counter() - start_time) / operation_count
+
+    start_time = time.perf_counter()
+    for k in ranks:
+        tree.count_range(k, k + 100)
+    results['count_range'] = (
+        (time.perf_counter() - start_time) / operation_count
+    )
+
+    start_time = time.perf_counter()
+    for k in ranks:
+        list(tree.range_iter(k, k + 100))
+    results['range_iter'] = (
+        (time.perf_counter() - start_time) / operation_count
+    )
+
+    for name, value in results.items():
+        print(f'{name}: {value * 1000000:.2f} мкс')
 
     return results
 
@@ -301,25 +379,14 @@ def plot_results(
     for i, operation in enumerate(operations):
         ax = axes[i]
 
-        balanced_data = results['balanced'][operation]
-        if balanced_data:
-            balanced_sizes = [x[0] for x in balanced_data]
-            balanced_times = [x[1] * 1000000 for x in balanced_data]
-            ax.plot(
-                balanced_sizes, balanced_times, 'o-',
-                label='Сбалансированное дерево',
-                linewidth=2, markersize=6, color='blue'
-            )
-
-        degenerate_data = results['degenerate'][operation]
-        if degenerate_data:
-            degenerate_sizes = [x[0] for x in degenerate_data]
-            degenerate_times = [x[1] * 1000000 for x in degenerate_data]
-            ax.plot(
-                degenerate_sizes, degenerate_times, 's-',
-                label='Вырожденное дерево',
-                linewidth=2, markersize=6, color='red'
-            )
+        for kind, _, label, style, color in TREE_KINDS:
+            data = results[kind][operation]
+            if data:
+                ax.plot(
+                    [x[0] for x in data], [x[1] * 1000000 for x in data],
+                    style, label=f'{label} дерево',
+                    linewidth=2, markersize=6, color=color
+                )
 
         ax.set_xlabel('Количество элементов')
         ax.set_ylabel('Время (микросекунды)')
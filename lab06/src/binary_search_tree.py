@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 from collections import deque
-from typing import Optional
+from typing import Iterator, Iterable, List, Optional
 
 
 class TreeNode:
-    """Узел бинарного дерева поиска."""
+    """
+    Узел бинарного дерева поиска.
+
+    Поле size - число узлов в поддереве - поддерживают все деревья,
+    на нем основаны порядковые запросы (select, rank, count_range).
+    Поля height и red используют только сбалансированные деревья:
+    AVLTree хранит высоту поддерева, RedBlackTree - цвет узла.
+    Атрибуты объявлены в __slots__: у узла нет собственного __dict__,
+    что в несколько раз уменьшает его размер.
+    """
+
+    __slots__ = ('value', 'left', 'right', 'size', 'height', 'red')
 
     def __init__(self, value: int) -> None:
         """
@@ -19,6 +30,19 @@ class TreeNode:
         self.value: int = value
         self.left: Optional[TreeNode] = None
         self.right: Optional[TreeNode] = None
+        self.size: int = 1
+        self.height: int = 1
+        self.red: bool = True
+
+
+def _node_size(node: Optional[TreeNode]) -> int:
+    """Число узлов поддерева по полю size (0 для пустого)."""
+    return node.size if node is not None else 0
+
+
+def _node_height(node: Optional[TreeNode]) -> int:
+    """Высота поддерева по полю height (0 для пустого)."""
+    return node.height if node is not None else 0
 
 
 class BinarySearchTree:
@@ -28,6 +52,94 @@ class BinarySearchTree:
         """Инициализация пустого дерева."""
         self.root: Optional[TreeNode] = None
 
+    @classmethod
+    def from_sorted(cls, values: Iterable[int]) -> BinarySearchTree:
+        """
+        Построение идеально сбалансированного дерева из возрастающих
+        значений.
+
+        Сложность: O(n)
+
+        Args:
+            values: Строго возрастающие значения
+
+        Returns:
+            Дерево минимальной высоты
+        """
+        values = list(values)
+        for i in range(1, len(values)):
+            if not values[i - 1] < values[i]:
+                raise ValueError('Значения должны строго возрастать')
+
+        tree = cls()
+        tree.root = tree._build(values)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[int]) -> BinarySearchTree:
+        """
+        Построение сбалансированного дерева из произвольных значений:
+        одна сортировка и построение за O(n). Повторы отбрасываются,
+        как и при insert.
+
+        Сложность: O(n log n)
+
+        Args:
+            values: Значения в любом порядке
+
+        Returns:
+            Дерево минимальной высоты
+        """
+        return cls.from_sorted(sorted(set(values)))
+
+    def rebalance(self) -> None:
+        """
+        Перестройка дерева в идеально сбалансированное.
+
+        Сложность: O(n)
+        """
+        values: List[int] = []
+        stack: List[TreeNode] = []
+        current = self.root
+
+        while current is not None or stack:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            values.append(current.value)
+            current = current.right
+
+        self.root = self._build(values)
+
+    def _build(self, values: List[int]) -> Optional[TreeNode]:
+        """
+        Построение поддерева из возрастающих значений: корень -
+        середина отрезка, поддеревья строятся из половин.
+
+        Глубина рекурсии - O(log n).
+
+        Args:
+            values: Строго возрастающие значения
+
+        Returns:
+            Корень построенного дерева
+        """
+        def build(lo: int, hi: int) -> Optional[TreeNode]:
+            if lo >= hi:
+                return None
+
+            mid = (lo + hi) // 2
+            node = TreeNode(values[mid])
+            node.left = build(lo, mid)
+            node.right = build(mid + 1, hi)
+            node.size = hi - lo
+            node.height = 1 + max(_node_height(node.left),
+                                  _node_height(node.right))
+            return node
+
+        return build(0, len(values))
+
     def insert(self, value: int) -> None:
         """
         Вставка значения в дерево.
@@ -45,21 +157,26 @@ class BinarySearchTree:
             self.root = new_node
             return
 
+        path = []
         current = self.root
         while True:
+            path.append(current)
             if value < current.value:
                 if current.left is None:
                     current.left = new_node
-                    return
+                    break
                 current = current.left
             elif value > current.value:
                 if current.right is None:
                     current.right = new_node
-                    return
+                    break
                 current = current.right
             else:
                 return
 
+        for node in path:
+            node.size += 1
+
     def search(self, value: int) -> bool:
         """
         Поиск значения в дереве.
@@ -90,6 +207,11 @@ class BinarySearchTree:
         """
         Удаление значения из дерева.
 
+        Итеративное удаление с запоминанием родителя: глубина дерева
+        не ограничена лимитом рекурсии. Узел с двумя детьми заменяется
+        своим преемником (минимумом правого поддерева) перестановкой
+        ссылок, без копирования значений.
+
         Сложность:
             В среднем: O(log n)
             В худшем случае: O(n) - для вырожденного дерева
@@ -97,39 +219,43 @@ class BinarySearchTree:
         Args:
             value: Значение для удаления
         """
-        self.root = self._delete_recursive(self.root, value)
-
-    def _delete_recursive(
-        self, node: Optional[TreeNode], value: int
-    ) -> Optional[TreeNode]:
-        """
-        Рекурсивное удаление значения.
-
-        Args:
-            node: Текущий узел
-            value: Значение для удаления
+        path = []
+        node = self.root
+        while node is not None and node.value != value:
+            path.append(node)
+            node = node.left if value < node.value else node.right
 
-        Returns:
-            Обновленный узел
-        """
         if node is None:
-            return None
-
-        if value < node.value:
-            node.left = self._delete_recursive(node.left, value)
-        elif value > node.value:
-            node.right = self._delete_recursive(node.right, value)
-        else:
-            if node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
+            return
 
-            min_node = self._find_min(node.right)
-            node.value = min_node.value
-            node.right = self._delete_recursive(node.right, min_node.value)
+        for ancestor in path:
+            ancestor.size -= 1
+        parent = path[-1] if path else None
 
-        return node
+        if node.left is None:
+            replacement = node.right
+        elif node.right is None:
+            replacement = node.left
+        else:
+            successor_parent = node
+            replacement = node.right
+            while replacement.left is not None:
+                replacement.size -= 1
+                successor_parent = replacement
+                replacement = replacement.left
+
+            if successor_parent is not node:
+                successor_parent.left = replacement.right
+                replacement.right = node.right
+            replacement.left = node.left
+            replacement.size = node.size - 1
+
+        if parent is None:
+            self.root = replacement
+        elif parent.left is node:
+            parent.left = replacement
+        else:
+            parent.right = replacement
 
     @staticmethod
     def _find_min(node: TreeNode) -> TreeNode:
@@ -253,4 +379,426 @@ class BinarySearchTree:
 
             current = current.right
 
-        return True
\ No newline at end of file
+        return True
+
+    def __len__(self) -> int:
+        return _node_size(self.root)
+
+    def select(self, k: int) -> int:
+        """
+        k-е по возрастанию значение (k с нуля): спуск по размерам
+        левых поддеревьев.
+
+        Сложность: O(h), h - высота дерева
+
+        Args:
+            k: Порядковый номер
+
+        Returns:
+            Значение, перед которым в дереве ровно k значений
+        """
+        if not 0 <= k < _node_size(self.root):
+            raise IndexError('Порядковый номер вне дерева')
+
+        node = self.root
+        while True:
+            left_size = _node_size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k > left_size:
+                k -= left_size + 1
+                node = node.right
+            else:
+                return node.value
+
+    def _count_less(self, value: int, inclusive: bool = False) -> int:
+        """Число значений меньше value (или не больше при inclusive)."""
+        count = 0
+        node = self.root
+        while node is not None:
+            if value < node.value or (value == node.value and not inclusive):
+                node = node.left
+            else:
+                count += _node_size(node.left) + 1
+                node = node.right
+        return count
+
+    def rank(self, value: int) -> int:
+        """
+        Число значений дерева, меньших value; для значения из дерева -
+        его порядковый номер (select(rank(x)) == x).
+
+        Сложность: O(h), h - высота дерева
+
+        Args:
+            value: Значение
+
+        Returns:
+            Ранг значения
+        """
+        return self._count_less(value)
+
+    def count_range(self, lo: int, hi: int) -> int:
+        """
+        Число значений в отрезке [lo, hi].
+
+        Сложность: O(h), h - высота дерева
+
+        Args:
+            lo: Нижняя граница (включительно)
+            hi: Верхняя граница (включительно)
+
+        Returns:
+            Количество значений
+        """
+        if hi < lo:
+            return 0
+        return self._count_less(hi, inclusive=True) - self._count_less(lo)
+
+    def range_iter(self, lo: int, hi: int) -> Iterator[int]:
+        """
+        Ленивый обход значений отрезка [lo, hi] по возрастанию.
+
+        Стек хранит только путь от корня, поддеревья вне отрезка
+        не посещаются.
+
+        Сложность: O(h + k), k - число выданных значений
+
+        Args:
+            lo: Нижняя граница (включительно)
+            hi: Верхняя граница (включительно)
+
+        Yields:
+            Значения отрезка по возрастанию
+        """
+        stack: List[TreeNode] = []
+        node = self.root
+
+        while node is not None or stack:
+            while node is not None:
+                if node.value < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+
+            if not stack:
+                return
+            node = stack.pop()
+            if node.value > hi:
+                return
+            yield node.value
+            node = node.right
+
+
+class AVLTree(BinarySearchTree):
+    """
+    АВЛ-дерево: высоты поддеревьев любого узла отличаются не более
+    чем на 1, поэтому высота дерева не превышает 1.44 log2(n)
+    при любом порядке вставки.
+    """
+
+    @staticmethod
+    def _update(node: TreeNode) -> None:
+        """Пересчет высоты и размера узла по детям."""
+        node.height = 1 + max(_node_height(node.left),
+                              _node_height(node.right))
+        node.size = 1 + _node_size(node.left) + _node_size(node.right)
+
+    def _rotate_left(self, node: TreeNode) -> TreeNode:
+        """Левый поворот вокруг узла."""
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_right(self, node: TreeNode) -> TreeNode:
+        """Правый поворот вокруг узла."""
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rebalance(self, node: TreeNode) -> TreeNode:
+        """
+        Восстановление баланса узла одним или двумя поворотами.
+
+        Args:
+            node: Узел, у которого изменилось поддерево
+
+        Returns:
+            Новый корень поддерева
+        """
+        self._update(node)
+        balance = _node_height(node.left) - _node_height(node.right)
+
+        if balance > 1:
+            if _node_height(node.left.left) < _node_height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if _node_height(node.right.right) < _node_height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+    def insert(self, value: int) -> None:
+        """
+        Вставка значения с балансировкой.
+
+        Сложность: O(log n)
+
+        Args:
+            value: Значение для вставки
+        """
+        self.root = self._insert(self.root, value)
+
+    def _insert(self, node: Optional[TreeNode], value: int) -> TreeNode:
+        """
+        Рекурсивная вставка (глубина рекурсии - O(log n)).
+
+        Returns:
+            Новый корень поддерева
+        """
+        if node is None:
+            return TreeNode(value)
+
+        if value < node.value:
+            node.left = self._insert(node.left, value)
+        elif value > node.value:
+            node.right = self._insert(node.right, value)
+        else:
+            return node
+        return self._rebalance(node)
+
+    def delete(self, value: int) -> None:
+        """
+        Удаление значения с балансировкой.
+
+        Сложность: O(log n)
+
+        Args:
+            value: Значение для удаления
+        """
+        self.root = self._delete(self.root, value)
+
+    def _delete(self, node: Optional[TreeNode],
+                value: int) -> Optional[TreeNode]:
+        """
+        Рекурсивное удаление (глубина рекурсии - O(log n)).
+
+        Returns:
+            Новый корень поддерева
+        """
+        if node is None:
+            return None
+
+        if value < node.value:
+            node.left = self._delete(node.left, value)
+        elif value > node.value:
+            node.right = self._delete(node.right, value)
+        else:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            node.value = self._find_min(node.right).value
+            node.right = self._delete(node.right, node.value)
+        return self._rebalance(node)
+
+    def height(self, node: Optional[TreeNode] = None) -> int:
+        """
+        Высота дерева/поддерева из поля height.
+
+        Сложность: O(1)
+
+        Args:
+            node: Узел для вычисления высоты (корень поддерева)
+
+        Returns:
+            Высота дерева/поддерева
+        """
+        return _node_height(node if node is not None else self.root)
+
+
+def _is_red(node: Optional[TreeNode]) -> bool:
+    """Цвет узла (пустой узел - черный)."""
+    return node is not None and node.red
+
+
+class RedBlackTree(BinarySearchTree):
+    """
+    Левостороннее красно-черное дерево (LLRB, Седжвик).
+
+    Красные ссылки только левые и не идут подряд, на всех путях
+    от корня до пустых узлов одинаковое число черных узлов - высота
+    не превышает 2 log2(n). Балансировка выполняется поворотами
+    и перекрашиванием на обратном ходе рекурсии.
+    """
+
+    @staticmethod
+    def _rotate_left(node: TreeNode) -> TreeNode:
+        """Левый поворот: правая красная ссылка становится левой."""
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        pivot.red = node.red
+        node.red = True
+        pivot.size = node.size
+        node.size = 1 + _node_size(node.left) + _node_size(node.right)
+        return pivot
+
+    @staticmethod
+    def _rotate_right(node: TreeNode) -> TreeNode:
+        """Правый поворот: левая красная ссылка становится правой."""
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        pivot.red = node.red
+        node.red = True
+        pivot.size = node.size
+        node.size = 1 + _node_size(node.left) + _node_size(node.right)
+        return pivot
+
+    def _build(self, values: List[int]) -> Optional[TreeNode]:
+        """
+        Построение дерева последовательными вставками.
+
+        Раскраска дерева из середин отрезков не всегда удовлетворяет
+        левостороннему варианту, поэтому здесь построение - O(n log n).
+
+        Args:
+            values: Строго возрастающие значения
+
+        Returns:
+            Корень построенного дерева
+        """
+        self.root = None
+        for value in values:
+            self.insert(value)
+        return self.root
+
+    @staticmethod
+    def _flip_colors(node: TreeNode) -> None:
+        """Перекрашивание узла и его детей."""
+        node.red = not node.red
+        node.left.red = not node.left.red
+        node.right.red = not node.right.red
+
+    def _fix_up(self, node: TreeNode) -> TreeNode:
+        """Восстановление инвариантов LLRB на обратном ходе."""
+        if _is_red(node.right) and not _is_red(node.left):
+            node = self._rotate_left(node)
+        if _is_red(node.left) and _is_red(node.left.left):
+            node = self._rotate_right(node)
+        if _is_red(node.left) and _is_red(node.right):
+            self._flip_colors(node)
+        node.size = 1 + _node_size(node.left) + _node_size(node.right)
+        return node
+
+    def _move_red_left(self, node: TreeNode) -> TreeNode:
+        """Заимствование красной ссылки для спуска влево."""
+        self._flip_colors(node)
+        if _is_red(node.right.left):
+            node.right = self._rotate_right(node.right)
+            node = self._rotate_left(node)
+            self._flip_colors(node)
+        return node
+
+    def _move_red_right(self, node: TreeNode) -> TreeNode:
+        """Заимствование красной ссылки для спуска вправо."""
+        self._flip_colors(node)
+        if _is_red(node.left.left):
+            node = self._rotate_right(node)
+            self._flip_colors(node)
+        return node
+
+    def insert(self, value: int) -> None:
+        """
+        Вставка значения с балансировкой.
+
+        Сложность: O(log n)
+
+        Args:
+            value: Значение для вставки
+        """
+        self.root = self._insert(self.root, value)
+        self.root.red = False
+
+    def _insert(self, node: Optional[TreeNode], value: int) -> TreeNode:
+        """
+        Рекурсивная вставка (глубина рекурсии - O(log n)).
+
+        Returns:
+            Новый корень поддерева
+        """
+        if node is None:
+            return TreeNode(value)
+
+        if value < node.value:
+            node.left = self._insert(node.left, value)
+        elif value > node.value:
+            node.right = self._insert(node.right, value)
+        else:
+            return node
+        return self._fix_up(node)
+
+    def delete(self, value: int) -> None:
+        """
+        Удаление значения с балансировкой.
+
+        Сложность: O(log n)
+
+        Args:
+            value: Значение для удаления
+        """
+        if not self.search(value):
+            return
+
+        root = self.root
+        if not _is_red(root.left) and not _is_red(root.right):
+            root.red = True
+        self.root = self._delete(root, value)
+        if self.root is not None:
+            self.root.red = False
+
+    def _delete_min(self, node: TreeNode) -> Optional[TreeNode]:
+        """Удаление минимального узла поддерева."""
+        if node.left is None:
+            return None
+        if not _is_red(node.left) and not _is_red(node.left.left):
+            node = self._move_red_left(node)
+        node.left = self._delete_min(node.left)
+        return self._fix_up(node)
+
+    def _delete(self, node: TreeNode, value: int) -> Optional[TreeNode]:
+        """
+        Рекурсивное удаление значения, которое есть в поддереве.
+
+        На спуске в узел, куда идет поиск, заранее переносится красная
+        ссылка, поэтому удаляемый узел оказывается красным листом.
+
+        Returns:
+            Новый корень поддерева
+        """
+        if value < node.value:
+            if not _is_red(node.left) and not _is_red(node.left.left):
+                node = self._move_red_left(node)
+            node.left = self._delete(node.left, value)
+        else:
+            if _is_red(node.left):
+                node = self._rotate_right(node)
+            if value == node.value and node.right is None:
+                return None
+            if not _is_red(node.right) and not _is_red(node.right.left):
+                node = self._move_red_right(node)
+            if value == node.value:
+                node.value = self._find_min(node.right).value
+                node.right = self._delete_min(node.right)
+            else:
+                node.right = self._delete(node.right, value)
+        return self._fix_up(node)
@@ -1,5 +1,7 @@
 from analysis import (
     analyze_performance,
+    measure_memory_usage,
+    measure_order_statistics,
     plot_results,
     system_info,
 )
@@ -71,6 +73,12 @@ def main():
     results = analyze_performance()
     plot_results(results)
 
+    print('\nПамять на узел')
+    measure_memory_usage()
+
+    print('\nПорядковые запросы')
+    measure_order_statistics()
+
     print('\nВыводы:')
     print('1. Сбалансированные деревья показывают производительность '
           'O(log n) для поиска и удаления')
@@ -80,6 +88,8 @@ def main():
           'дерева')
     print('4. Итеративный обход обычно быстрее рекурсивных из-за '
           'отсутствия накладных расходов на вызовы функций')
+    print('5. АВЛ и красно-черное деревья сохраняют высоту O(log n) '
+          'даже при вставке отсортированных значений')
 
 
 if __name__ == '__main__':
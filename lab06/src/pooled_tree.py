@@ -0,0 +1,353 @@
+"""Модуль бинарного дерева поиска на массивах (пул узлов)."""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import Iterable, List, Optional
+
+# Индекс отсутствующего узла
+NIL = -1
+
+
+class PooledBinarySearchTree:
+    """
+    Бинарное дерево поиска, узлы которого хранятся в пуле -
+    параллельных массивах значений и индексов левого и правого детей.
+
+    Вместо объекта на узел - 16 байт в трех непрерывных массивах
+    (значение int64 и два индекса int32), поэтому дерево занимает
+    в несколько раз меньше памяти, а обходы идут по плотным массивам.
+    Освобожденные при удалении ячейки связываются в список свободных
+    (через массив левых детей) и переиспользуются при вставке.
+
+    Значения - целые числа в пределах int64.
+    """
+
+    def __init__(self) -> None:
+        """Инициализация пустого дерева."""
+        self._values = array('q')
+        self._left = array('i')
+        self._right = array('i')
+        self._free = NIL
+        self.root = NIL
+        self.count = 0
+
+    @classmethod
+    def from_sorted(cls, values: Iterable[int]) -> PooledBinarySearchTree:
+        """
+        Построение идеально сбалансированного дерева из возрастающих
+        значений. Узел i пула хранит i-е значение, поэтому in-order
+        обход идет по массиву подряд.
+
+        Сложность: O(n)
+
+        Args:
+            values: Строго возрастающие значения
+
+        Returns:
+            Дерево минимальной высоты
+        """
+        tree = cls()
+        tree._values = array('q', values)
+        count = len(tree._values)
+        for i in range(1, count):
+            if not tree._values[i - 1] < tree._values[i]:
+                raise ValueError('Значения должны строго возрастать')
+
+        tree._left = array('i', [NIL]) * count
+        tree._right = array('i', [NIL]) * count
+        tree.count = count
+
+        def build(lo: int, hi: int) -> int:
+            if lo >= hi:
+                return NIL
+            mid = (lo + hi) // 2
+            tree._left[mid] = build(lo, mid)
+            tree._right[mid] = build(mid + 1, hi)
+            return mid
+
+        tree.root = build(0, count)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[int]) -> PooledBinarySearchTree:
+        """
+        Построение сбалансированного дерева из произвольных значений.
+
+        Сложность: O(n log n)
+
+        Args:
+            values: Значения в любом порядке
+
+        Returns:
+            Дерево минимальной высоты
+        """
+        return cls.from_sorted(sorted(set(values)))
+
+    def rebalance(self) -> None:
+        """
+        Перестройка в идеально сбалансированное дерево; заодно пул
+        уплотняется и список свободных ячеек очищается.
+
+        Сложность: O(n)
+        """
+        rebuilt = self.from_sorted(self.inorder())
+        self._values = rebuilt._values
+        self._left = rebuilt._left
+        self._right = rebuilt._right
+        self._free = NIL
+        self.root = rebuilt.root
+
+    def _allocate(self, value: int) -> int:
+        """
+        Выделение ячейки пула под новый узел.
+
+        Args:
+            value: Значение узла
+
+        Returns:
+            Индекс узла
+        """
+        index = self._free
+        if index == NIL:
+            index = len(self._values)
+            self._values.append(value)
+            self._left.append(NIL)
+            self._right.append(NIL)
+        else:
+            self._free = self._left[index]
+            self._values[index] = value
+            self._left[index] = NIL
+            self._right[index] = NIL
+        self.count += 1
+        return index
+
+    def _release(self, index: int) -> None:
+        """Возврат ячейки в список свободных."""
+        self._left[index] = self._free
+        self._right[index] = NIL
+        self._free = index
+        self.count -= 1
+
+    def insert(self, value: int) -> None:
+        """
+        Вставка значения в дерево.
+
+        Сложность:
+            В среднем: O(log n)
+            В худшем случае: O(n) - для вырожденного дерева
+
+        Args:
+            value: Значение для вставки
+        """
+        if self.root == NIL:
+            self.root = self._allocate(value)
+            return
+
+        values, left, right = self._values, self._left, self._right
+        current = self.root
+        while True:
+            current_value = values[current]
+            if value < current_value:
+                if left[current] == NIL:
+                    left[current] = self._allocate(value)
+                    return
+                current = left[current]
+            elif value > current_value:
+                if right[current] == NIL:
+                    right[current] = self._allocate(value)
+                    return
+                current = right[current]
+            else:
+                return
+
+    def _find(self, value: int) -> int:
+        """Индекс узла со значением или NIL."""
+        values, left, right = self._values, self._left, self._right
+        current = self.root
+        while current != NIL:
+            current_value = values[current]
+            if value == current_value:
+                return current
+            if value < current_value:
+                current = left[current]
+            else:
+                current = right[current]
+        return NIL
+
+    def search(self, value: int) -> bool:
+        """
+        Поиск значения в дереве.
+
+        Сложность:
+            В среднем: O(log n)
+            В худшем случае: O(n) - для вырожденного дерева
+
+        Args:
+            value: Значение для поиска
+
+        Returns:
+            True, если значение найдено, иначе False
+        """
+        return self._find(value) != NIL
+
+    def delete(self, value: int) -> None:
+        """
+        Удаление значения из дерева.
+
+        Итеративное удаление с запоминанием родителя; узел с двумя
+        детьми заменяется преемником перестановкой индексов, ячейка
+        удаленного узла уходит в список свободных.
+
+        Сложность:
+            В среднем: O(log n)
+            В худшем случае: O(n) - для вырожденного дерева
+
+        Args:
+            value: Значение для удаления
+        """
+        values, left, right = self._values, self._left, self._right
+        parent = NIL
+        node = self.root
+        while node != NIL and values[node] != value:
+            parent = node
+            node = left[node] if value < values[node] else right[node]
+
+        if node == NIL:
+            return
+
+        if left[node] == NIL:
+            replacement = right[node]
+        elif right[node] == NIL:
+            replacement = left[node]
+        else:
+            successor_parent = node
+            replacement = right[node]
+            while left[replacement] != NIL:
+                successor_parent = replacement
+                replacement = left[replacement]
+
+            if successor_parent != node:
+                left[successor_parent] = right[replacement]
+                right[replacement] = right[node]
+            left[replacement] = left[node]
+
+        if parent == NIL:
+            self.root = replacement
+        elif left[parent] == node:
+            left[parent] = replacement
+        else:
+            right[parent] = replacement
+        self._release(node)
+
+    def find_min(self) -> Optional[int]:
+        """
+        Минимальное значение дерева.
+
+        Сложность:
+            В среднем: O(log n)
+            В худшем случае: O(n) - для вырожденного дерева
+
+        Returns:
+            Минимальное значение или None для пустого дерева
+        """
+        node = self.root
+        if node == NIL:
+            return None
+        while self._left[node] != NIL:
+            node = self._left[node]
+        return self._values[node]
+
+    def find_max(self) -> Optional[int]:
+        """
+        Максимальное значение дерева.
+
+        Сложность:
+            В среднем: O(log n)
+            В худшем случае: O(n) - для вырожденного дерева
+
+        Returns:
+            Максимальное значение или None для пустого дерева
+        """
+        node = self.root
+        if node == NIL:
+            return None
+        while self._right[node] != NIL:
+            node = self._right[node]
+        return self._values[node]
+
+    def height(self) -> int:
+        """
+        Вычисление высоты дерева.
+
+        Сложность: O(n) - необходимо посетить все узлы
+
+        Returns:
+            Высота дерева
+        """
+        if self.root == NIL:
+            return 0
+
+        left, right = self._left, self._right
+        stack = [(self.root, 1)]
+        max_height = 0
+        while stack:
+            node, level = stack.pop()
+            if level > max_height:
+                max_height = level
+            if left[node] != NIL:
+                stack.append((left[node], level + 1))
+            if right[node] != NIL:
+                stack.append((right[node], level + 1))
+        return max_height
+
+    def inorder(self) -> List[int]:
+        """
+        Итеративный in-order обход.
+
+        Сложность: O(n)
+
+        Returns:
+            Список значений в порядке in-order
+        """
+        values, left, right = self._values, self._left, self._right
+        result: List[int] = []
+        stack: List[int] = []
+        current = self.root
+
+        while current != NIL or stack:
+            while current != NIL:
+                stack.append(current)
+                current = left[current]
+            current = stack.pop()
+            result.append(values[current])
+            current = right[current]
+
+        return result
+
+    def is_valid_bst(self) -> bool:
+        """
+        Проверка, является ли дерево корректным BST.
+
+        Сложность: O(n) - необходимо посетить все узлы
+
+        Returns:
+            True, если дерево корректно, иначе False
+        """
+        result = self.inorder()
+        return all(result[i - 1] < result[i] for i in range(1, len(result)))
+
+    def memory_bytes(self) -> int:
+        """
+        Память под массивы пула (включая свободные ячейки и запас
+        массивов на рост).
+
+        Returns:
+            Размер в байтах
+        """
+        return (sys.getsizeof(self._values) + sys.getsizeof(self._left)
+                + sys.getsizeof(self._right))
+
+    def __len__(self) -> int:
+        return self.count
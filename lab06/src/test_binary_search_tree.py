@@ -0,0 +1,306 @@
+"""Unit-тесты для бинарных деревьев поиска."""
+
+import bisect
+import random
+import unittest
+from binary_search_tree import (AVLTree, BinarySearchTree, RedBlackTree,
+                                TreeNode)
+from pooled_tree import NIL, PooledBinarySearchTree
+from tree_traversal import inorder_iterative
+
+
+class TestBinarySearchTree(unittest.TestCase):
+    """Тесты для всех реализаций бинарного дерева поиска."""
+
+    TREE_CLASSES = (BinarySearchTree, AVLTree, RedBlackTree)
+
+    def _check_avl(self, node):
+        """Проверка баланса и поля height АВЛ-дерева; возвращает высоту."""
+        if node is None:
+            return 0
+        left = self._check_avl(node.left)
+        right = self._check_avl(node.right)
+        self.assertLessEqual(abs(left - right), 1)
+        self.assertEqual(node.height, 1 + max(left, right))
+        return node.height
+
+    def _check_llrb(self, node):
+        """Проверка инвариантов LLRB; возвращает черную высоту."""
+        if node is None:
+            return 1
+        self.assertFalse(node.right is not None and node.right.red)
+        if node.red:
+            self.assertFalse(node.left is not None and node.left.red)
+        left = self._check_llrb(node.left)
+        self.assertEqual(left, self._check_llrb(node.right))
+        return left + (0 if node.red else 1)
+
+    def _check_sizes(self, node):
+        """Проверка поля size во всех узлах; возвращает размер."""
+        if node is None:
+            return 0
+        size = 1 + self._check_sizes(node.left) + self._check_sizes(node.right)
+        self.assertEqual(node.size, size)
+        return size
+
+    def _check_tree(self, tree, expected):
+        """Сравнение дерева с отсортированным списком значений."""
+        self.assertEqual(inorder_iterative(tree.root), expected)
+        self.assertEqual(len(tree), len(expected))
+        if len(expected) < 5000:
+            self._check_sizes(tree.root)
+        self.assertTrue(tree.is_valid_bst())
+        if isinstance(tree, AVLTree):
+            self._check_avl(tree.root)
+        elif isinstance(tree, RedBlackTree):
+            self.assertFalse(tree.root is not None and tree.root.red)
+            self._check_llrb(tree.root)
+
+    def test_basic_operations(self):
+        """Тест вставки, поиска и удаления во всех деревьях."""
+        for tree_class in self.TREE_CLASSES:
+            tree = tree_class()
+            for value in [50, 30, 70, 20, 40, 60, 80, 30]:
+                tree.insert(value)
+            self._check_tree(tree, [20, 30, 40, 50, 60, 70, 80])
+
+            self.assertTrue(tree.search(60))
+            self.assertFalse(tree.search(65))
+            self.assertEqual(tree.find_min().value, 20)
+            self.assertEqual(tree.find_max().value, 80)
+
+            tree.delete(50)
+            tree.delete(65)
+            self._check_tree(tree, [20, 30, 40, 60, 70, 80])
+
+            for value in [20, 30, 40, 60, 70, 80]:
+                tree.delete(value)
+            self.assertIsNone(tree.root)
+
+    def test_balanced_invariants(self):
+        """Тест инвариантов AVL и LLRB при вставке и удалении."""
+        rng = random.Random(7)
+        for tree_class in (AVLTree, RedBlackTree):
+            # Возрастающая вставка вырождает обычное дерево
+            tree = tree_class()
+            for value in range(1024):
+                tree.insert(value)
+            self._check_tree(tree, list(range(1024)))
+            self.assertLessEqual(tree.height(), 20)
+
+            tree = tree_class()
+            expected = set()
+            for step in range(3000):
+                value = rng.randrange(500)
+                if rng.random() < 0.6:
+                    tree.insert(value)
+                    expected.add(value)
+                else:
+                    tree.delete(value)
+                    expected.discard(value)
+                if step % 100 == 0:
+                    self._check_tree(tree, sorted(expected))
+            self._check_tree(tree, sorted(expected))
+
+    def test_delete_successor_splice(self):
+        """Тест удаления узла с двумя детьми перестановкой преемника."""
+        tree = BinarySearchTree()
+        for value in [50, 30, 80, 60, 90, 70, 65]:
+            tree.insert(value)
+
+        # Преемник 60 - не правый ребенок: его правое поддерево
+        # подвешивается к родителю преемника
+        successor = tree.root.right.left
+        tree.delete(50)
+        self.assertIs(tree.root, successor)
+        self.assertEqual(tree.root.left.value, 30)
+        self.assertEqual(tree.root.right.left.value, 70)
+        self._check_tree(tree, [30, 60, 65, 70, 80, 90])
+
+        # Преемник 90 - правый ребенок удаляемого узла
+        successor = tree.root.right.right
+        tree.delete(80)
+        self.assertIs(tree.root.right, successor)
+        self._check_tree(tree, [30, 60, 65, 70, 90])
+
+        rng = random.Random(3)
+        values = list(range(300))
+        rng.shuffle(values)
+        for value in values:
+            tree.insert(value)
+        expected = set(values) | {30, 60, 65, 70, 90}
+        rng.shuffle(values)
+        for value in values[:200]:
+            tree.delete(value)
+            expected.discard(value)
+        self._check_tree(tree, sorted(expected))
+
+    def test_delete_deep_chain(self):
+        """Тест удаления в вырожденном дереве глубже лимита рекурсии."""
+        depth = 10000
+        tree = BinarySearchTree()
+        nodes = [TreeNode(value) for value in range(depth)]
+        for i, node in enumerate(nodes):
+            node.size = depth - i
+            if i + 1 < depth:
+                node.right = nodes[i + 1]
+        tree.root = nodes[0]
+
+        tree.delete(depth - 1)
+        tree.delete(depth // 2)
+        tree.delete(0)
+        tree.delete(depth)
+        expected = [value for value in range(1, depth - 1)
+                    if value != depth // 2]
+        self._check_tree(tree, expected)
+        self.assertEqual(tree.height(), depth - 3)
+
+    def test_bulk_loading(self):
+        """Тест построения из значений и перестройки дерева."""
+        for tree_class in self.TREE_CLASSES:
+            for count in [0, 1, 2, 7, 8, 1000]:
+                tree = tree_class.from_sorted(range(count))
+                self.assertIsInstance(tree, tree_class)
+                self._check_tree(tree, list(range(count)))
+                if tree_class is not RedBlackTree:
+                    self.assertEqual(tree.height(), count.bit_length())
+
+            rng = random.Random(5)
+            values = [rng.randrange(300) for _ in range(500)]
+            tree = tree_class.from_iterable(values)
+            self._check_tree(tree, sorted(set(values)))
+            tree.insert(1000)
+            tree.delete(values[0])
+            self._check_tree(tree, sorted(set(values) - {values[0]}
+                                          | {1000}))
+
+            with self.assertRaises(ValueError):
+                tree_class.from_sorted([1, 3, 3])
+            with self.assertRaises(ValueError):
+                tree_class.from_sorted([2, 1])
+
+        tree = BinarySearchTree()
+        for value in range(200):
+            tree.insert(value)
+        self.assertEqual(tree.height(), 200)
+        tree.rebalance()
+        self._check_tree(tree, list(range(200)))
+        self.assertEqual(tree.height(), 8)
+
+        for tree_class in (AVLTree, RedBlackTree):
+            tree = tree_class.from_iterable(range(0, 400, 2))
+            for value in range(0, 400, 3):
+                tree.delete(value)
+            tree.rebalance()
+            self._check_tree(tree, [value for value in range(0, 400, 2)
+                                    if value % 3])
+
+    def test_pooled_tree(self):
+        """Тест дерева на пуле узлов и переиспользования ячеек."""
+        self.assertFalse(hasattr(TreeNode(1), '__dict__'))
+
+        rng = random.Random(11)
+        pooled = PooledBinarySearchTree()
+        reference = BinarySearchTree()
+        expected = set()
+        for _ in range(300):
+            value = rng.randrange(1000)
+            pooled.insert(value)
+            reference.insert(value)
+            expected.add(value)
+        self.assertEqual(pooled.inorder(), sorted(expected))
+        self.assertEqual(pooled.height(), reference.height())
+        self.assertEqual(len(pooled), len(expected))
+
+        for _ in range(2000):
+            value = rng.randrange(1000)
+            if rng.random() < 0.5 and expected:
+                pool_size = len(pooled._values)
+                value = rng.choice(sorted(expected))
+                pooled.delete(value)
+                expected.discard(value)
+                self.assertEqual(len(pooled._values), pool_size)
+            else:
+                free = pooled._free
+                pool_size = len(pooled._values)
+                pooled.insert(value)
+                if value not in expected and free != NIL:
+                    # Новый узел занимает освобожденную ячейку
+                    self.assertEqual(len(pooled._values), pool_size)
+                    self.assertEqual(pooled._values[free], value)
+                expected.add(value)
+            self.assertEqual(len(pooled), len(expected))
+        self.assertEqual(pooled.inorder(), sorted(expected))
+        self.assertTrue(pooled.is_valid_bst())
+        for value in range(1000):
+            self.assertEqual(pooled.search(value), value in expected)
+        self.assertEqual(pooled.find_min(), min(expected))
+        self.assertEqual(pooled.find_max(), max(expected))
+
+        pooled.rebalance()
+        self.assertEqual(pooled.inorder(), sorted(expected))
+        self.assertEqual(len(pooled._values), len(expected))
+        self.assertEqual(pooled._free, NIL)
+        self.assertEqual(pooled.height(), len(expected).bit_length())
+
+        tree = PooledBinarySearchTree.from_iterable([5, 1, 5, 3])
+        self.assertEqual(tree.inorder(), [1, 3, 5])
+        with self.assertRaises(ValueError):
+            PooledBinarySearchTree.from_sorted([1, 1])
+        for value in [1, 3, 5]:
+            tree.delete(value)
+        self.assertEqual(tree.root, NIL)
+        self.assertIsNone(tree.find_min())
+        self.assertEqual(len(tree), 0)
+
+    def test_order_statistics(self):
+        """Тест select, rank, count_range и range_iter."""
+        rng = random.Random(13)
+        for tree_class in self.TREE_CLASSES:
+            tree = tree_class()
+            expected = set()
+            for step in range(1500):
+                value = rng.randrange(400)
+                if rng.random() < 0.65:
+                    tree.insert(value)
+                    expected.add(value)
+                else:
+                    tree.delete(value)
+                    expected.discard(value)
+
+                if step % 300 == 0:
+                    ordered = sorted(expected)
+                    self._check_tree(tree, ordered)
+                    for k, value in enumerate(ordered):
+                        self.assertEqual(tree.select(k), value)
+                    for value in range(-1, 402):
+                        self.assertEqual(tree.rank(value),
+                                         bisect.bisect_left(ordered, value))
+                    for _ in range(50):
+                        lo = rng.randrange(-10, 410)
+                        hi = rng.randrange(-10, 410)
+                        inside = ordered[bisect.bisect_left(ordered, lo):
+                                         bisect.bisect_right(ordered, hi)]
+                        self.assertEqual(tree.count_range(lo, hi),
+                                         len(inside))
+                        self.assertEqual(list(tree.range_iter(lo, hi)),
+                                         inside)
+
+            with self.assertRaises(IndexError):
+                tree.select(len(tree))
+            with self.assertRaises(IndexError):
+                tree.select(-1)
+
+            tree = tree_class.from_sorted(range(0, 100, 5))
+            self.assertEqual(tree.count_range(10, 30), 5)
+            self.assertEqual(tree.count_range(30, 10), 0)
+            self.assertEqual(tree.rank(tree.select(7)), 7)
+
+            # Обход ленивый: первое значение выдается без полного прохода
+            scan = tree.range_iter(12, 1000)
+            self.assertEqual(next(scan), 15)
+            self.assertEqual(list(scan)[-1], 95)
+
+
+if __name__ == '__main__':
+    unittest.main()